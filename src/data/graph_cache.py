@@ -0,0 +1,87 @@
+import hashlib
+import os
+
+import numpy as np
+
+CACHE_DIRECTORY = '.graph_cache'
+
+_SOURCE_HASH = 'source_hash'
+_SOURCE_STAT = 'source_stat'
+
+
+def _file_hash(path):
+    file_hash = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _file_stat(path):
+    stat = os.stat(path)
+    return np.array([stat.st_mtime_ns, stat.st_size], dtype=np.int64)
+
+
+class GraphCache:
+    """
+    Parsed workflow files stored as NumPy arrays in .npz files, so each workflow file is parsed only once. Each entry
+    keeps the modification time, size and hash of the file it was parsed from. The file is only hashed when its
+    modification time or size changed, and it is parsed again when its content changed.
+
+    The entries of all the workflow files are stored in the directory given by path, named after the full path of each
+    file, so files with the same name in different directories have different entries. The readers use a directory
+    next to the workflow files by default (see CACHE_DIRECTORY), and accept another one, e.g. when the resources are
+    read-only or shared.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: directory of the cache entries, created when the first entry is stored
+        """
+        self.path = path
+
+    def load(self, task_file, parse):
+        """
+        :param parse: function that parses the task file into a dict of NumPy arrays
+        :return: the dict of arrays, from the cache if the task file did not change since it was cached
+        """
+        source_stat = _file_stat(task_file)
+        source_hash = None
+        cache_file = self._cache_file(task_file)
+
+        if os.path.exists(cache_file):
+            with np.load(cache_file, allow_pickle=False) as cached:
+                arrays = {key: cached[key] for key in cached.files if key not in (_SOURCE_HASH, _SOURCE_STAT)}
+                if np.array_equal(cached[_SOURCE_STAT], source_stat):
+                    return arrays
+
+                # The file was touched or copied, the entry is still valid if the content is the same
+                source_hash = _file_hash(task_file)
+                if str(cached[_SOURCE_HASH]) != source_hash:
+                    arrays = None
+
+            if arrays is not None:
+                self._save(cache_file, source_stat, source_hash, arrays)
+                return arrays
+
+        arrays = parse(task_file)
+        self._save(cache_file, source_stat, source_hash or _file_hash(task_file), arrays)
+
+        return arrays
+
+    def remove(self, task_file):
+        cache_file = self._cache_file(task_file)
+        if os.path.exists(cache_file):
+            os.remove(cache_file)
+
+    def _save(self, cache_file, source_stat, source_hash, arrays):
+        # Write to a temporary file first, so parallel readers never see a partially written entry
+        os.makedirs(self.path, exist_ok=True)
+        temp_file = f'{cache_file}.{os.getpid()}.tmp.npz'
+        np.savez(temp_file, **{_SOURCE_HASH: np.array(source_hash), _SOURCE_STAT: source_stat}, **arrays)
+        os.replace(temp_file, cache_file)
+
+    def _cache_file(self, task_file):
+        task_file = os.path.abspath(task_file)
+        path_hash = hashlib.sha256(task_file.encode()).hexdigest()[:16]
+        return os.path.join(self.path, f'{os.path.basename(task_file)}.{path_hash}.npz')
@@ -0,0 +1,132 @@
+import json
+import re
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER_CHARS = re.compile(r'[0-9.eE+-]*')
+
+
+class JsonStream:
+    """
+    Reads a JSON document from a text file incrementally. Objects and arrays are traversed with iter_object and
+    iter_array, and only the values read with read_value are decoded, so the memory used depends on the size of those
+    values and not on the size of the document.
+
+    The value of each key or array element must be consumed (read_value, skip_value, iter_object or iter_array) before
+    moving to the next one.
+    """
+
+    def __init__(self, f, chunk_size=1 << 16):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.eof = False
+
+    def read_value(self):
+        self._peek()
+        read_size = self.chunk_size
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                # A number that reaches the end of the buffer may continue in the file, e.g. 12 of 12.5
+                if self.eof or _NUMBER_CHARS.match(self.buffer, end).end() < len(self.buffer):
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+
+            self._read_more(read_size)
+            read_size *= 2
+
+    def skip_value(self):
+        char = self._peek()
+        if char == '{':
+            for _ in self.iter_object():
+                self.skip_value()
+        elif char == '[':
+            for _ in self.iter_array():
+                self.skip_value()
+        else:
+            self.read_value()
+
+    def iter_object(self):
+        """
+        :return: generator of the keys of the object
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self.position += 1
+            return
+
+        while True:
+            key = self.read_value()
+            self._expect(':')
+            yield key
+
+            if self._peek() == ',':
+                self.position += 1
+            else:
+                self._expect('}')
+                return
+
+    def iter_array(self):
+        """
+        :return: generator of the indices of the array elements
+        """
+        self._expect('[')
+        if self._peek() == ']':
+            self.position += 1
+            return
+
+        i = 0
+        while True:
+            yield i
+            i += 1
+
+            if self._peek() == ',':
+                self.position += 1
+            else:
+                self._expect(']')
+                return
+
+    def iter_items(self, paths):
+        """
+        :param paths: key tuples of the arrays to read, e.g. ('workflow', 'execution', 'tasks')
+        :return: generator of (path, item) with the items of those arrays, in the order they are in the document. The
+        rest of the document is skipped.
+        """
+        return self._iter_items(paths, ())
+
+    def _iter_items(self, paths, path):
+        if path in paths:
+            for _ in self.iter_array():
+                yield path, self.read_value()
+        elif self._peek() == '{' and any(p[:len(path)] == path for p in paths):
+            for key in self.iter_object():
+                yield from self._iter_items(paths, path + (key,))
+        else:
+            self.skip_value()
+
+    def _peek(self):
+        while True:
+            self.position = _WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if self.eof:
+                raise Exception('Unexpected end of JSON document')
+            self._read_more(self.chunk_size)
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise Exception(f"Expected '{char}' in JSON document, found '{self.buffer[self.position]}'")
+        self.position += 1
+
+    def _read_more(self, size):
+        chunk = self.f.read(size)
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
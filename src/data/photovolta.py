@@ -1,52 +1,94 @@
+import os
 from _csv import reader
 from statistics import median
 
+import numpy as np
 
-def _get_green_power_from(source_file, size=1):
+from src.scheduling.model.power_series import PowerSeries
+
+TRACE_INTERVAL_LENGTH = 300  # Seconds between two samples of the traces
+
+CACHE_DIRECTORY = '.trace_cache'
+
+TRACE_FILES = {
+    1: 'photovolta_2016_part_1_0_and_1_1.csv',
+    2: 'photovolta_2016_part_1_2_and_1_3.csv',
+    3: 'photovolta_2016_part_2_0_and_2_1.csv',
+    4: 'photovolta_2016_part_1_7_and_1_8.csv',
+    5: 'photovolta_2016_part_2_4_and_2_5.csv',
+}
+
+
+def _read_irradiance(source_file):
 
     with open(source_file, 'r') as file:
         csv_reader = reader(file)
 
-        powers = []
+        irradiance = []
         for line, row in enumerate(csv_reader):
             if line == 0:
                 continue  # skip header
-            energy_usage = float(row[2]) * size
-            energy_usage = int(energy_usage)
-            powers.append(energy_usage)
+            irradiance.append(float(row[2]))
+
+        return np.array(irradiance, dtype=np.float64)
+
+
+def _resample(irradiance, interval_length):
+    """
+    :return: the mean irradiance of each interval of interval_length seconds. The last interval is dropped if the trace
+    does not cover it completely.
+    """
+    if interval_length == TRACE_INTERVAL_LENGTH:
+        return irradiance
+
+    # The trace is constant in each sample, so its integral is linear between samples
+    energy = np.concatenate(([0.0], np.cumsum(irradiance * TRACE_INTERVAL_LENGTH)))
+    times = np.arange(len(energy)) * TRACE_INTERVAL_LENGTH
+
+    count = int(times[-1] // interval_length)
+    bounds = np.arange(count + 1) * interval_length
+    # Round away the floating point error of the integral, so a constant interval keeps its exact value
+    return np.round(np.diff(np.interp(bounds, times, energy)) / interval_length, 9)
 
-        return powers
+
+def _scale(irradiance, size):
+    return (irradiance * size).astype(np.int64).tolist()
 
 
 class PhotovoltaReader:
 
-    def __init__(self, resource_path):
+    def __init__(self, resource_path, use_cache=True):
+        """
+        :param use_cache: if True, each trace is parsed once and stored as a .npy file next to it, which is
+        memory-mapped when the trace is used again
+        """
         self.resource_path = resource_path
+        self.use_cache = use_cache
+        self._traces = {}
 
     def get_trace_1(self, size=1):
-        file = 'photovolta_2016_part_1_0_and_1_1.csv'
-        path = f'{self.resource_path}/photovolta/{file}'
-        return _get_green_power_from(path, size=size)
+        return _scale(self._load(1), size)
 
     def get_trace_2(self, size=20):
-        file = 'photovolta_2016_part_1_2_and_1_3.csv'
-        path = f'{self.resource_path}/photovolta/{file}'
-        return _get_green_power_from(path, size=size)
+        return _scale(self._load(2), size)
 
     def get_trace_3(self, size=20):
-        file = 'photovolta_2016_part_2_0_and_2_1.csv'
-        path = f'{self.resource_path}/photovolta/{file}'
-        return _get_green_power_from(path, size=size)
+        return _scale(self._load(3), size)
 
     def get_trace_4(self, size=20):
-        file = 'photovolta_2016_part_1_7_and_1_8.csv'
-        path = f'{self.resource_path}/photovolta/{file}'
-        return _get_green_power_from(path, size=size)
+        return _scale(self._load(4), size)
 
     def get_trace_5(self, size=20):
-        file = 'photovolta_2016_part_2_4_and_2_5.csv'
-        path = f'{self.resource_path}/photovolta/{file}'
-        return _get_green_power_from(path, size=size)
+        return _scale(self._load(5), size)
+
+    def get_power_series(self, trace, size=1, interval_length=TRACE_INTERVAL_LENGTH, id=None):
+        """
+        :param trace: number of the trace, from 1 to 5
+        :param interval_length: length of the intervals of the power series, in seconds. The power of each interval
+        is the mean power of the trace in it.
+        """
+        irradiance = _resample(self._load(trace), interval_length)
+        return PowerSeries(id if id is not None else f'trace-{trace}', _scale(irradiance, size), interval_length)
 
     def stats(self, power_trace):
         total_power = 0
@@ -56,3 +98,30 @@ class PhotovoltaReader:
         average_power = float(total_power) / len(power_trace)
 
         return average_power, median(power_trace)
+
+    def _load(self, trace):
+        if trace not in TRACE_FILES:
+            raise Exception(f"Photovolta trace '{trace}' invalid")
+
+        if trace not in self._traces:
+            self._traces[trace] = self._read(f'{self.resource_path}/photovolta/{TRACE_FILES[trace]}')
+        return self._traces[trace]
+
+    def _read(self, source_file):
+        if not self.use_cache:
+            return _read_irradiance(source_file)
+
+        cache_path = os.path.join(os.path.dirname(source_file), CACHE_DIRECTORY)
+        cache_file = os.path.join(cache_path, os.path.basename(source_file) + '.npy')
+
+        if os.path.exists(cache_file) and os.path.getmtime(cache_file) >= os.path.getmtime(source_file):
+            return np.load(cache_file, mmap_mode='r')
+
+        irradiance = _read_irradiance(source_file)
+
+        os.makedirs(cache_path, exist_ok=True)
+        temp_file = f'{cache_file}.{os.getpid()}.tmp.npy'
+        np.save(temp_file, irradiance)
+        os.replace(temp_file, cache_file)
+
+        return irradiance
@@ -2,103 +2,143 @@ import json
 import os
 import pathlib
 
+import numpy as np
 from wfcommons import WorkflowGenerator, SrasearchRecipe, MontageRecipe, SeismologyRecipe, BlastRecipe, BwaRecipe, \
     CyclesRecipe, GenomeRecipe, SoykbRecipe
 
+from src.data.graph_cache import GraphCache, CACHE_DIRECTORY
+from src.data.json_stream import JsonStream
 from src.scheduling.model.task_graph import TaskGraph
 
 
-def _create_graph_from_real_trace(task_file, random_power):
+def _parse_real_trace(task_file):
     with open(task_file) as f:
         data = json.load(f)
 
-        graph = TaskGraph()
+    tasks_execution = data['workflow']['execution']['tasks']
+    tasks_specification = data['workflow']['specification']['tasks']
 
-        start_task_id = '0'
-        graph.add_new_task(start_task_id, runtime=1, power=0)  # Dummy task
-        graph.set_start_task(start_task_id)
+    tasks = [
+        (task['id'], round(float(task['runtimeInSeconds'])), task['command']['program'])
+        for task in tasks_execution
+    ]
+    dependencies = [(task['name'], len(task['parents']) == 0, task['children']) for task in tasks_specification]
 
-        task_runtimes = {}
+    return _to_arrays(tasks, dependencies)
 
-        tasks_execution = data['workflow']['execution']['tasks']
-        for task in tasks_execution:
-            runtime_is_seconds = round(float(task['runtimeInSeconds']))
-            task_name = task['id']
-            task_runtimes[task_name] = runtime_is_seconds
 
-        tasks_specification = data['workflow']['specification']['tasks']
-        tasks = data['workflow']['execution']['tasks']
+def _parse_real_trace_streaming(task_file):
+    """
+    Same result as _parse_real_trace, but the tasks are read one by one instead of loading the whole document.
+    """
+    execution_tasks = ('workflow', 'execution', 'tasks')
+    specification_tasks = ('workflow', 'specification', 'tasks')
 
-        powers_task_category = {}
+    tasks = []
+    dependencies = []
+    with open(task_file) as f:
+        for path, task in JsonStream(f).iter_items([execution_tasks, specification_tasks]):
+            if path == execution_tasks:
+                tasks.append((task['id'], round(float(task['runtimeInSeconds'])), task['command']['program']))
+            else:
+                dependencies.append((task['name'], len(task['parents']) == 0, task['children']))
 
-        for task in tasks:
-            runtime_is_seconds = task_runtimes[task['id']]
-            if runtime_is_seconds == 0: # TODO
-                runtime_is_seconds = 1
+    return _to_arrays(tasks, dependencies)
 
-            task_category = task['command']['program']
-            if task_category not in powers_task_category:
-                power = random_power()
-                powers_task_category[task_category] = power
-            else:
-                power = powers_task_category[task_category]
 
-            graph.add_new_task(task['id'], runtime=runtime_is_seconds, power=power)
+def _parse(task_file):
+    with open(task_file) as f:
+        data = json.load(f)
 
-        for task in tasks_specification:
-            current_task_name = task['name']
-            parents = task['parents']
-            children = task['children']
+    tasks = data['workflow']['tasks']
 
-            if len(parents) == 0:
-                graph.create_dependency(start_task_id, current_task_name)
+    return _to_arrays(
+        [(task['name'], round(float(task['runtimeInSeconds'])), task['category']) for task in tasks],
+        [(task['name'], len(task['parents']) == 0, task['children']) for task in tasks]
+    )
 
-            for child in children:
-                graph.create_dependency(current_task_name, child)
 
-        return graph
+def _to_arrays(tasks, dependencies):
+    """
+    :param tasks: list of (name, runtime in seconds, category), in the order they are added to the graph
+    :param dependencies: list of (name, without parents, children), in the order their dependencies are created
+    :return: dict of NumPy arrays, which can be stored in a GraphCache. Tasks are referenced by their position.
+    """
+    index = {name: i for i, (name, _, _) in enumerate(tasks)}
+    category_codes = {}
 
+    children_offsets = [0]
+    children = []
+    for _, _, task_children in dependencies:
+        children.extend(index[child] for child in task_children)
+        children_offsets.append(len(children))
 
-def _create_graph(task_file, random_power):
-    with open(task_file) as f:
-        data = json.load(f)
+    return {
+        'names': np.array([name for name, _, _ in tasks], dtype=str),
+        'runtimes': np.array([runtime for _, runtime, _ in tasks], dtype=np.int64),
+        'categories': np.array(
+            [category_codes.setdefault(category, len(category_codes)) for _, _, category in tasks], dtype=np.int64
+        ),
+        'dependency_tasks': np.array([index[name] for name, _, _ in dependencies], dtype=np.int64),
+        'without_parents': np.array([without_parents for _, without_parents, _ in dependencies], dtype=bool),
+        'children_offsets': np.array(children_offsets, dtype=np.int64),
+        'children': np.array(children, dtype=np.int64),
+    }
 
-        graph = TaskGraph()
 
-        start_task_id = '0'
-        graph.add_new_task(start_task_id, runtime=1, power=0)  # Dummy task
-        graph.set_start_task(start_task_id)
+def _create_graph_from_arrays(arrays, random_power):
+    graph = TaskGraph()
 
-        tasks = data['workflow']['tasks']
+    start_task_id = '0'
+    graph.add_new_task(start_task_id, runtime=1, power=0)  # Dummy task
+    graph.set_start_task(start_task_id)
 
-        powers_task_category = {}
+    names = arrays['names'].tolist()
+    powers_task_category = {}
 
-        for task in tasks:
-            runtime_is_seconds = round(float(task['runtimeInSeconds']))
-            if runtime_is_seconds == 0: # TODO
-                runtime_is_seconds = 1
+    for name, runtime_is_seconds, task_category in zip(names, arrays['runtimes'].tolist(),
+                                                       arrays['categories'].tolist()):
+        if runtime_is_seconds == 0: # TODO
+            runtime_is_seconds = 1
 
-            task_category = task['category']
-            if task_category not in powers_task_category:
-                power = random_power()
-                powers_task_category[task_category] = power
-            else:
-                power = powers_task_category[task_category]
+        if task_category not in powers_task_category:
+            powers_task_category[task_category] = random_power()
+        power = powers_task_category[task_category]
+
+        graph.add_new_task(name, runtime=runtime_is_seconds, power=power)
 
-            graph.add_new_task(task['name'], runtime=runtime_is_seconds, power=power)
+    children_offsets = arrays['children_offsets'].tolist()
+    children = arrays['children'].tolist()
+    without_parents = arrays['without_parents'].tolist()
 
-        for task in tasks:
-            current_task_name = task['name']
-            parents = task['parents']
-            children = task['children']
+    for i, task_index in enumerate(arrays['dependency_tasks'].tolist()):
+        current_task_name = names[task_index]
 
-            if len(parents) == 0:
-                graph.create_dependency(start_task_id, current_task_name)
+        if without_parents[i]:
+            graph.create_dependency(start_task_id, current_task_name)
+
+        for child in children[children_offsets[i]:children_offsets[i + 1]]:
+            graph.create_dependency(current_task_name, names[child])
+
+    graph.compact()
+    return graph
+
+
+def _create_graph_from_real_trace(task_file, random_power, cache=None, streaming=False):
+    parse = _parse_real_trace_streaming if streaming else _parse_real_trace
+    arrays = cache.load(task_file, parse) if cache is not None else parse(task_file)
+    return _create_graph_from_arrays(arrays, random_power)
+
+
+def _create_cache(workflows_path, cache_path):
+    return GraphCache(cache_path if cache_path is not None else os.path.join(workflows_path, CACHE_DIRECTORY))
+
+
+def _create_graph(task_file, random_power, cache=None):
+    arrays = cache.load(task_file, _parse) if cache is not None else _parse(task_file)
+    return _create_graph_from_arrays(arrays, random_power)
 
-            for child in children:
-                graph.create_dependency(current_task_name, child)
 
-        return graph
 class WorkflowTraceArchiveReader:
 
     def __init__(self, resource_path):
@@ -130,32 +170,39 @@ def _workflow_name_i(workflow_name, i):
 
 class WfCommonsRealWorkflowReader:
 
-    def __init__(self, real_traces_path):
+    def __init__(self, real_traces_path, use_cache=True, streaming=False, cache_path=None):
+        """
+        :param streaming: if True, the traces are parsed task by task, so the peak memory is proportional to the graph
+        instead of the whole JSON document
+        :param cache_path: directory of the GraphCache, by default CACHE_DIRECTORY in the traces directory
+        """
         self.real_traces_path = real_traces_path
+        self.cache = _create_cache(real_traces_path, cache_path) if use_cache else None
+        self.streaming = streaming
 
     def get_genome(self, random_power):
-        return _create_graph_from_real_trace(f'{self.real_traces_path}/1000genome-chameleon-22ch-250k-001.json', random_power)
+        return _create_graph_from_real_trace(f'{self.real_traces_path}/1000genome-chameleon-22ch-250k-001.json', random_power, self.cache, self.streaming)
 
     def get_soykb(self, random_power):
-        return _create_graph_from_real_trace(f'{self.real_traces_path}/soykb-chameleon-50fastq-20ch-001.json', random_power)
+        return _create_graph_from_real_trace(f'{self.real_traces_path}/soykb-chameleon-50fastq-20ch-001.json', random_power, self.cache, self.streaming)
 
     def get_cycles(self, random_power):
-        return _create_graph_from_real_trace(f'{self.real_traces_path}/cycles-chameleon-10l-3c-12p-001.json', random_power)
+        return _create_graph_from_real_trace(f'{self.real_traces_path}/cycles-chameleon-10l-3c-12p-001.json', random_power, self.cache, self.streaming)
 
     def get_blast(self, random_power):
-        return _create_graph_from_real_trace(f'{self.real_traces_path}/blast-chameleon-large-005.json', random_power)
+        return _create_graph_from_real_trace(f'{self.real_traces_path}/blast-chameleon-large-005.json', random_power, self.cache, self.streaming)
 
     def get_bwa(self, random_power):
-        return _create_graph_from_real_trace(f'{self.real_traces_path}/bwa-chameleon-large-005.json', random_power)
+        return _create_graph_from_real_trace(f'{self.real_traces_path}/bwa-chameleon-large-005.json', random_power, self.cache, self.streaming)
 
     def get_seismology(self, random_power):
-        return _create_graph_from_real_trace(f'{self.real_traces_path}/seismology-chameleon-1100p-001.json', random_power)
+        return _create_graph_from_real_trace(f'{self.real_traces_path}/seismology-chameleon-1100p-001.json', random_power, self.cache, self.streaming)
 
     def get_montage(self, random_power):
-        return _create_graph_from_real_trace(f'{self.real_traces_path}/montage-chameleon-2mass-20d-001.json', random_power)
+        return _create_graph_from_real_trace(f'{self.real_traces_path}/montage-chameleon-2mass-20d-001.json', random_power, self.cache, self.streaming)
 
     def get_srasearch(self, random_power):
-        return _create_graph_from_real_trace(f'{self.real_traces_path}/srasearch-chameleon-50a-005(1).json', random_power)
+        return _create_graph_from_real_trace(f'{self.real_traces_path}/srasearch-chameleon-50a-005(1).json', random_power, self.cache, self.streaming)
 
 
 class WfCommonsWorkflowReader:
@@ -163,8 +210,12 @@ class WfCommonsWorkflowReader:
     MIN_TASK_POWER_DEFAULT = 1
     MAX_TASK_POWER_DEFAULT = 5
 
-    def __init__(self, synthetic_path):
+    def __init__(self, synthetic_path, use_cache=True, cache_path=None):
+        """
+        :param cache_path: directory of the GraphCache, by default CACHE_DIRECTORY in the workflows directory
+        """
         self.synthetic_path = synthetic_path
+        self.cache = _create_cache(synthetic_path, cache_path) if use_cache else None
 
     def create_srasearch_workflow(self, num_tasks, runtime_factor, count):
         self._create(SrasearchRecipe, 'srasearch', num_tasks, runtime_factor, count)
@@ -190,6 +241,9 @@ class WfCommonsWorkflowReader:
     def create_soykb_workflow(self, num_tasks, runtime_factor, count):
         self._create(SoykbRecipe, 'soykb', num_tasks, runtime_factor, count)
 
+    def read_workflow(self, workflow_name, num_tasks, runtime_factor, random_power, index=None):
+        return self._read(workflow_name, num_tasks, runtime_factor, random_power, index)
+
     def read_srasearch_workflow(self, num_tasks, runtime_factor, random_power, index=None):
         return self._read('srasearch', num_tasks, runtime_factor, random_power, index)
 
@@ -278,7 +332,7 @@ class WfCommonsWorkflowReader:
             path = _get_full_name_legacy(self.synthetic_path, workflow_name, num_tasks, runtime_factor)
         else:
             path = _get_full_name(self.synthetic_path, workflow_name, num_tasks, runtime_factor, index)
-        return _create_graph(path, random_power)
+        return _create_graph(path, random_power, self.cache)
 
     def _delete(self, workflow_name, num_tasks, runtime_factor, index):
         if index is None:
@@ -287,10 +341,14 @@ class WfCommonsWorkflowReader:
             path = _get_full_name(self.synthetic_path, workflow_name, num_tasks, runtime_factor, index)
             
         os.remove(path)
+        if self.cache is not None:
+            self.cache.remove(path)
         
     def _change_index(self, workflow_name, num_tasks, runtime_factor, index, new_index):
         old_path = _get_full_name(self.synthetic_path, workflow_name, num_tasks, runtime_factor, index)
         new_path = _get_full_name(self.synthetic_path, workflow_name, num_tasks, runtime_factor, new_index)
         
         os.rename(old_path, new_path)
+        if self.cache is not None:
+            self.cache.remove(old_path)
         
\ No newline at end of file
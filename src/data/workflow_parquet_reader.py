@@ -1,17 +1,25 @@
-import random
-
-import pandas as pd
+import numpy as np
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 from src.scheduling.model.task_graph import TaskGraph
 
-
-def _generate_random_power(min, max):
-    return random.uniform(min, max)
+COLUMNS = ['id', 'runtime', 'parents', 'children']
 
 
-def _create_graph(task_file, min_power, max_power):
+def _create_graph(task_file, min_power, max_power, rng):
     print(f'Loading {task_file}')
-    df = pd.read_parquet(task_file, engine='pyarrow')
+    table = pq.read_table(task_file, columns=COLUMNS)
+
+    ids = table.column('id').to_numpy()
+    runtimes = (table.column('runtime').to_numpy() / 1000).astype(np.int64)  # milliseconds to seconds
+    powers = rng.uniform(min_power, max_power, len(ids))
+
+    # Children in CSR format: the children of the row i are children_ids[children_offsets[i]:children_offsets[i+1]]
+    children = table.column('children').combine_chunks()
+    children_offsets = children.offsets.to_numpy()
+    children_ids = children.values.to_numpy()
+    without_parents = pc.equal(pc.list_value_length(table.column('parents')), 0).to_numpy(zero_copy_only=False)
 
     graph = TaskGraph()
 
@@ -19,23 +27,20 @@ def _create_graph(task_file, min_power, max_power):
     graph.add_new_task(start_task_id, runtime=0, power=0)  # Dummy task
     graph.set_start_task(start_task_id)
 
-    for index, row in df.iterrows():
-        runtime = int(row['runtime'] / 1000)  # milliseconds to seconds
-
-        power = _generate_random_power(min_power, max_power)
-        graph.add_new_task(row['id'], runtime=runtime, power=power)
-
-    for index, row in df.iterrows():
-
-        parent = row['id']
-        children = row['children']
+    ids = ids.tolist()
+    for task_id, runtime, power in zip(ids, runtimes.tolist(), powers.tolist()):
+        graph.add_new_task(task_id, runtime=runtime, power=power)
 
-        if len(row['parents']) == 0:
+    children_offsets = children_offsets.tolist()
+    children_ids = children_ids.tolist()
+    for i, parent in enumerate(ids):
+        if without_parents[i]:
             graph.create_dependency(start_task_id, parent)
 
-        for child in children:
+        for child in children_ids[children_offsets[i]:children_offsets[i + 1]]:
             graph.create_dependency(parent, child)
 
+    graph.compact()
     return graph
 
 
@@ -45,20 +50,20 @@ class WorkflowTraceArchiveReader:
         self.resource_path = resource_path
         self.min_power = min_power
         self.max_power = max_power
-        random.seed(seed)
+        self.rng = np.random.default_rng(seed)
 
     def set_seed(self, seed):
-        random.seed(seed)
+        self.rng = np.random.default_rng(seed)
 
     def epigenomics(self):
         trace = 'workflowhub_epigenomics_dataset-taq_chameleon-cloud_schema-0-2_epigenomics-taq-100000-cc-run002_parquet'
         path = self.get_path(trace)
-        return _create_graph(path, self.min_power, self.max_power)
+        return _create_graph(path, self.min_power, self.max_power, self.rng)
 
     def montage(self):
         trace = 'workflowhub_montage_ti01-971107n_degree-4-0_osg_schema-0-2_montage-4-0-osg-run009_parquet'
         path = self.get_path(trace)
-        return _create_graph(path, self.min_power, self.max_power)
+        return _create_graph(path, self.min_power, self.max_power, self.rng)
 
     def get_path(self, trace):
         return f'{self.resource_path}/workflow_trace_archive/{trace}/tasks/schema-1.0/part.0.parquet'
@@ -0,0 +1,79 @@
+import os
+import pathlib
+import time
+
+from src.data.wfcommons_reader import WfCommonsWorkflowReader
+from src.experiments.main.generate_workflows_for_experiments import num_of_tasks_bigger, runtime_factor_map_bigger
+from src.scheduling.model.task_graph import TaskGraph
+from src.scheduling.util.calc_levels import calc_levels, calc_levels_with_recursion
+from src.scheduling.util.topological_ordering import calculate_upward_rank, calculate_upward_rank_recursive
+
+SYNTHETIC_PATH = pathlib.Path(__file__).parents[4] / 'resources' / 'wfcommons' / 'synthetic'
+
+ALGORITHMS = [
+    ('upward rank (recursive)', calculate_upward_rank_recursive),
+    ('upward rank', calculate_upward_rank),
+    ('levels (recursive)', calc_levels_with_recursion),
+    ('levels', calc_levels),
+]
+
+
+def create_pipeline_graph(num_tasks, shortcuts=False):
+    """
+    0 -> 1 -> ... -> n-1. A pipeline with many tasks is deeper than the recursion limit.
+
+    :param shortcuts: if True, 0 is also a predecessor of all tasks, from the last to the first. The recursive ranks
+    find a longer path to the end of the pipeline for each shortcut: O(V^2).
+    """
+    graph = TaskGraph()
+    for i in range(num_tasks):
+        graph.add_new_task(i, 1, 1)
+    graph.set_start_task(0)
+
+    if shortcuts:
+        for i in range(num_tasks - 1, 1, -1):
+            graph.create_dependency(0, i)
+
+    for i in range(1, num_tasks):
+        graph.create_dependency(i - 1, i)
+
+    return graph
+
+
+def _measure(function, graph, repetitions):
+    start = time.perf_counter()
+    try:
+        for _ in range(repetitions):
+            function(graph)
+    except RecursionError:
+        return float('nan')
+    return (time.perf_counter() - start) / repetitions
+
+
+def _print_times(name, graph, repetitions):
+    times = [_measure(algorithm, graph, repetitions) * 1000 for _, algorithm in ALGORITHMS]
+    print(f'{name:<12}{len(graph.tasks):>7}' + ''.join(f'{t:>30.2f}' for t in times))
+
+
+def benchmark(num_tasks=num_of_tasks_bigger, runtime_factor_map=runtime_factor_map_bigger, repetitions=5):
+    reader = WfCommonsWorkflowReader(SYNTHETIC_PATH)
+
+    print(f'{"workflow":<12}{"tasks":>7}' + ''.join(f'{name + " (ms)":>30}' for name, _ in ALGORITHMS))
+
+    for workflow_name, runtime_factor in runtime_factor_map.items():
+        read = getattr(reader, f'read_{workflow_name}_workflow')
+        try:
+            graph = read(num_tasks, runtime_factor, lambda: 1, index=0)
+        except FileNotFoundError:
+            print(f'{workflow_name:<12}  not found in {os.path.relpath(SYNTHETIC_PATH)}')
+            continue
+
+        _print_times(workflow_name, graph, repetitions)
+
+    # nan: recursion limit exceeded
+    _print_times('pipeline', create_pipeline_graph(5 * num_tasks), repetitions)
+    _print_times('shortcuts', create_pipeline_graph(num_tasks // 2, shortcuts=True), repetitions)
+
+
+if __name__ == '__main__':
+    benchmark()
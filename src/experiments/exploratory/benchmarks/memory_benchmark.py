@@ -0,0 +1,68 @@
+import gc
+import pathlib
+import tracemalloc
+
+from src.data.wfcommons_reader import WfCommonsRealWorkflowReader
+from src.data.workflow_parquet_reader import WorkflowTraceArchiveReader
+
+RESOURCES_PATH = pathlib.Path(__file__).parents[4] / 'resources'
+
+
+def _get_traces():
+    wta_reader = WorkflowTraceArchiveReader(RESOURCES_PATH, min_power=1, max_power=10)
+    real_traces_reader = WfCommonsRealWorkflowReader(RESOURCES_PATH / 'wfcommons' / 'real_traces')
+
+    return [
+        ('wta epigenomics', wta_reader.epigenomics),
+        ('wta montage', wta_reader.montage),
+        ('genome', lambda: real_traces_reader.get_genome(lambda: 1)),
+        ('bwa', lambda: real_traces_reader.get_bwa(lambda: 1)),
+        ('soykb', lambda: real_traces_reader.get_soykb(lambda: 1)),
+    ]
+
+
+def _measure(create):
+    """
+    :return: a tuple with the result, the memory retained by it and the peak memory while creating it, in bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    result = create()
+
+    gc.collect()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, after - before, peak - before
+
+
+def _as_lists(graph):
+    for task in graph.tasks.values():
+        task.successors = list(task.successors)
+        task.predecessors = list(task.predecessors)
+    return graph
+
+
+def benchmark():
+    print(f'{"trace":<18}{"tasks":>8}{"retained (MB)":>16}{"bytes/task":>12}{"with lists (MB)":>18}{"peak (MB)":>12}')
+
+    for name, read in _get_traces():
+        try:
+            read()  # Warm up, so lazy imports and caches of the readers are not measured
+            graph, retained, peak = _measure(read)
+        except FileNotFoundError:
+            print(f'{name:<18}  not found')
+            continue
+
+        # Lists instead of the tuples the readers leave after graph.compact()
+        _, with_lists, _ = _measure(lambda: _as_lists(graph))
+
+        num_tasks = len(graph.tasks)
+        mb = 1024 * 1024
+        print(f'{name:<18}{num_tasks:>8}{retained / mb:>16.2f}{retained / num_tasks:>12.0f}'
+              f'{(retained + with_lists) / mb:>18.2f}{peak / mb:>12.2f}')
+
+
+if __name__ == '__main__':
+    benchmark()
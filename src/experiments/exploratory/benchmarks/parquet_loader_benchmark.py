@@ -0,0 +1,76 @@
+import pathlib
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.data import workflow_parquet_reader
+from src.data.workflow_parquet_reader import WorkflowTraceArchiveReader
+from src.scheduling.model.task_graph import TaskGraph
+
+RESOURCES_PATH = pathlib.Path(__file__).parents[4] / 'resources'
+
+TRACES = {
+    'epigenomics-taq': 'workflowhub_epigenomics_dataset-taq_chameleon-cloud_schema-0-2_epigenomics-taq-100000-cc-run002_parquet',
+    'epigenomics-ilmn': 'workflowhub_epigenomics_dataset-ilmn_chameleon-cloud_schema-0-2_epigenomics-ilmn-100000-cc-run004_parquet',
+    'montage': 'workflowhub_montage_ti01-971107n_degree-4-0_osg_schema-0-2_montage-4-0-osg-run009_parquet',
+}
+
+
+def _create_graph_with_iterrows(task_file, min_power, max_power):
+    """
+    Previous loader: iterates the DataFrame twice and draws the power of each task with random.uniform.
+    """
+    df = pd.read_parquet(task_file, engine='pyarrow')
+
+    graph = TaskGraph()
+    graph.add_new_task(0, runtime=0, power=0)
+    graph.set_start_task(0)
+
+    for index, row in df.iterrows():
+        graph.add_new_task(row['id'], runtime=int(row['runtime'] / 1000), power=random.uniform(min_power, max_power))
+
+    for index, row in df.iterrows():
+        if len(row['parents']) == 0:
+            graph.create_dependency(0, row['id'])
+        for child in row['children']:
+            graph.create_dependency(row['id'], child)
+
+    return graph
+
+
+def _structure(graph):
+    return {
+        task.id: (task.runtime, [t.id for t in task.successors], [t.id for t in task.predecessors])
+        for task in graph.list_of_tasks()
+    }
+
+
+def _measure(load, repetitions):
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        graph = load()
+    return graph, (time.perf_counter() - start) / repetitions
+
+
+def benchmark(repetitions=5):
+    reader = WorkflowTraceArchiveReader(RESOURCES_PATH, min_power=1, max_power=10)
+
+    print(f'{"trace":<18}{"tasks":>8}{"iterrows (ms)":>16}{"columnar (ms)":>16}')
+    for name, trace in TRACES.items():
+        path = reader.get_path(trace)
+
+        expected, iterrows_time = _measure(lambda: _create_graph_with_iterrows(path, 1, 10), repetitions)
+        graph, columnar_time = _measure(
+            lambda: workflow_parquet_reader._create_graph(path, 1, 10, np.random.default_rng(0)), repetitions
+        )
+
+        if _structure(expected) != _structure(graph):
+            raise Exception(f'Graphs of {name} are different')
+
+        print(f'{name:<18}{len(graph.tasks):>8}{iterrows_time * 1000:>16.2f}{columnar_time * 1000:>16.2f}')
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,84 @@
+import random
+import time
+
+from src.scheduling.model.sorted_map import SortedMap
+
+SIZES = [10_000, 100_000, 1_000_000]
+QUERIES = 10_000
+SLICE_QUERIES = 100  # bintrees iterates from the first key on every slice
+SLICE_LENGTH = 100
+
+
+def _create_maps():
+    """
+    :return: a dict of map name -> map factory. bintrees and pyredblack are not dependencies anymore, so they are
+    compared only when installed.
+    """
+    maps = {'sorted_map': SortedMap}
+
+    try:
+        from bintrees import AVLTree, FastAVLTree
+        maps['bintrees_avl'] = AVLTree
+        maps['bintrees_fast_avl'] = FastAVLTree
+    except ImportError:
+        pass
+
+    try:
+        import pyredblack
+        maps['pyredblack'] = pyredblack.rbdict
+    except ImportError:
+        pass
+
+    return maps
+
+
+def _measure(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def _insert(events, keys):
+    for key in keys:
+        events[key] = key
+
+
+def _floor(events, queries):
+    for query in queries:
+        events.floor_key(query)
+
+
+def _slice(events, queries):
+    for query in queries:
+        for _ in events.iter_items(query, query + SLICE_LENGTH):
+            pass
+
+
+def benchmark(sizes=SIZES, queries_count=QUERIES, slice_queries_count=SLICE_QUERIES, seed=0):
+    rand = random.Random(seed)
+
+    print(f'{"map":<20}{"events":>10}{"insert (s)":>14}{"floor (us)":>14}{"slice (us)":>14}')
+
+    for size in sizes:
+        # Events are times, so the keys are spread along a domain bigger than the number of events
+        keys = [rand.randint(0, 10 * size) for _ in range(size)]
+        queries = [rand.randint(0, 10 * size) for _ in range(queries_count)]
+
+        for name, create_map in _create_maps().items():
+            events = create_map()
+            insert_time = _measure(lambda: _insert(events, keys))
+
+            if hasattr(events, 'floor_key'):
+                # The first key must be smaller than any query
+                events[-1] = -1
+                floor_time = f'{_measure(lambda: _floor(events, queries)) / queries_count * 1e6:.2f}'
+                slice_queries = queries[:slice_queries_count]
+                slice_time = f'{_measure(lambda: _slice(events, slice_queries)) / len(slice_queries) * 1e6:.2f}'
+            else:
+                floor_time = slice_time = '-'
+
+            print(f'{name:<20}{size:>10}{insert_time:>14.3f}{floor_time:>14}{slice_time:>14}')
+
+
+if __name__ == '__main__':
+    benchmark()
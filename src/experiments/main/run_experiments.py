@@ -1,19 +1,26 @@
+import functools
 import itertools
+import math
 from datetime import datetime
 
 from src.data.photovolta import PhotovoltaReader
 from src.data.wfcommons_reader import WfCommonsWorkflowReader
 from src.experiments.shared.ParallelExperimentExecutor import ParallelExperimentExecutor
-from src.experiments.shared.experiment_file_helper import create_csv_file, write_reports_to_csv
+from src.experiments.shared.result_cache import ResultCache, CACHE_DIRECTORY as RESULT_CACHE_DIRECTORY
+from src.experiments.shared.shared_memory_data import SharedTaskGraph, SharedList
+from src.experiments.shared.experiment_checkpoint import ExperimentCheckpoint
+from src.experiments.shared.experiment_file_helper import get_experiment_id, get_experiment_paths
 from src.experiments.main.generate_workflows_for_experiments import num_of_tasks_smaller, runtime_factor_map_smaller, \
     num_of_tasks_bigger, runtime_factor_map_bigger
 from src.experiments.shared.random_utils import RandomProvider
-from src.scheduling.algorithms.bounded_boundary_search.bounded_boundary_search import bbs, BOUNDARY_SINGLE
+from src.scheduling.algorithms.bounded_boundary_search.bounded_boundary_search import bbs, BOUNDARY_SINGLE, \
+    bbs_placement, bbs_shift
 from src.scheduling.algorithms.lpt.longest_processing_time_first import lpt
 from src.scheduling.energy.energy_usage_calculator import EnergyUsageCalculator
-from src.scheduling.model.cluster import Cluster
+from src.scheduling.model.cluster import Cluster, create_machine_pools
 from src.scheduling.model.machine import Machine
 from src.scheduling.model.power_series import PowerSeries
+from src.scheduling.util.content_hash import ContentHash, hash_scheduling
 from src.scheduling.util.count_active_tasks import count_active_tasks
 from src.scheduling.util.makespan_calculator import calc_makespan
 from src.scheduling.util.scheduling_check import check
@@ -21,6 +28,13 @@ from src.scheduling.util.stretch_calculator import calc_stretch
 from src.util.stopwatch import Stopwatch
 from src.util.time_utils import seconds_to_hours
 
+# Part of the key of the cached results. Change it when the schedulers or the reports change, so the cached reports
+# are computed again.
+RESULTS_VERSION = 1
+
+# Status of the reports of experiments that finished. Experiments that exceeded a limit of the executor have the limit
+# as status (see ParallelExperimentExecutor).
+STATUS_FINISHED = 'finished'
 
 
 
@@ -28,7 +42,7 @@ def report_scheduling(scheduling, graph, energy_calculator, print_resport=False)
     makespan = calc_makespan(scheduling, graph)
 
     workflow_stretch = calc_stretch(graph, scheduling, makespan=makespan)
-    scheduling_hash = hash(frozenset(scheduling.items()))
+    scheduling_hash = hash_scheduling(scheduling)
 
     brown_energy_used, green_energy_not_used, total_energy = energy_calculator.calculate_energy_usage_for_scheduling(
         scheduling, graph)
@@ -72,7 +86,10 @@ def report_scheduling(scheduling, graph, energy_calculator, print_resport=False)
 
 def schedule_and_report(graph, green_power, interval_size, min_makespan, deadline_factor, task_ordering, boundary_strategy,
                         cluster_factory, shift_mode='right-left',
-                        c=0.0, show='off', print_resport=False):
+                        c=0.0, show='off', print_resport=False, result_cache=None):
+    """
+    :param result_cache: ResultCache consulted before scheduling. The report is saved in it after scheduling.
+    """
     deadline = min_makespan * deadline_factor
     number_of_tasks = len(graph.tasks)
 
@@ -83,7 +100,51 @@ def schedule_and_report(graph, green_power, interval_size, min_makespan, deadlin
 
     cluster = cluster_factory()
 
+    if result_cache is not None:
+        key = experiment_key(graph, cluster, green_power, interval_size, min_makespan, deadline_factor, task_ordering,
+                             boundary_strategy, shift_mode, c)
+        report = result_cache.get(key)
+        if report is not None:
+            return report
+
     scheduling = bbs(graph, deadline, c, [cluster], task_sort=task_ordering, shift_mode=shift_mode, boundary_strategy=boundary_strategy, show=show)
+    # The tasks scheduled in a machine pool are assigned to its machines, so the report is about the real machines
+    scheduling = cluster.resolve_schedule(scheduling, graph)
+
+    report = _report_experiment(scheduling, graph, green_power, interval_size, min_makespan, deadline,
+                                print_resport=print_resport)
+    if result_cache is not None:
+        result_cache.put(key, report)
+    return report
+
+
+def experiment_key(graph, cluster, green_power, interval_size, min_makespan, deadline_factor, task_ordering,
+                   boundary_strategy, shift_mode, c):
+    """
+    :return: the content hash of everything that changes the report of an experiment, used as key of the ResultCache
+    """
+    return (ContentHash()
+            .add_value((RESULTS_VERSION, graph.analysis().content_hash()))
+            .add_cluster(cluster)
+            .add_power_series(green_power, interval_size)
+            .add_value((('min_makespan', min_makespan), ('deadline_factor', deadline_factor),
+                        ('task_ordering', task_ordering), ('boundary_strategy', boundary_strategy),
+                        ('shift_mode', shift_mode), ('c', c)))
+            .hexdigest())
+
+
+def shift_and_report(placement, cluster, green_power, interval_size, min_makespan, shift_mode):
+    """
+    Same as schedule_and_report, for a placement already computed with bbs_placement in the cluster.
+    """
+    scheduling = cluster.resolve_schedule(bbs_shift(placement, shift_mode), placement.graph)
+
+    return _report_experiment(scheduling, placement.graph, green_power, interval_size, min_makespan,
+                              placement.deadline)
+
+
+def _report_experiment(scheduling, graph, green_power, interval_size, min_makespan, deadline, print_resport=False):
+    number_of_tasks = len(graph.tasks)
 
     energy_calculator = EnergyUsageCalculator(green_power, interval_size)
     scheduling_report = report_scheduling(scheduling, graph, energy_calculator, print_resport=print_resport)
@@ -111,14 +172,15 @@ def schedule_and_report(graph, green_power, interval_size, min_makespan, deadlin
 
 def experiments_per_workflow(experiment_parameters, metadata, parameters_report):
 
-    graph = experiment_parameters['graph']
-    green_power = experiment_parameters['green_power']
+    # Graph and green power are read from shared memory, once per worker process
+    graph = experiment_parameters['graph'].get()
+    green_power = experiment_parameters['green_power'].get()
     interval_size = experiment_parameters['interval_size']
-    power_distribution = experiment_parameters['power_distribution']
     iteration = experiment_parameters['iteration']
-    cluster_factory = experiment_parameters['cluster_factory']
+    cluster_factory = functools.partial(experiment_parameters['cluster_factory'], green_power, interval_size)
     min_makespan = experiment_parameters['min_makespan']
     boundary_strategy = experiment_parameters['boundary_strategy']
+    result_cache = experiment_parameters['result_cache']
 
     shift_modes = experiment_parameters['shift_modes']
     deadline_factors = experiment_parameters['deadline_factors']
@@ -132,33 +194,85 @@ def experiments_per_workflow(experiment_parameters, metadata, parameters_report)
 
     print(f'JOB {job_number} of {job_count} starting | Iteration {iteration} | {prefix}')
 
-    reports = []
+    # The placement does not depend on the shift mode, so it is computed once and each shift mode branches off it.
+    # It is not computed when the reports of all shift modes are cached.
+    experiment_reports = {}
+    for d, c_value, sort in itertools.product(deadline_factors, c_values, task_sort_criterias):
+        cluster = cluster_factory()
+        placement = None
+
+        for shift in shift_modes:
+            key = experiment_key(graph, cluster, green_power, interval_size, min_makespan, d, sort, boundary_strategy,
+                                 shift, c_value)
+            report = result_cache.get(key) if result_cache is not None else None
+
+            if report is None:
+                if placement is None:
+                    placement = bbs_placement(graph, min_makespan * d, c_value, [cluster], task_sort=sort,
+                                              boundary_strategy=boundary_strategy)
+
+                report = shift_and_report(placement, cluster, green_power, interval_size, min_makespan, shift)
+                if result_cache is not None:
+                    result_cache.put(key, report)
+
+            experiment_reports[(shift, d, c_value, sort)] = report
+
+    reports = [
+        parameters | {'status': STATUS_FINISHED} | experiment_reports[experiment]
+        for experiment, parameters in _parameters_reports(experiment_parameters, metadata, parameters_report)
+    ]
+
+    print(f'JOB {job_number} finished')
+    return reports
+
+def limit_reports(headers, experiment_parameters, metadata, parameters_report, limit):
+    """
+    Reports of a job that exceeded a time or memory limit of the executor. They have the parameters of the experiments
+    and the limit as status, the results are empty.
+    """
+    min_makespan = experiment_parameters['min_makespan']
+
+    return [
+        dict.fromkeys(headers) | parameters | {'status': limit, 'min_makespan': min_makespan,
+                                               'deadline': min_makespan * deadline_factor}
+        for (_, deadline_factor, _, _), parameters in _parameters_reports(experiment_parameters, metadata,
+                                                                          parameters_report)
+    ]
+
+
+def _parameters_reports(experiment_parameters, metadata, parameters_report):
+    """
+    :return: tuples with the (shift mode, deadline factor, c value, task ordering) of each experiment of the job and
+    the report of its parameters
+    """
+    prefix = metadata['prefix']
+    job_number = metadata['job_number']
+
+    parameters_reports = []
     i = 1
 
-    for shift, d, c_value, sort in itertools.product(shift_modes, deadline_factors, c_values, task_sort_criterias):
+    for shift, d, c_value, sort in itertools.product(experiment_parameters['shift_modes'],
+                                                     experiment_parameters['deadline_factors'],
+                                                     experiment_parameters['c_values'],
+                                                     experiment_parameters['task_ordering_criterias']):
         parameters_report_temp = parameters_report | {
             'experiment': f'J{job_number}_E{i}',
             'experiment_type': f'J{prefix}',
-            'iteration': f'{iteration}',
+            'iteration': f'{experiment_parameters["iteration"]}',
             'shift_mode': shift,
             'deadline_factor': d,
             'c_value': c_value,
             'task_ordering': sort,
-            'power_distribution': power_distribution,
+            'power_distribution': experiment_parameters['power_distribution'],
             'job_number': job_number,
-            'boundary_strategy': boundary_strategy,
+            'boundary_strategy': experiment_parameters['boundary_strategy'],
         }
-
-        report = schedule_and_report(graph, green_power, interval_size, min_makespan, d, sort, boundary_strategy,
-                                     cluster_factory, c=c_value, shift_mode=shift)
-
-        full_report = parameters_report_temp | report
-        reports.append(full_report)
+        parameters_reports.append(((shift, d, c_value, sort), parameters_report_temp))
 
         i += 1
 
-    print(f'JOB {job_number} finished')
-    return reports
+    return parameters_reports
+
 
 def len_product(*args):
 
@@ -170,7 +284,10 @@ def len_product(*args):
     return product
 
 
-def execute_experiments(resources_path, synthetic_path, random_provider):
+def execute_experiments(resources_path, synthetic_path, random_provider, experiment_id=None):
+    """
+    :param experiment_id: id of a stopped sweep to resume, skipping its finished jobs. By default a new sweep is started.
+    """
 
     headers = [
         'job_number', 'experiment', 'experiment_type', 'iteration', 'workflow', 'energy_trace',
@@ -179,28 +296,35 @@ def execute_experiments(resources_path, synthetic_path, random_provider):
         'min_makespan', 'makespan', 'workflow_stretch',
         'brown_energy_used', 'green_energy_used', 'total_energy', 'green_energy_not_used',
         'max_active_tasks', 'active_tasks_mean', 'active_tasks_std', 'number_of_tasks',
-        'scheduling_violations',
+        'scheduling_violations', 'status',
     ]
 
-    start_time = datetime.now()
-    file_full_path = create_csv_file(resources_path, start_time, headers)
-
-    def save_report(report):
-        return write_reports_to_csv(report, headers, file_full_path)
-    executor = ParallelExperimentExecutor(save_report)
-
+    if experiment_id is None:
+        experiment_id = get_experiment_id(datetime.now())
+    experiment_path, file_full_path = get_experiment_paths(resources_path, experiment_id)
+    checkpoint = ExperimentCheckpoint(experiment_path, file_full_path, headers)
 
     wfcommons_reader = WfCommonsWorkflowReader(synthetic_path)
     photovolta_reader = PhotovoltaReader(resources_path)
     interval_size = 300 # 300 seconds = 5 minutes
 
+    # Limits of each job, so an outlier configuration does not stall the sweep. A job that exceeds them is retried
+    # once after the other jobs, with twice the time limit, and then reported with the limit as status.
+    job_time_limit = 8 * 60 * 60 # seconds
+    job_memory_limit = 8 * 1024 ** 3 # bytes of resident memory of a worker
+    job_retries = 1
+
+    # Reports of previous runs, so only the experiments that were never run are computed
+    result_cache = ResultCache(f'{resources_path}/experiments/{RESULT_CACHE_DIRECTORY}')
+
     #target_utilization = 0.4
     cores_per_machine = 1000
 
+    # Functions of RandomProvider, called with a provider derived for each workflow
     random_functions = [
-        ('uniform', random_provider.random_uniform),
-        # ('gaussian', random_provider.random_gauss),
-        # ('inverted_exponential', random_provider.random_expovariate_inverse),
+        ('uniform', RandomProvider.random_uniform),
+        # ('gaussian', RandomProvider.random_gauss),
+        # ('inverted_exponential', RandomProvider.random_expovariate_inverse),
     ]
 
     num_of_tasks = num_of_tasks_bigger
@@ -209,15 +333,15 @@ def execute_experiments(resources_path, synthetic_path, random_provider):
     # num_of_tasks = num_of_tasks_smaller
     # runtime_factor_map = runtime_factor_map_smaller
 
-    workflow_providers = [
-        ('blast', lambda random_power, index: wfcommons_reader.read_blast_workflow(num_of_tasks, runtime_factor_map['blast'], random_power, index)),
-        ('bwa', lambda random_power, index: wfcommons_reader.read_bwa_workflow(num_of_tasks, runtime_factor_map['bwa'], random_power, index)),
-        ('cycles', lambda random_power, index: wfcommons_reader.read_cycles_workflow(num_of_tasks, runtime_factor_map['cycles'], random_power, index)),
-        ('genome', lambda random_power, index: wfcommons_reader.read_genome_workflow(num_of_tasks, runtime_factor_map['genome'], random_power, index)),
-        ('soykb', lambda random_power, index: wfcommons_reader.read_soykb_workflow(num_of_tasks, runtime_factor_map['soykb'], random_power, index)),
-        ('srasearch', lambda random_power, index: wfcommons_reader.read_srasearch_workflow(num_of_tasks, runtime_factor_map['srasearch'], random_power, index)),
-        ('montage', lambda random_power, index: wfcommons_reader.read_montage_workflow(num_of_tasks, runtime_factor_map['montage'], random_power, index)),
-        ('seismology', lambda random_power, index: wfcommons_reader.read_seismology_workflow(num_of_tasks, runtime_factor_map['seismology'], random_power, index)),
+    workflows = [
+        'blast',
+        'bwa',
+        'cycles',
+        'genome',
+        'soykb',
+        'srasearch',
+        'montage',
+        'seismology',
     ]
 
     green_power_providers = [
@@ -247,81 +371,189 @@ def execute_experiments(resources_path, synthetic_path, random_provider):
         #BOUNDARY_LPT,
     ]
 
-    job_count = len_product(random_functions, workflow_providers, green_power_providers, boundary_strategies) * experiment_repetitions
+    job_count = len_product(random_functions, workflows, green_power_providers, boundary_strategies) * experiment_repetitions
     experiment_count = len_product(shift_modes, deadline_factors, c_values, task_ordering_criterias)
 
     print(f'{experiment_count} experiments will be executed in {job_count} jobs. Total: {job_count * experiment_count}\n')
 
-    executor.start()
+    # Jobs in the order in which they are numbered
+    jobs = {
+        job_number: {'power_distribution': distribution_name, 'workflow': workflow_name,
+                     'boundary_strategy': boundary_strategy, 'iteration': i, 'energy_trace': g_trace_name}
+        for job_number, (distribution_name, workflow_name, boundary_strategy, i, g_trace_name) in enumerate(
+            itertools.product([name for name, _ in random_functions], workflows, boundary_strategies,
+                              range(experiment_repetitions), [name for name, _ in green_power_providers]),
+            start=1)
+    }
+    checkpoint.start(jobs)
+    if checkpoint.finished_jobs:
+        print(f'Resuming {experiment_id}: {len(checkpoint.finished_jobs)} of {job_count} jobs already finished\n')
+
+    # Unfinished jobs by graph. The graph does not depend on the boundary strategy and the trace, so it is read and
+    # its min makespan estimated once for all of them.
+    jobs_by_graph = {}
+    for job_number, job in jobs.items():
+        if not checkpoint.is_finished(job_number):
+            graph_key = (job['power_distribution'], job['workflow'], job['iteration'])
+            jobs_by_graph.setdefault(graph_key, []).append((job_number, job))
+
+    def save_report(reports):
+        checkpoint.save_job_reports(reports[0]['job_number'], reports)
+    executor = ParallelExperimentExecutor(save_report, time_limit=job_time_limit, memory_limit=job_memory_limit,
+                                          max_retries=job_retries)
 
     stopwatch = Stopwatch()
     stopwatch.start()
 
-    j = 1
-    for distribution_name, random_function in random_functions:
-        for workflow_name, workflow_provider in workflow_providers:
-            for boundary_strategy in boundary_strategies:
-                for i in range(experiment_repetitions):
-                    graph = workflow_provider(random_function, i)
-
-                    # machines_count, min_makespan = get_machines_count(graph, cores_per_machine, target_utilization, boundary_strategy)
-                    machines_count = 1
-
-                    # Estimate the min makespan
-                    temp_cluster = create_cluster(machines_count, cores_per_machine, [], 0)
-                    lpt_schedule = lpt(graph, [temp_cluster])
-                    min_makespan = calc_makespan(lpt_schedule, graph)
-
-                    for g_trace_name, trace_provider in green_power_providers:
-                        green_power = trace_provider()
-
-                        create_cluster_func = lambda: create_cluster(machines_count, cores_per_machine, green_power, interval_size)
-
-                        experiment_parameters = {
-                            'graph': graph,
-                            'green_power': green_power,
-                            'interval_size': interval_size,
-                            'power_distribution': distribution_name,
-                            'cluster_factory': create_cluster_func,
-                            'min_makespan': min_makespan,
-                            'boundary_strategy': boundary_strategy,
-
-                            'shift_modes': shift_modes,
-                            'deadline_factors': deadline_factors,
-                            'c_values': c_values,
-                            'task_ordering_criterias': task_ordering_criterias,
-                            'iteration': i,
-                        }
-
-                        metadata = {
-                            'prefix': f'{workflow_name}_{g_trace_name}_{distribution_name}',
-                            'job_number': j,
-                            'job_count': job_count,
-                            'experiment_count': experiment_count,
-                        }
-
-                        parameters_report = {
-                            'workflow': '' + workflow_name,
-                            'energy_trace': '' + g_trace_name,
-                        }
-
-                        executor.run_experiment_async(
-                            lambda: experiments_per_workflow(experiment_parameters, metadata, parameters_report)
-                        )
-                        j += 1
-
-            executor.wait_all()
-            finished_jobs = '%.2f' % (100 * ((j-1) / float(job_count)))
+    # machines_count, min_makespan = get_machines_count(graph, cores_per_machine, target_utilization, boundary_strategy)
+    machines_count = 1
+
+    # A partial instead of a lambda, so it can be sent to the executor workers. The workers add the green power and the
+    # interval size. Identical machines are scheduled as a machine pool, resolved to the machines before the report.
+    create_cluster_func = functools.partial(create_cluster, machines_count, cores_per_machine, use_pools=True)
+
+    # Closed in the finally block, so the shared memory is released even if the sweep is interrupted
+    shared_traces = {}
+    shared_graphs = []
+
+    def on_job_finished(shared_graph, unfinished_jobs, reports):
+        try:
+            if reports is not None:
+                save_report(reports)
+        finally:
+            # The graph is released as soon as its own jobs finish
+            unfinished_jobs.pop()
+            if not unfinished_jobs:
+                shared_graph.close()
+                shared_graphs.remove(shared_graph)
+
+            finished_jobs = len(checkpoint.finished_jobs)
             elapsed_time = seconds_to_hours(stopwatch.get_elapsed_time())
-            print(f'{finished_jobs}% | {j-1} of {job_count} | {elapsed_time}')
-
-    executor.stop()
+            print(f'{100 * finished_jobs / job_count:.2f}% | {finished_jobs} of {job_count} | {elapsed_time}')
+
+    def on_graph_loaded(graph_jobs, result):
+        if result is None:
+            return  # The jobs of the graph stay unfinished
+
+        graph, min_makespan = result
+        shared_graph = SharedTaskGraph(graph)
+        shared_graphs.append(shared_graph)
+        priority = expected_job_cost(graph, interval_size)
+
+        # Jobs of the graph without a report, shared by their callbacks
+        unfinished_jobs = list(graph_jobs)
+
+        for job_number, job in graph_jobs:
+            experiment_parameters = {
+                'graph': shared_graph,
+                'green_power': shared_traces[job['energy_trace']],
+                'interval_size': interval_size,
+                'power_distribution': job['power_distribution'],
+                'cluster_factory': create_cluster_func,
+                'min_makespan': min_makespan,
+                'boundary_strategy': job['boundary_strategy'],
+                'result_cache': result_cache,
+
+                'shift_modes': shift_modes,
+                'deadline_factors': deadline_factors,
+                'c_values': c_values,
+                'task_ordering_criterias': task_ordering_criterias,
+                'iteration': job['iteration'],
+            }
+
+            metadata = {
+                'prefix': f"{job['workflow']}_{job['energy_trace']}_{job['power_distribution']}",
+                'job_number': job_number,
+                'job_count': job_count,
+                'experiment_count': experiment_count,
+            }
+
+            parameters_report = {
+                'workflow': job['workflow'],
+                'energy_trace': job['energy_trace'],
+            }
+
+            executor.run_experiment_async(
+                experiments_per_workflow, experiment_parameters, metadata, parameters_report, priority=priority,
+                on_finished=functools.partial(on_job_finished, shared_graph, unfinished_jobs),
+                limit_report=functools.partial(limit_reports, headers, experiment_parameters, metadata,
+                                               parameters_report)
+            )
+
+    def submit_jobs():
+        # Each trace is copied once to shared memory, instead of once per job
+        for g_trace_name, trace_provider in green_power_providers:
+            shared_traces[g_trace_name] = SharedList(trace_provider())
+
+        random_functions_by_name = dict(random_functions)
+        for (distribution_name, workflow_name, i), graph_jobs in jobs_by_graph.items():
+            # Each graph draws the task powers from its own generator, so they do not depend on the order in which
+            # the graphs are read
+            random_power = functools.partial(random_functions_by_name[distribution_name],
+                                             random_provider.derive(f'{distribution_name}_{workflow_name}_{i}'))
+
+            # Reading the graphs is the first step of all the other jobs, so it goes first
+            executor.run_experiment_async(
+                load_workflow, wfcommons_reader, workflow_name, num_of_tasks, runtime_factor_map[workflow_name],
+                random_power, i, machines_count, cores_per_machine, priority=math.inf,
+                on_finished=functools.partial(on_graph_loaded, graph_jobs)
+            )
+
+    run_sweep(executor, submit_jobs, lambda: shared_graphs + list(shared_traces.values()))
+
+    failed_jobs = job_count - len(checkpoint.finished_jobs)
+    if failed_jobs:
+        print(f'{failed_jobs} of {job_count} jobs failed, run the sweep again to resume them')
 
     #import os
     #os.system("shutdown now -h")
 
 
-def create_cluster(machines_count, cores_per_machine, green_power, interval_size):
+def run_sweep(executor, submit_jobs, shared_values):
+    """
+    Runs the jobs of a sweep and waits for them. If the sweep fails or is interrupted, the pending jobs are cancelled
+    and the workers terminated instead of running the rest of the sweep. The shared memory is released in both cases.
+
+    :param submit_jobs: function that submits the jobs to the executor
+    :param shared_values: function that returns the values in shared memory that are still used by the jobs
+    """
+    executor.start()
+    try:
+        submit_jobs()
+        executor.stop()
+    except BaseException:
+        cancelled_jobs = executor.terminate()
+        print(f'The sweep was stopped: {cancelled_jobs} jobs were cancelled')
+        raise
+    finally:
+        for shared_value in shared_values():
+            shared_value.close()
+
+
+def load_workflow(workflow_reader, workflow_name, num_of_tasks, runtime_factor, random_power, iteration,
+                  machines_count, cores_per_machine):
+    """
+    Reads a workflow and estimates its min makespan with LPT.
+
+    :return: a tuple with the graph and the min makespan
+    """
+    graph = workflow_reader.read_workflow(workflow_name, num_of_tasks, runtime_factor, random_power, iteration)
+
+    temp_cluster = create_cluster(machines_count, cores_per_machine, [], 0)
+    lpt_schedule = lpt(graph, [temp_cluster])
+    return graph, calc_makespan(lpt_schedule, graph)
+
+
+def expected_job_cost(graph, interval_size):
+    """
+    Estimate of the running time of the jobs of a graph, used to run the longest jobs first. The energy of each
+    candidate start of a task is computed over the green power intervals that the task spans, so the cost grows with
+    the number of tasks and with their total runtime in intervals.
+    """
+    return len(graph.tasks) + float(graph.freeze().runtime.sum()) / interval_size
+
+
+def create_cluster(machines_count, cores_per_machine, green_power, interval_size, use_pools=False):
     machines = []
 
     for i in range(machines_count):
@@ -330,6 +562,9 @@ def create_cluster(machines_count, cores_per_machine, green_power, interval_size
             Machine(machine_id, cores=cores_per_machine)
         )
 
+    if use_pools:
+        machines = create_machine_pools(machines)
+
     power_series = PowerSeries('g1', green_power, interval_size)
     cluster = Cluster('c1', power_series, machines)
 
@@ -373,12 +608,15 @@ if __name__ == '__main__':
     MAX_TASK_POWER_DEFAULT = 5
     SEED = 15735667867885
 
+    # Id of a stopped sweep to resume (e.g. 'experiments_2025-05-01_16-15-28'), None to start a new one
+    RESUME_EXPERIMENT_ID = None
+
     random_provider = RandomProvider(SEED, MIN_TASK_POWER_DEFAULT, MAX_TASK_POWER_DEFAULT)
 
     stopwatch = Stopwatch()
     stopwatch.start()
 
     # simple_execution(resources_path, synthetic_path)
-    execute_experiments(resources_path, synthetic_path, random_provider)
+    execute_experiments(resources_path, synthetic_path, random_provider, experiment_id=RESUME_EXPERIMENT_ID)
 
     print(f'\n\nOverall execution: {seconds_to_hours(stopwatch.get_elapsed_time())}')
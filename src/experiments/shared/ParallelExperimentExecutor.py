@@ -1,49 +1,426 @@
-import queue
-from multiprocessing import JoinableQueue, Process
+import heapq
+import math
+import os
+import pickle
+import threading
+import time
+import traceback
+from multiprocessing import Pipe, Process, Queue, connection, resource_tracker
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+_STARTED = 'started'
+_REPORT = 'report'
+_ERROR = 'error'
+
+TIME_LIMIT = 'timeout'
+MEMORY_LIMIT = 'memory'
+
+# Seconds between checks of the workers while no report arrives
+POLL_INTERVAL = 0.5
+
+
+def _work(jobs_queue, reports_connection):
+    while True:
+        chunk = jobs_queue.get()
+        if chunk is None:
+            return
+
+        for job_id, experiment, args in chunk:
+            # The clock is shared by the processes, so the executor knows for how long the experiment has been running
+            reports_connection.send((_STARTED, job_id, time.monotonic()))
+            try:
+                # Pickled here, so a report that cannot be pickled is an error of its experiment
+                message = (_REPORT, job_id, pickle.dumps(experiment(*args)))
+            except Exception:
+                message = (_ERROR, job_id, traceback.format_exc())
+            reports_connection.send(message)
+
+
+def _rss(pid):
+    """
+    :return: the resident set size of the process in bytes, or None if it cannot be read
+    """
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return None
+
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+class _Job:
+
+    def __init__(self, experiment, args, priority, on_finished, limit_report):
+        self.experiment = experiment
+        self.args = args
+        self.priority = priority
+        self.on_finished = on_finished
+        self.limit_report = limit_report
+        self.retries = 0
+
+
+class _Worker:
+
+    def __init__(self):
+        # Each worker sends its reports through its own pipe: a worker that dies or is terminated while it writes can
+        # only leave its own pipe broken, while it would hold the lock of a queue shared with the other workers
+        self.jobs_queue = Queue()
+        self.reports_connection, reports_sender = Pipe(duplex=False)
+        self.process = Process(target=_work, args=(self.jobs_queue, reports_sender), daemon=True)
+        self.process.start()
+        reports_sender.close()
+
+        # Jobs sent to the worker without a report yet, by job id
+        self.jobs = {}
+        # Id and start time of the job that is running, or None
+        self.running = None
+
+    def is_idle(self):
+        return not self.jobs
+
+    def receive(self):
+        """
+        :return: the messages sent by the worker that are waiting in its pipe, until the pipe is closed
+        """
+        messages = []
+        try:
+            while self.reports_connection.poll():
+                messages.append(self.reports_connection.recv())
+        except (EOFError, OSError):
+            # The worker ended, it is replaced by the executor
+            self.process.join()
+        return messages
 
 
 class ParallelExperimentExecutor:
+    """
+    Runs experiments in a fixed pool of worker processes. Experiments wait in a priority queue and are sent in chunks
+    to idle workers, the ones with the highest priority first. run_experiment_async blocks while max_pending chunks are
+    waiting for a worker. Reports come back through a pipe per worker and are saved by a thread of this process, which
+    also checks the workers: when a worker process dies (e.g. killed for using too much memory), the experiments of its
+    chunk without a report fail and the worker is replaced.
+
+    The same thread is the watchdog of the time and memory limits. A worker whose experiment runs for longer than
+    time_limit, or whose resident memory grows over memory_limit, is terminated and replaced. The experiments of its
+    chunk that did not start are sent again, and the one that was running is retried with the lowest priority and
+    twice the time limit, up to max_retries times. After that it is finished with its limit report, or fails if it
+    has none.
+
+    stop() waits for all the experiments, while terminate() cancels the ones that did not finish, e.g. when the
+    experiments are interrupted.
 
-    def __init__(self, save_report):
+    Experiments and their arguments are pickled, so they must be module level functions (or partials of them).
+    """
+
+    def __init__(self, save_report, max_workers=None, chunk_size=1, max_pending=None, time_limit=None,
+                 memory_limit=None, max_retries=0):
+        """
+        :param max_workers: number of worker processes, by default the number of CPUs
+        :param chunk_size: number of experiments sent to a worker at once
+        :param max_pending: number of chunks waiting for a worker before run_experiment_async blocks, by default two
+        per worker
+        :param time_limit: seconds an experiment can run, by default without limit
+        :param memory_limit: bytes of resident memory a worker can use, by default without limit. It is read with
+        psutil if it is installed, otherwise from /proc.
+        :param max_retries: number of times an experiment that exceeds a limit is run again
+        """
         self.save_report = save_report
-        self.reports_queue = None
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count()
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending if max_pending is not None else 2 * self.max_workers
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit
+        self.max_retries = max_retries
+
         self.report_handler = None
         self.workers = []
 
+        # Number of experiments that failed, lost or whose report could not be saved
+        self.failed_experiments = 0
+
+        # Heap of (-priority, job id, job)
+        self._pending = []
+        self._next_job_id = 0
+        self._submitted = 0
+        self._finished = 0
+        self._stopped = False
+        self._condition = threading.Condition()
+
     def start(self):
-        self.reports_queue = JoinableQueue()
-        self.report_handler = Process(target=self._handle_report, daemon=True)
+        # Started before the workers, so they share it: a worker with its own resource tracker would unlink the shared
+        # memory blocks it opened (see shared_memory_data) when it ends
+        resource_tracker.ensure_running()
+
+        self.workers = [_Worker() for _ in range(self.max_workers)]
+        self._stopped = False
+
+        self.report_handler = threading.Thread(target=self._handle_reports, daemon=True)
         self.report_handler.start()
 
-    def run_experiment_async(self, experiment):
-        worker = Process(target=lambda: self._execute_experiment(experiment), daemon=True)
-        worker.start()
-        self.workers.append(worker)
+    def run_experiment_async(self, experiment, *args, priority=0, on_finished=None, limit_report=None):
+        """
+        Can be called from on_finished callbacks, which do not block while max_pending chunks are waiting.
 
-    def wait_all(self):
-        joined_workers = []
-        for worker in self.workers:
-            worker.join()
-            joined_workers.append(worker)
+        :param priority: experiments with higher priority are sent to the workers first, the ones with the same
+        priority in the order in which they are submitted
+        :param on_finished: function called with the report of the experiment instead of save_report, or with None if
+        the experiment failed
+        :param limit_report: function called with TIME_LIMIT or MEMORY_LIMIT when the experiment exceeds a limit. It
+        returns the report saved instead of the report of the experiment.
+        """
+        with self._condition:
+            if threading.current_thread() is not self.report_handler:
+                self._condition.wait_for(
+                    lambda: self._stopped or len(self._pending) < self.max_pending * self.chunk_size
+                )
+            if self._stopped:
+                raise Exception('The executor is stopped, the experiment cannot be run')
+
+            self._submitted += 1
+            self._push(_Job(experiment, args, priority, on_finished, limit_report))
+            self._dispatch(flush=False)
 
-        for worker in joined_workers:
-            self.workers.remove(worker)
+    def wait_all(self):
+        with self._condition:
+            self._dispatch(flush=True)
+            self._condition.wait_for(lambda: self._finished == self._submitted)
 
     def stop(self):
+        """
+        :return: the number of experiments that failed
+        """
         self.wait_all()
-        self.report_handler.kill()
 
-    def _handle_report(self):
+        with self._condition:
+            self._stopped = True
+        self.report_handler.join()
+
+        for worker in self.workers:
+            worker.jobs_queue.put(None)
+        for worker in self.workers:
+            worker.process.join()
+            worker.reports_connection.close()
+        self.workers = []
+
+        return self.failed_experiments
+
+    def terminate(self):
+        """
+        Stops without waiting for the experiments: the pending ones are cancelled and the workers are terminated, even
+        in the middle of an experiment. The reports that arrive after it are not saved.
+
+        :return: the number of experiments that were cancelled
+        """
+        with self._condition:
+            self._stopped = True
+            cancelled = len(self._pending) + sum(len(worker.jobs) for worker in self.workers)
+            self._pending = []
+            # The cancelled experiments count as finished, so wait_all does not wait for them
+            self._finished = self._submitted
+            self._condition.notify_all()
+
+        if self.report_handler is not None:
+            self.report_handler.join()
+
+        for worker in self.workers:
+            worker.process.terminate()
+        for worker in self.workers:
+            worker.process.join()
+            worker.reports_connection.close()
+        self.workers = []
+
+        return cancelled
+
+    def _push(self, job):
+        # A new id for each push, so the messages of a terminated worker do not match a job that was sent again
+        heapq.heappush(self._pending, (-job.priority, self._next_job_id, job))
+        self._next_job_id += 1
+
+    def _dispatch(self, flush):
+        """
+        :param flush: whether chunks smaller than chunk_size are sent to idle workers
+        """
+        for worker in self.workers:
+            if not self._pending or (not flush and len(self._pending) < self.chunk_size):
+                return
+
+            if worker.is_idle():
+                chunk = [heapq.heappop(self._pending) for _ in range(min(self.chunk_size, len(self._pending)))]
+                worker.jobs = {job_id: job for _, job_id, job in chunk}
+                worker.jobs_queue.put([(job_id, job.experiment, job.args) for _, job_id, job in chunk])
+                self._condition.notify_all()
+
+    def _handle_reports(self):
         while True:
+            with self._condition:
+                if self._stopped:
+                    return
+                workers = list(self.workers)
+
+            ready = connection.wait([worker.reports_connection for worker in workers], timeout=POLL_INTERVAL)
+            for worker in workers:
+                if worker.reports_connection in ready:
+                    for result in worker.receive():
+                        self._handle_result(*result)
+
+            with self._condition:
+                lost_jobs = self._replace_dead_workers()
+            exceeded_jobs = self._enforce_limits()
+            for job in lost_jobs:
+                self._finish(job.on_finished, None)
+            for job, limit in exceeded_jobs:
+                self._finish_exceeded(job, limit)
+
+            with self._condition:
+                # An idle worker does not wait for a full chunk
+                self._dispatch(flush=True)
+
+    def _handle_result(self, kind, job_id, value):
+        with self._condition:
+            worker = next((worker for worker in self.workers if job_id in worker.jobs), None)
+            if worker is None:
+                return  # The experiment was already finished when its worker died or was terminated
+
+            if kind == _STARTED:
+                worker.running = (job_id, value)
+                return
+            job = worker.jobs.pop(job_id)
+            worker.running = None
+
+        report = None
+        if kind == _REPORT:
             try:
-                report = self.reports_queue.get(block=False)
-                self.save_report(report)
-                self.reports_queue.task_done()
+                report = pickle.loads(value)
+            except Exception:
+                print(f'Report could not be loaded:\n{traceback.format_exc()}')
+        else:
+            print(f'Experiment failed:\n{value}')
+        self._finish(job.on_finished, report)
 
-            except queue.Empty:
-                pass
+    def _replace_dead_workers(self):
+        """
+        :return: the jobs lost with the dead workers
+        """
+        lost_jobs = []
+        if self._stopped:
+            return lost_jobs
+
+        for i, worker in enumerate(self.workers):
+            if worker.process.is_alive():
+                continue
+
+            if worker.jobs:
+                print(f'Worker stopped with exit code {worker.process.exitcode}: '
+                      f'{len(worker.jobs)} experiments were lost')
+                lost_jobs.extend(worker.jobs.values())
+            worker.reports_connection.close()
+            self.workers[i] = _Worker()
+
+        return lost_jobs
+
+    def _enforce_limits(self):
+        """
+        Terminates and replaces the workers whose running experiment exceeds a limit. The experiments of their chunks
+        that did not start are sent again.
+
+        :return: tuples with the experiments that exceeded a limit and the limit
+        """
+        with self._condition:
+            if self._stopped or (self.time_limit is None and self.memory_limit is None):
+                return []
+
+            exceeding = []
+            for worker in self.workers:
+                if worker.running is not None:
+                    job_id, start_time = worker.running
+                    limit = self._exceeded_limit(worker, worker.jobs[job_id], start_time)
+                    if limit is not None:
+                        exceeding.append((worker, job_id, limit))
+
+        # The experiment may have finished after the pipe of its worker was read, its report is not lost
+        for worker, _, _ in exceeding:
+            for result in worker.receive():
+                self._handle_result(*result)
+
+        exceeded_jobs = []
+        with self._condition:
+            for worker, job_id, limit in exceeding:
+                if self._stopped or worker not in self.workers or worker.running is None or \
+                        worker.running[0] != job_id:
+                    continue
+
+                worker.process.terminate()
+                worker.process.join()
+                worker.reports_connection.close()
+                self.workers[self.workers.index(worker)] = _Worker()
+
+                job = worker.jobs.pop(job_id)
+                for not_started_job in worker.jobs.values():
+                    self._push(not_started_job)
+                exceeded_jobs.append((job, limit))
+
+        return exceeded_jobs
+
+    def _exceeded_limit(self, worker, job, start_time):
+        """
+        :return: the limit exceeded by the running experiment of the worker, or None
+        """
+        if self.time_limit is not None and time.monotonic() - start_time > self.time_limit * 2 ** job.retries:
+            return TIME_LIMIT
+
+        if self.memory_limit is not None:
+            rss = _rss(worker.process.pid)
+            if rss is not None and rss > self.memory_limit:
+                return MEMORY_LIMIT
+
+        return None
+
+    def _finish_exceeded(self, job, limit):
+        if job.retries < self.max_retries:
+            print(f'Experiment exceeded the {limit} limit, it will be retried')
+            with self._condition:
+                job.retries += 1
+                job.priority = -math.inf
+                self._push(job)
+            return
+
+        print(f'Experiment exceeded the {limit} limit')
+        report = None
+        if job.limit_report is not None:
+            try:
+                report = job.limit_report(limit)
+            except Exception:
+                print(f'Limit report could not be created:\n{traceback.format_exc()}')
+        self._finish(job.on_finished, report)
+
+    def _finish(self, on_finished, report):
+        """
+        :param report: the report, or None if the experiment failed
+        """
+        failed = report is None
+        try:
+            if on_finished is not None:
+                on_finished(report)
+            elif report is not None:
+                self.save_report(report)
+        except Exception:
+            print(f'Report could not be saved:\n{traceback.format_exc()}')
+            failed = True
 
-    def _execute_experiment(self, experiment):
-        report = experiment()
-        self.reports_queue.put(report)
-        self.reports_queue.join()
+        with self._condition:
+            self._finished += 1
+            if failed:
+                self.failed_experiments += 1
+            self._condition.notify_all()
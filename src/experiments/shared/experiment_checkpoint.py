@@ -0,0 +1,122 @@
+import csv
+import io
+import json
+import os
+
+MANIFEST_FILE = 'manifest.json'
+FINISHED_JOBS_FILE = 'finished_jobs.jsonl'
+
+
+def _write_durably(f, text):
+    f.write(text)
+    f.flush()
+    os.fsync(f.fileno())
+
+
+class ExperimentCheckpoint:
+    """
+    Progress of an experiment sweep, so a sweep that was stopped (crash, kill, preempted machine) can be started again
+    and skip the jobs that already finished.
+
+    The manifest lists the jobs of the sweep. The reports of each job are appended to the CSV file in a single write,
+    and only after they are on disk the job is marked as finished, with the size of the CSV file after its reports. When
+    the sweep is resumed, the CSV file is truncated to the size after the last finished job, which removes the reports
+    of jobs that were being written when the sweep stopped.
+    """
+
+    def __init__(self, directory, report_file, headers):
+        """
+        :param report_file: path of the CSV file with the reports
+        """
+        self.directory = directory
+        self.report_file = report_file
+        self.headers = headers
+        self.finished_jobs = set()
+
+    def start(self, jobs):
+        """
+        Creates the manifest and the CSV file of a new sweep, or loads the finished jobs of a stopped sweep.
+
+        :param jobs: dict with a JSON serializable description of each job, by job number
+        """
+        jobs = {str(job_number): job for job_number, job in jobs.items()}
+        manifest_file = os.path.join(self.directory, MANIFEST_FILE)
+
+        if not os.path.exists(manifest_file):
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.report_file, 'w', newline='') as f:
+                _write_durably(f, self._to_csv([self.headers]))
+                report_size = f.tell()
+            with open(self._finished_jobs_file(), 'w') as f:
+                _write_durably(f, self._marker(None, report_size))
+
+            # The manifest is written last: a sweep stopped before it exists starts again from zero
+            self._write_manifest(manifest_file, jobs)
+            return
+
+        with open(manifest_file) as f:
+            manifest = json.load(f)
+        if manifest['headers'] != self.headers or manifest['jobs'] != jobs:
+            raise Exception(f'The jobs of the sweep in {self.directory} are different from the jobs to resume')
+
+        report_size = self._load_finished_jobs()
+        with open(self.report_file, 'r+b') as f:
+            f.truncate(report_size)
+
+    def is_finished(self, job_number):
+        return job_number in self.finished_jobs
+
+    def save_job_reports(self, job_number, reports):
+        """
+        Appends the reports of a job to the CSV file and marks the job as finished.
+        """
+        rows = [[report[header] for header in self.headers] for report in reports]
+        with open(self.report_file, 'a', newline='') as f:
+            _write_durably(f, self._to_csv(rows))
+            report_size = f.tell()
+
+        with open(self._finished_jobs_file(), 'a') as f:
+            _write_durably(f, self._marker(job_number, report_size))
+        self.finished_jobs.add(job_number)
+
+    def _write_manifest(self, manifest_file, jobs):
+        temp_file = f'{manifest_file}.tmp'
+        with open(temp_file, 'w') as f:
+            _write_durably(f, json.dumps({'headers': self.headers, 'jobs': jobs}, indent=1))
+        os.replace(temp_file, manifest_file)
+
+    def _finished_jobs_file(self):
+        return os.path.join(self.directory, FINISHED_JOBS_FILE)
+
+    def _load_finished_jobs(self):
+        """
+        Removes the last marker if it was partially written when the sweep stopped.
+
+        :return: the size of the CSV file after the reports of the last finished job
+        """
+        report_size = None
+        valid_size = 0
+        with open(self._finished_jobs_file(), 'r+b') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+
+                marker = json.loads(line)
+                if marker['job'] is not None:
+                    self.finished_jobs.add(marker['job'])
+                report_size = marker['report_size']
+                valid_size += len(line)
+
+            f.truncate(valid_size)
+
+        return report_size
+
+    @staticmethod
+    def _marker(job_number, report_size):
+        return json.dumps({'job': job_number, 'report_size': report_size}) + '\n'
+
+    @staticmethod
+    def _to_csv(rows):
+        text = io.StringIO()
+        csv.writer(text).writerows(rows)
+        return text.getvalue()
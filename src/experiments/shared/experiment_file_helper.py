@@ -25,10 +25,17 @@ def create_dir(directory):
         os.makedirs(directory)
 
 
+def get_experiment_paths(resources_path, experiment_id):
+    """
+    :return: a tuple with the directory of the experiment and the path of its CSV report
+    """
+    experiments_reports_path = resources_path + f'/experiments/{experiment_id}'
+    return experiments_reports_path, f'{experiments_reports_path}/report_{experiment_id}.csv'
+
+
 def create_csv_file(resources_path, start_time, headers):
     experiment_id = get_experiment_id(start_time)
-    experiments_reports_path = resources_path + f'/experiments/{experiment_id}'
-    file_full_path = f'{experiments_reports_path}/report_{experiment_id}.csv'
+    experiments_reports_path, file_full_path = get_experiment_paths(resources_path, experiment_id)
 
     create_dir(experiments_reports_path)
     with open(file_full_path, 'x') as csvfile:
@@ -3,28 +3,45 @@ import random
 
 class RandomProvider:
 
-    def __init__(self, seed, min_task_power, max_task_power):
-        random.seed(seed)
+    def __init__(self, seed, min_task_power, max_task_power, generator=None):
+        """
+        :param generator: random.Random used to draw the values. By default the global generator of the random module,
+        which is seeded with the seed.
+        """
+        if generator is None:
+            random.seed(seed)
+            generator = random
+
+        self.seed = seed
         self.min_task_power = min_task_power
         self.max_task_power = max_task_power
+        self.random = generator
+
+    def derive(self, key):
+        """
+        :return: a provider with its own generator, seeded with the seed of this provider and the key. Its values do
+        not depend on the values drawn before from other providers, so it can be used in any order and process.
+        """
+        seed = f'{self.seed}_{key}'
+        return RandomProvider(seed, self.min_task_power, self.max_task_power, generator=random.Random(seed))
 
     def random_uniform(self):
-        return random.uniform(self.min_task_power, self.max_task_power)
+        return self.random.uniform(self.min_task_power, self.max_task_power)
 
     def random_gauss(self):
         mu = 3  # Mean
         sigma = 0.9  # Standard deviation
 
-        value = random.gauss(mu, sigma)
+        value = self.random.gauss(mu, sigma)
         while value < self.min_task_power or value > self.max_task_power:
-            value = random.gauss(mu, sigma)
+            value = self.random.gauss(mu, sigma)
         return value
 
     def random_expovariate(self):
         lambd = 1
-        value = random.expovariate(lambd)
+        value = self.random.expovariate(lambd)
         while value < self.min_task_power or value > self.max_task_power:
-            value = random.expovariate(lambd)
+            value = self.random.expovariate(lambd)
         return value
 
     def random_expovariate_inverse(self):
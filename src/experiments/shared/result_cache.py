@@ -0,0 +1,72 @@
+import json
+import os
+import sqlite3
+
+import numpy as np
+
+CACHE_DIRECTORY = '.result_cache'
+
+_CACHE_FILE = 'results.sqlite'
+
+
+def _to_json(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+class ResultCache:
+    """
+    Experiment reports stored in a SQLite database by the content hash of the experiment (graph, cluster, green power
+    and parameters). Experiments with a cached report are not run again, so a sweep that is run again, or extended with
+    new traces or parameters, only computes the missing experiments.
+
+    Several processes can share the cache: pickling sends only the path, and each process opens its own connection.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = None
+        self._pid = None
+
+    def __getstate__(self):
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.path = state['path']
+        self._connection = None
+        self._pid = None
+
+    def get(self, key):
+        """
+        :return: the report of the experiment, or None if it is not cached
+        """
+        row = self._connect().execute('SELECT report FROM results WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def put(self, key, report):
+        connection = self._connect()
+        with connection:
+            connection.execute('INSERT OR REPLACE INTO results (key, report) VALUES (?, ?)',
+                               (key, json.dumps(report, default=_to_json)))
+
+    def __len__(self):
+        return self._connect().execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def close(self):
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+    def _connect(self):
+        # A connection cannot be used by a forked process, so each process opens its own
+        if self._connection is None or self._pid != os.getpid():
+            os.makedirs(self.path, exist_ok=True)
+            connection = sqlite3.connect(os.path.join(self.path, _CACHE_FILE), timeout=60)
+            connection.execute('PRAGMA journal_mode=WAL')
+            with connection:
+                connection.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, report TEXT NOT NULL)')
+
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
@@ -0,0 +1,167 @@
+from collections import OrderedDict
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.scheduling.model.task import Task
+from src.scheduling.model.task_graph import TaskGraph
+
+# Values built from shared memory by this process, by shared memory block name
+_built_values = OrderedDict()
+MAX_BUILT_VALUES = 8
+
+_ALIGNMENT = 8
+
+
+def _publish(arrays):
+    """
+    Copies the arrays to a new shared memory block.
+
+    :return: a tuple with the SharedMemory and the layout of the arrays in it
+    """
+    layout = []
+    size = 0
+    for key, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        if array.dtype == object:
+            raise Exception(f"Array '{key}' cannot be shared: its values have different types")
+
+        layout.append((key, array.dtype.str, array.shape, size))
+        size += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+    block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for (key, dtype, shape, offset) in layout:
+        np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset)[...] = arrays[key]
+
+    return block, layout
+
+
+def _attach(name):
+    """
+    Opens a shared memory block created by another process, without tracking it: the resource tracker unlinks the
+    blocks it tracks when the processes that use it end, and the block belongs to its creator.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 the block is always tracked. Processes that share the resource tracker of the creator
+        # (started before them, see ParallelExperimentExecutor.start) only track it again, which has no effect.
+        return shared_memory.SharedMemory(name=name)
+
+
+def _build_from_shared_memory(name, layout, build, block=None):
+    """
+    :param block: the SharedMemory, if it was created by this process
+    :param build: function that creates the value from a dict of arrays. The arrays are views of the shared memory,
+    so the value must not keep references to them.
+    :return: the value, which is built once per process and shared memory block
+    """
+    if name in _built_values:
+        _built_values.move_to_end(name)
+        return _built_values[name]
+
+    own_block = block is not None
+    block = block if own_block else _attach(name)
+    try:
+        arrays = {key: np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset)
+                  for key, dtype, shape, offset in layout}
+        value = build(arrays)
+        del arrays
+    finally:
+        if not own_block:
+            block.close()
+
+    _built_values[name] = value
+    if len(_built_values) > MAX_BUILT_VALUES:
+        _built_values.popitem(last=False)
+    return value
+
+
+class _SharedValue:
+    """
+    Value stored in a shared memory block by the process that creates it. Pickling sends only the name and layout of the
+    block, so the processes that receive it read it from the shared memory instead of receiving a copy. The creator
+    must call close() when no process needs the value anymore.
+    """
+
+    def __init__(self, arrays):
+        self._block, self.layout = _publish(arrays)
+        self.name = self._block.name
+
+    def __getstate__(self):
+        return {'name': self.name, 'layout': self.layout}
+
+    def __setstate__(self, state):
+        self._block = None
+        self.name = state['name']
+        self.layout = state['layout']
+
+    def get(self):
+        return _build_from_shared_memory(self.name, self.layout, self._build, block=self._block)
+
+    def close(self):
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
+
+    def _build(self, arrays):
+        raise NotImplementedError
+
+
+class SharedTaskGraph(_SharedValue):
+    """
+    TaskGraph in shared memory, in the CSR format of FrozenTaskGraph. get() returns a TaskGraph equal to the original.
+    """
+
+    def __init__(self, graph):
+        frozen = graph.freeze()
+        start_task = frozen.index[graph.start_task_id] if graph.start_task_id is not None else -1
+
+        super().__init__({
+            'task_ids': np.array(frozen.task_ids),
+            'runtime': frozen.runtime,
+            'power': frozen.power,
+            'successor_offsets': frozen.successor_offsets,
+            'successor_indices': frozen.successor_indices,
+            'predecessor_offsets': frozen.predecessor_offsets,
+            'predecessor_indices': frozen.predecessor_indices,
+            'start_task': np.array([start_task], dtype=np.int64),
+        })
+
+    def _build(self, arrays):
+        task_ids = arrays['task_ids'].tolist()
+        tasks = [
+            Task(task_id, runtime, power)
+            for task_id, runtime, power in zip(task_ids, arrays['runtime'].tolist(), arrays['power'].tolist())
+        ]
+
+        successor_offsets = arrays['successor_offsets'].tolist()
+        successor_indices = arrays['successor_indices'].tolist()
+        predecessor_offsets = arrays['predecessor_offsets'].tolist()
+        predecessor_indices = arrays['predecessor_indices'].tolist()
+
+        graph = TaskGraph()
+        for i, task in enumerate(tasks):
+            task.successors = tuple(tasks[j] for j in successor_indices[successor_offsets[i]:successor_offsets[i + 1]])
+            task.predecessors = tuple(
+                tasks[j] for j in predecessor_indices[predecessor_offsets[i]:predecessor_offsets[i + 1]]
+            )
+            graph.add_task(task)
+
+        start_task = int(arrays['start_task'][0])
+        if start_task >= 0:
+            graph.set_start_task(task_ids[start_task])
+        return graph
+
+
+class SharedList(_SharedValue):
+    """
+    List of numbers of the same type (e.g. a green power trace) in shared memory. get() returns it as a list.
+    """
+
+    def __init__(self, values):
+        super().__init__({'values': np.array(values)})
+
+    def _build(self, arrays):
+        return arrays['values'].tolist()
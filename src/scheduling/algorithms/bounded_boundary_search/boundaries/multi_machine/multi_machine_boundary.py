@@ -4,14 +4,13 @@ from src.scheduling.algorithms.bounded_boundary_search.boundaries.multi_machine.
     calculate_constant_left_boundary
 from src.scheduling.algorithms.bounded_boundary_search.boundaries.multi_machine.multi_machine_constant_right_boundary import \
     calculate_constant_right_boundary
-from src.scheduling.util.calc_levels import calc_levels
 
 
 class MultiMachineBoundaryCalculator:
 
     def __init__(self, graph, deadline, c, machines, strategy='default'):
         self.graph = graph
-        task_levels, max_level = calc_levels(graph)
+        task_levels, max_level = graph.analysis().levels()
         self.task_levels = task_levels
         self.tasks_by_level = _split_tasks_by_level(task_levels)
         self.max_level = max_level
@@ -1,5 +1,5 @@
 from src.scheduling.algorithms.bounded_boundary_search.boundaries.multi_machine.multi_machine_shared import \
-    create_sort_by_max_predecessor_runtime, unschedule, copy_from_temp_schedule
+    create_sort_by_max_predecessor_runtime, fork_machines, copy_from_temp_schedule
 from src.scheduling.util.find_start import find_min_start_machine
 
 
@@ -9,6 +9,7 @@ def calculate_constant_left_boundary(task, schedule, machines, use_lpt=False, sa
         return 0, False
 
     temp_schedule = {}
+    machines = fork_machines(machines)
 
     max_earliest_predecessor_finish_time = -1
     max_predecessor = None
@@ -38,8 +39,6 @@ def calculate_constant_left_boundary(task, schedule, machines, use_lpt=False, sa
             copy_from_temp_schedule(temp_schedule)
         )
 
-    unschedule(temp_schedule)
-
     return start, is_limited_by_scheduled_predecessor
 
 
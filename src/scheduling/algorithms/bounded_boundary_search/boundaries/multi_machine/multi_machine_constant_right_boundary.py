@@ -1,5 +1,5 @@
 from src.scheduling.algorithms.bounded_boundary_search.boundaries.multi_machine.multi_machine_shared import \
-    create_sort_by_max_successor_runtime, unschedule
+    create_sort_by_max_successor_runtime, fork_machines
 from src.scheduling.util.find_start import find_max_start_machine
 
 
@@ -9,6 +9,7 @@ def calculate_constant_right_boundary(task, schedule, machines, deadline, same_l
         return 0, False
 
     temp_schedule = {}
+    machines = fork_machines(machines)
 
     min_successor_start_time = float('inf')
     min_successor = None
@@ -32,7 +33,6 @@ def calculate_constant_right_boundary(task, schedule, machines, deadline, same_l
     is_limited_by_scheduled_successor = (min_successor.id in schedule)
 
     start, _ = find_max_start_machine(task, machines, min_successor_start_time)
-    unschedule(temp_schedule)
 
     return deadline - (start + task.runtime), is_limited_by_scheduled_successor
 
@@ -16,11 +16,11 @@ def _create_is_scheduled_task(schedule, temp_schedule):
     return lambda task_id: task_id in schedule or task_id in temp_schedule
 
 
-def unschedule(temp_schedule):
-    for task_id, d in list(temp_schedule.items()):
-        t, s, m = d
-        if t is not None:
-            m.unschedule_task(t, s)
+def fork_machines(machines):
+    """
+    :return: forks of the machines. Tasks are temporarily scheduled in the forks, which are just discarded at the end.
+    """
+    return [machine.fork() for machine in machines]
 
 def copy_from_temp_schedule(temp_schedule):
     schedule = {}
@@ -1,12 +1,11 @@
 from src.scheduling.algorithms.bounded_boundary_search.boundaries.single_machine.constant_boundary import calculate_left_boundary, \
     calculate_right_boundary
-from src.scheduling.util.calc_levels import calc_levels
 
 
 class BoundaryCalculator:
 
     def __init__(self, graph, deadline, c):
-        task_levels, max_level = calc_levels(graph)
+        task_levels, max_level = graph.analysis().levels()
         self.task_levels = task_levels
         self.max_level = max_level
         self.deadline = deadline
@@ -65,6 +65,94 @@ def _apply_shift(shift_mode, graph, scheduling, machines, boundary_calc, deadlin
 
     return previous_scheduling
 
+def _place_tasks(graph, deadline, c, machines, energy_usage_calculator, scheduling, task_sort, boundary_strategy,
+                 on_task_scheduled=None):
+    """
+    Placement stage: schedules each task in the start with min brown energy inside its boundaries.
+
+    :return: the boundary calculator, which the shift stage uses
+    """
+    tasks = graph.list_of_tasks()
+
+    # Order all tasks - default criteria: by energy usage (power * runtime)
+    tasks.sort(key=_get_task_ordering(task_sort), reverse=True)
+
+    if boundary_strategy == BOUNDARY_SINGLE:
+        boundary_calc = BoundaryCalculator(graph, deadline, c)
+    else:
+        boundary_calc = MultiMachineBoundaryCalculator(graph, deadline, c, machines, strategy=boundary_strategy)
+
+    for task in tasks:
+        boundaries = schedule_min_brown_energy_min_start(task, machines, scheduling, deadline, boundary_calc, energy_usage_calculator)
+        if on_task_scheduled:
+            on_task_scheduled(boundaries)
+
+    return boundary_calc
+
+
+class BbsPlacement:
+    """
+    Result of the placement stage of bbs, before any shift. The placement does not depend on the shift mode, so it can
+    be computed once and shifted with several modes through bbs_shift. It keeps a snapshot of the machine states and
+    of the energy usage after the placement, which is restored before each shift.
+    """
+
+    def __init__(self, graph, deadline, machines, boundary_calc, energy_usage_calculator, scheduling):
+        self.graph = graph
+        self.deadline = deadline
+        self.machines = machines
+        self.boundary_calc = boundary_calc
+        self.scheduling = scheduling
+
+        self._machine_states = [machine.state.fork() for machine in machines]
+        self._energy_usage_calculator = energy_usage_calculator.fork()
+
+    def restore(self):
+        """
+        Restores the machines to the state after the placement. The boundary calculator keeps working on the same
+        machine objects.
+
+        :return: a tuple with a copy of the scheduling and an energy usage calculator with the placed tasks
+        """
+        for machine, state in zip(self.machines, self._machine_states):
+            machine.state = state.fork()
+
+        return self.scheduling.copy(), self._energy_usage_calculator.fork()
+
+
+def bbs_placement(
+        graph, deadline, c, clusters,
+        task_sort=TASK_SORT_ENERGY,
+        boundary_strategy=BOUNDARY_DEFAULT):
+    """
+    First stage of bbs. bbs_shift(bbs_placement(...), shift_mode) returns the same scheduling as bbs(...).
+
+    :return: BbsPlacement
+    """
+    _validate_option(boundary_strategy, 'boundary strategy', [BOUNDARY_SINGLE, BOUNDARY_DEFAULT, BOUNDARY_LPT_PATH, BOUNDARY_LPT, BOUNDARY_LPT_FULL])
+    _validate_option(task_sort, 'task sort strategy', [TASK_SORT_ENERGY, TASK_SORT_POWER, TASK_SORT_LPT, TASK_SORT_SPT])
+
+    power_series = clusters[0].power_series
+    machines = clusters[0].machines_list # TODO - implement multi-cluster
+
+    scheduling = {}
+    energy_usage_calculator = EnergyUsageCalculator(power_series.green_power_list, power_series.interval_length)
+    boundary_calc = _place_tasks(graph, deadline, c, machines, energy_usage_calculator, scheduling, task_sort, boundary_strategy)
+
+    return BbsPlacement(graph, deadline, machines, boundary_calc, energy_usage_calculator, scheduling)
+
+
+def bbs_shift(placement, shift_mode=SHIFT_MODE_LEFT, use_sort_scheduled=False):
+    """
+    Second stage of bbs. The placement is not changed, so it can be shifted again with other modes.
+    """
+    _validate_option(shift_mode, 'shift mode', [SHIFT_MODE_LEFT, SHIFT_MODE_RIGHT_LEFT, SHIFT_MODE_NONE])
+
+    scheduling, energy_usage_calculator = placement.restore()
+    return _apply_shift(shift_mode, placement.graph, scheduling, placement.machines, placement.boundary_calc,
+                        placement.deadline, energy_usage_calculator, use_sort_scheduled)
+
+
 # TODO - rename to bbs
 def bbs(
         graph, deadline, c, clusters,
@@ -95,22 +183,17 @@ def bbs(
         drawer = draw_scheduling(lcb, lvb, rcb, rvb, deadline, green_power, interval_size, scheduling, graph, max_power=max_power)
         drawer.save(file)
 
-    tasks = graph.list_of_tasks()
+    def on_task_scheduled(boundaries):
+        nonlocal lcb, lvb, rcb, rvb
+        lcb, lvb, rcb, rvb = boundaries
+        show_draw_if(['all'])
+
     cluster = clusters[0] # TODO - implement multi-cluster
     machines = cluster.machines_list
 
-    # Order all tasks - default criteria: by energy usage (power * runtime)
-    tasks.sort(key=_get_task_ordering(task_sort), reverse=True)
-
-    if boundary_strategy == BOUNDARY_SINGLE:
-        boundary_calc = BoundaryCalculator(graph, deadline, c)
-    else:
-        boundary_calc = MultiMachineBoundaryCalculator(graph, deadline, c, machines, strategy=boundary_strategy)
     energy_usage_calculator = EnergyUsageCalculator(green_power, interval_size)
-
-    for task in tasks:
-        lcb, lvb, rcb, rvb = schedule_min_brown_energy_min_start(task, machines, scheduling, deadline, boundary_calc, energy_usage_calculator)
-        show_draw_if(['all'])
+    boundary_calc = _place_tasks(graph, deadline, c, machines, energy_usage_calculator, scheduling, task_sort,
+                                 boundary_strategy, on_task_scheduled=on_task_scheduled)
 
     lcb = lvb = rcb = rvb = 0  # Reset boundaries to show final chart without boundaries
     show_draw_if(['all'])
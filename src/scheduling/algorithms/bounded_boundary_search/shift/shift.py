@@ -1,5 +1,5 @@
 from src.scheduling.util.schedule_in_min_brown_energy import schedule_min_brown_energy_min_start, schedule_min_brown_energy_max_start
-from src.scheduling.util.topological_ordering import sort_topologically, sort_topologically_scheduled_tasks
+from src.scheduling.util.topological_ordering import sort_topologically_scheduled_tasks
 
 
 def shift_tasks_to_save_energy(graph, scheduling, machines, boundary_calc, deadline, energy_usage_calc, mode='left', use_sort_scheduled=True):
@@ -11,7 +11,7 @@ def shift_tasks_to_save_energy(graph, scheduling, machines, boundary_calc, deadl
     if use_sort_scheduled:
         tasks = sort_topologically_scheduled_tasks(graph, scheduling, reverse=(mode == 'right'))
     else:
-        tasks = sort_topologically(graph, reverse=(mode == 'right'))
+        tasks = graph.analysis().topological_order(reverse=(mode == 'right'))
 
 
     for i in range(len(tasks)):
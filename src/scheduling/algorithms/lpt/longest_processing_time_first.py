@@ -1,5 +1,4 @@
 from src.scheduling.algorithms.bounded_boundary_search.drawer.bounded_boundary_search_drawer import draw_scheduling
-from src.scheduling.util.lpt_topological_sort import LtpTopologicalSort
 
 
 def lpt(graph, clusters, show='None', max_power=None, chart_x_end=None):
@@ -8,7 +7,7 @@ def lpt(graph, clusters, show='None', max_power=None, chart_x_end=None):
     machines = cluster.machines_list
 
     schedule = {}
-    sorter = LtpTopologicalSort(graph)
+    sorter = graph.analysis().lpt_topological_sort()
 
     def show_draw_if(conditions):
         if show in conditions:
@@ -30,7 +29,7 @@ def lpt(graph, clusters, show='None', max_power=None, chart_x_end=None):
         min_machine = None
 
         for machine in machines:
-            start, end = _get_first_interval(machine, task, interval_start)
+            start = machine.first_start_to_schedule_task(task, interval_start)
             if start < min_start:
                 min_start = start
                 min_machine = machine
@@ -43,13 +42,6 @@ def lpt(graph, clusters, show='None', max_power=None, chart_x_end=None):
 
     return schedule
 
-def _get_first_interval(machine, task, interval_start):
-    # TODO implement method to search for first interval
-    interval_iterator = machine.search_intervals_to_schedule_task(task, interval_start, float('inf'))
-    start, end = next(interval_iterator)
-
-    return start, end
-
 def _max_pred_finish_time(task, schedule):
 
     max_finish_time = 0
@@ -2,7 +2,6 @@ from src.scheduling.algorithms.bounded_boundary_search.boundaries.single_machine
 from src.scheduling.algorithms.bounded_boundary_search.drawer.bounded_boundary_search_drawer import draw_scheduling
 from src.scheduling.energy.energy_usage_calculator import EnergyUsageCalculator
 from src.scheduling.energy.find_min_brown_energy import find_min_brown_energy
-from src.scheduling.util.slack_time_calculator import compute_min_start_time, calculate_slack_time
 
 
 def _split_tasks(slack):
@@ -33,8 +32,8 @@ def _sum_runtime(task_ids, graph):
 def task_flow_schedule(graph, clusters, show='None', max_power=None, chart_x_end=None, graph_boundaries=True):
 
     # 1) Split tasks in critical and noncritical tasks
-    min_start_time = compute_min_start_time(graph)
-    slack = calculate_slack_time(graph, min_start_time)
+    min_start_time = graph.analysis().min_start_time()
+    slack = graph.analysis().slack_time()
     critical_tasks, non_critical_tasks = _split_tasks(slack)
 
     # The deadline is the critical path length
@@ -78,8 +77,8 @@ def task_flow_schedule(graph, clusters, show='None', max_power=None, chart_x_end
             rb = rcb + rvb
 
             # Schedule each task when it uses less brown energy as early as possible
-            start_time, brown_energy = find_min_brown_energy(task, lb, rb, deadline,
-                                               energy_usage_calculator.get_green_power_available())
+            green_power_available = energy_usage_calculator.get_green_power_available_between(lb, deadline - rb)
+            start_time, brown_energy = find_min_brown_energy(task, lb, rb, deadline, green_power_available)
 
             scheduling[task.id] = start_time, None # TODO machine
             energy_usage_calculator.add_scheduled_task(task, start_time)
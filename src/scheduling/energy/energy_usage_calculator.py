@@ -1,4 +1,7 @@
-import pyredblack
+import copy
+
+from src.scheduling.energy.green_power_availability import GreenPowerAvailability
+from src.scheduling.model.sorted_map import SortedMap
 
 TASK_EVENT = 'task'
 G_POWER_EVENT = 'green_power'
@@ -6,9 +9,21 @@ G_POWER_EVENT = 'green_power'
 class PowerEvents:
 
     def __init__(self):
-        self.power_events = pyredblack.rbdict()
+        self.power_events = SortedMap()
         self.task_scheduling = {}
 
+    def fork(self):
+        """
+        :return: a copy of the events that can be changed without changing these events
+        """
+        power_events = PowerEvents()
+        power_events.power_events = self.power_events.copy()
+        # The event lists are changed in place, so each copy needs its own lists
+        for time, events in self.power_events.items():
+            power_events.power_events[time] = list(events)
+        power_events.task_scheduling = dict(self.task_scheduling)
+        return power_events
+
     def _add_power_event(self, event_type, power, time):
         if time not in self.power_events:
             events = []
@@ -115,15 +130,31 @@ class EnergyUsageCalculator:
     def _init(self):
         self.power_events = PowerEvents()
         self._append_green_power_events()
+        self.green_power_availability = GreenPowerAvailability(self.green_energy, self.interval_size)
+
+    def _add_task_power(self, task, start_time):
+        self.power_events.append_task_power(task, start_time)
+        self.green_power_availability.add_power(start_time, start_time + task.runtime, task.power)
 
     def reset(self):
         self._init()
 
+    def fork(self):
+        """
+        :return: a calculator with the same scheduled tasks, which can be changed without changing this calculator
+        """
+        calculator = copy.copy(self)
+        calculator.power_events = self.power_events.fork()
+        calculator.green_power_availability = self.green_power_availability.fork()
+        return calculator
+
     def add_scheduled_task(self, new_task, start_time):
-        self.power_events.append_task_power(new_task, start_time)
+        self._add_task_power(new_task, start_time)
 
     def remove_scheduled_task(self, scheduled_task):
+        start_time = self.power_events.task_scheduling[scheduled_task.id]
         self.power_events.remove_task_power_event(scheduled_task)
+        self.green_power_availability.remove_power(start_time, start_time + scheduled_task.runtime, scheduled_task.power)
 
     def calculate_energy_usage(self):
         return _calculate(self.power_events)
@@ -136,47 +167,24 @@ class EnergyUsageCalculator:
         for task_id, s in scheduling.items():
             start_time, machine = s
             scheduled_task = graph.get_task(task_id)
-            self.power_events.append_task_power(scheduled_task, start_time)
+            self._add_task_power(scheduled_task, start_time)
 
         return _calculate(self.power_events)
 
     def get_green_power_available(self):
-        # TODO test this function
-        actual_green_power_available = []
-        current_green_power = 0
-        current_power_request = 0
-
-        last_power_added = -1
-
-        def add_actual_green_power_available(time, actual_green_power_available, current_green_power,
-                                             current_power_request, last_power_added):
-            available_green_power = current_green_power - current_power_request
-            if available_green_power < 0:
-                available_green_power = 0
-
-            if available_green_power != last_power_added:
-                # TODO fix overlapped time
-                actual_green_power_available.append(
-                    (time, available_green_power)
-                )
-                return available_green_power
-            return last_power_added
-
-        for time, events in self.power_events.items():
-
-            for event_type, power in events:
-                if event_type == G_POWER_EVENT:
-                    current_green_power = power
-                elif event_type == TASK_EVENT:
-                    current_power_request += power
-                else:
-                    raise EventTypeException(f'No eventy type {event_type} defined')
+        """
+        :return: a list of tuples in the form (time, available green power) covering the whole green power series
+        """
+        return self.green_power_availability.items()
 
-            last_power_added = add_actual_green_power_available(time, actual_green_power_available,
-                                                                current_green_power,
-                                                                current_power_request, last_power_added)
+    def get_green_power_available_between(self, start, end):
+        """
+        The same as get_green_power_available, but restricted to the segments that overlap [start, end]. Slicing the
+        result to [start, end] gives the same values as slicing the full list.
 
-        return actual_green_power_available
+        :return: a list of tuples in the form (time, available green power)
+        """
+        return self.green_power_availability.items_between(start, end)
 
 
 class EventTypeException(Exception):
@@ -1,33 +1,60 @@
+from bisect import bisect_right
+
+from src.scheduling.energy.find_min_brown_energy_numpy import find_min_brown_energy_in_interval_numpy
+
+BACKEND_PYTHON = 'python'
+BACKEND_NUMPY = 'numpy'
+
+
 class IntervalException(Exception):
     def __init__(self, task, start, end):
         super().__init__(f'Interval length is not enough to schedule task {task.id}: runtime={task.runtime} start={start} end={end}')
 
 
-def find_min_brown_energy_start(task, start, end, green_energy_available, max_start_mode=False):
+def find_min_brown_energy_start(task, start, end, green_energy_available, max_start_mode=False, backend=BACKEND_PYTHON):
     if task.power == 0:
         return start, 0
 
     if end - start < task.runtime:
         raise IntervalException(task, start, end)
 
+    find_min_brown_energy_in_interval = _get_backend(backend)
+
     green_power_interval = _slice_green_power_available_list(green_energy_available, start, end)
-    start_min, task_min_brown_energy_usage = _find_min_brown_energy_in_interval(task, green_power_interval, max_start_mode=max_start_mode)
+    start_min, task_min_brown_energy_usage = find_min_brown_energy_in_interval(task, green_power_interval, max_start_mode=max_start_mode)
 
     return start + start_min, task_min_brown_energy_usage
 
 
-def find_min_brown_energy(task, lb, rb, deadline, green_energy_available, max_start_mode=False):  # TODO remove
-    return find_min_brown_energy_start(task, lb, deadline - rb, green_energy_available, max_start_mode=max_start_mode)
+def find_min_brown_energy(task, lb, rb, deadline, green_energy_available, max_start_mode=False, backend=BACKEND_PYTHON):  # TODO remove
+    return find_min_brown_energy_start(task, lb, deadline - rb, green_energy_available, max_start_mode=max_start_mode, backend=backend)
+
+
+def _get_backend(backend):
+    backends = {
+        BACKEND_PYTHON: _find_min_brown_energy_in_interval,
+        BACKEND_NUMPY: find_min_brown_energy_in_interval_numpy,
+    }
+
+    if backend not in backends:
+        raise Exception(f"backend '{backend}' invalid")
+
+    return backends[backend]
 
 
 def _slice_green_power_available_list(actual_green_power_available, start, end):
     available_green_powers = []
 
-    g_power_iter = iter(actual_green_power_available)
-    previous_time, previous_available_green_power = next(g_power_iter, (float('inf'), -1))
+    # Jump straight to the last power change at or before start instead of scanning from time 0
+    i = bisect_right(actual_green_power_available, start, key=_get_time) - 1
+    if i < 0:
+        i = 0
+
+    previous_time, previous_available_green_power = _get_power_change(actual_green_power_available, i)
 
     while previous_time <= end:
-        current_time, current_available_green_power = next(g_power_iter, (float('inf'), -1))
+        i += 1
+        current_time, current_available_green_power = _get_power_change(actual_green_power_available, i)
 
         if start <= previous_time <= end:
             available_green_powers.append(
@@ -48,6 +75,16 @@ def _slice_green_power_available_list(actual_green_power_available, start, end):
     return available_green_powers
 
 
+def _get_time(power_change):
+    return power_change[0]
+
+
+def _get_power_change(actual_green_power_available, i):
+    if i < len(actual_green_power_available):
+        return actual_green_power_available[i]
+    return float('inf'), -1
+
+
 def _find_min_brown_energy_in_interval(task, green_power_interval, max_start_mode=False):
     if len(green_power_interval) == 0:
         return 0, task.runtime
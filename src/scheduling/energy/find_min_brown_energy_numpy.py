@@ -0,0 +1,61 @@
+import numpy as np
+
+
+def find_min_brown_energy_in_interval_numpy(task, green_power_interval, max_start_mode=False):
+    """
+    Vectorized version of _find_min_brown_energy_in_interval. Instead of sliding the task along the interval one start
+    time at a time, it computes the brown energy of all start times to verify at once.
+
+    The brown power of the task is a step function max(0, task.power - green power). Its prefix sums B(t) give the
+    brown energy of any start time s as B(s + task.runtime) - B(s).
+
+    :param task: task to be scheduled
+    :param green_power_interval: list of tuples in the form (start time, green power available), relative to the
+    interval start
+    :param max_start_mode: if True, the latest start time with minimal brown energy is returned
+    :return: a tuple with the start time (relative to the interval start) and the brown energy usage
+    """
+    if len(green_power_interval) == 0:
+        return 0, task.runtime
+
+    if len(green_power_interval) == 1:
+        return 0, 0  # Empty interval: only a task with runtime = 0 fits
+
+    times = np.array([time for time, _ in green_power_interval])
+    green_powers = np.array([power for _, power in green_power_interval], dtype=float)
+
+    start_times = _start_times_to_verify(task, times)
+
+    # Brown power and brown energy of each green power interval. The last time is the end of the interval.
+    brown_powers = np.maximum(task.power - green_powers[:-1], 0)
+    prefix_brown_energy = np.concatenate(([0.0], np.cumsum(brown_powers * np.diff(times))))
+
+    brown_energies = _brown_energy_until(start_times + task.runtime, times, brown_powers, prefix_brown_energy) \
+        - _brown_energy_until(start_times, times, brown_powers, prefix_brown_energy)
+    brown_energies = np.round(brown_energies, 4)
+
+    if max_start_mode:
+        i = len(brown_energies) - 1 - np.argmin(brown_energies[::-1])
+    else:
+        i = np.argmin(brown_energies)
+
+    return start_times[i].item(), brown_energies[i].item()
+
+
+def _start_times_to_verify(task, times):
+    """
+    Same start times of find_min_brown_energy._start_times_to_verify: a task either starts or finishes when the green
+    power changes.
+    """
+    can_start = times[times + task.runtime <= times[-1]]
+
+    finish_start_times = times - task.runtime
+    can_finish = finish_start_times[finish_start_times > times[0]]
+
+    return np.union1d(can_start, can_finish)
+
+
+def _brown_energy_until(time_points, times, brown_powers, prefix_brown_energy):
+    i = np.searchsorted(times, time_points, side='right') - 1
+    i = np.clip(i, 0, len(brown_powers) - 1)
+    return prefix_brown_energy[i] + brown_powers[i] * (time_points - times[i])
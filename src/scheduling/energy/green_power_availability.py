@@ -0,0 +1,122 @@
+from bisect import bisect_left, bisect_right
+
+
+class GreenPowerAvailability:
+    """
+    Residual green power curve, i.e., the green power that is still available after discounting the power requested by
+    the scheduled tasks. The curve is updated incrementally when tasks are added or removed, so there is no need to
+    walk all power events to rebuild it.
+
+    The curve is stored as three parallel lists sorted by time. The i-th segment starts at times[i], ends at
+    times[i+1] (the last one never ends) and has green[i] of green power and requested[i] of requested power.
+    """
+
+    def __init__(self, green_power_list, interval_size):
+        self.times = []
+        self.green = []
+        self.requested = []
+
+        start_time = 0
+        for green_power in green_power_list:
+            self._append_segment(start_time, green_power)
+            start_time += interval_size
+        self._append_segment(start_time, 0)
+
+    def fork(self):
+        """
+        :return: a copy of the curve that can be changed without changing this curve
+        """
+        availability = GreenPowerAvailability([], 0)
+        availability.times = list(self.times)
+        availability.green = list(self.green)
+        availability.requested = list(self.requested)
+        return availability
+
+    def add_power(self, start, end, power):
+        if start == end:
+            return
+
+        first = self._split(start)
+        last = self._split(end)
+        for i in range(first, last):
+            self.requested[i] += power
+
+    def remove_power(self, start, end, power):
+        if start == end:
+            return
+
+        first = self._split(start)
+        last = self._split(end)
+        for i in range(first, last):
+            self.requested[i] -= power
+
+        # Merge segments that became equal to keep the curve small along schedule/unschedule iterations
+        self._merge_with_previous(last)
+        self._merge_with_previous(first)
+
+    def items(self):
+        """
+        :return: a list of tuples in the form (time, available green power). Consecutive segments with the same
+        available green power are merged.
+        """
+        return self._compress(0, len(self.times))
+
+    def items_between(self, start, end):
+        """
+        Range query over the availability curve. The first tuple is the segment that contains the start time, followed
+        by all segments starting in (start, end].
+
+        :return: a list of tuples in the form (time, available green power)
+        """
+        first = bisect_right(self.times, start) - 1
+        last = bisect_right(self.times, end)
+        return self._compress(max(first, 0), last)
+
+    def _compress(self, first, last):
+        available_green_powers = []
+
+        last_power_added = -1
+        for i in range(first, last):
+            available_green_power = self._available(i)
+            if available_green_power != last_power_added:
+                available_green_powers.append(
+                    (self.times[i], available_green_power)
+                )
+                last_power_added = available_green_power
+
+        return available_green_powers
+
+    def _available(self, i):
+        available_green_power = self.green[i] - self.requested[i]
+        if available_green_power < 0:
+            return 0
+        return available_green_power
+
+    def _append_segment(self, time, green_power):
+        self.times.append(time)
+        self.green.append(green_power)
+        self.requested.append(0)
+
+    def _split(self, time):
+        """
+        Creates a segment starting at the given time (if it does not exist yet).
+
+        :return: the index of the segment starting at the given time
+        """
+        i = bisect_left(self.times, time)
+        if i < len(self.times) and self.times[i] == time:
+            return i
+
+        self.times.insert(i, time)
+        self.green.insert(i, self.green[i-1])
+        self.requested.insert(i, self.requested[i-1])
+        return i
+
+    def _merge_with_previous(self, i):
+        if i == 0 or i >= len(self.times):
+            return
+
+        if self.green[i] == self.green[i-1] and self.requested[i] == self.requested[i-1]:
+            del self.times[i]
+            del self.green[i]
+            del self.requested[i]
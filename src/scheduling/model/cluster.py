@@ -1,4 +1,6 @@
-from src.scheduling.model.machine import Machine
+import heapq
+
+from src.scheduling.model.machine import Machine, STATE_EVENTS, CORES_PER_TASK
 from src.scheduling.model.machine_state import MachineState
 from src.scheduling.model.power_series import PowerSeries
 
@@ -20,10 +22,108 @@ def _create_machine_map(machines):
     return machines_map
 
 
+def create_machine_pools(machines):
+    """
+    Groups identical machines (same cores and TDP) in a MachinePool per machine type. The ids of the pooled machines
+    are kept, so the schedule resolved by the cluster refers to the original machines.
+
+    :return: list of machine pools in the order in which each machine type appears
+    """
+    machines_by_type = {}
+    for machine in machines:
+        machines_by_type.setdefault((machine.cores, machine.tdp), []).append(machine.id)
+
+    return [
+        MachinePool(f'c{cores}_pool{i}', len(machine_ids), cores=cores, tdp=tdp, machine_ids=machine_ids)
+        for i, ((cores, tdp), machine_ids) in enumerate(machines_by_type.items())
+    ]
+
+
+class MachinePool(Machine):
+    """
+    N identical machines represented as a single machine with N times their cores, so schedulers iterate over machine
+    types instead of machines. Each task uses CORES_PER_TASK = 1 core, so any schedule that fits in the pool capacity
+    can be split among the N machines. The machine of each task is only resolved when assign_machines is called.
+    """
+    __slots__ = ('count', 'machine_cores', 'machine_ids')
+
+    def __init__(self, id, count, cores=1, tdp=1, state=STATE_EVENTS, machine_ids=None):
+        super().__init__(id, count * cores, tdp, state)
+        self.count = count
+        self.machine_cores = cores
+
+        if machine_ids is None:
+            machine_ids = [f'{id}_m{i}' for i in range(count)]
+        if len(machine_ids) != count:
+            raise Exception(f'Machine pool id={id} requires {count} machine ids')
+        self.machine_ids = machine_ids
+
+    def assign_machines(self, scheduled_tasks):
+        """
+        Interval partitioning: tasks are assigned by start time to the first machine with a free core. It never fails
+        when the pool capacity is respected, since a machine always has a free core while the pool has one.
+
+        :param scheduled_tasks: list of tuples in the form (task, start time)
+        :return: a dict in the form task id -> machine id
+        """
+        assignment = {}
+
+        free_cores = [self.machine_cores] * self.count
+        machines_with_free_cores = list(range(self.count))
+        running = []  # heap of (finish time, machine)
+
+        for task, start_time in sorted(scheduled_tasks, key=lambda scheduled: scheduled[1]):
+            while running and running[0][0] <= start_time:
+                _, i = heapq.heappop(running)
+                if free_cores[i] == 0:
+                    heapq.heappush(machines_with_free_cores, i)
+                free_cores[i] += CORES_PER_TASK
+
+            if task.runtime == 0:
+                assignment[task.id] = self.machine_ids[0]
+                continue
+
+            if not machines_with_free_cores:
+                raise Exception(f'Machine pool id={self.id} has no free cores at {start_time}')
+
+            i = machines_with_free_cores[0]
+            free_cores[i] -= CORES_PER_TASK
+            if free_cores[i] == 0:
+                heapq.heappop(machines_with_free_cores)
+            heapq.heappush(running, (start_time + task.runtime, i))
+
+            assignment[task.id] = self.machine_ids[i]
+
+        return assignment
+
+
 class Cluster:
+    __slots__ = ('id', 'power_series', 'machines_list', 'machines')
 
     def __init__(self, id, power_series, machines):
         self.id = id
         self.power_series = power_series
         self.machines_list = machines
         self.machines = _create_machine_map(machines)
+
+    def resolve_schedule(self, schedule, graph):
+        """
+        :param schedule: dict in the form task id -> (start time, machine id)
+        :return: the same schedule, but the tasks scheduled in a machine pool are assigned to one of its machines
+        """
+        tasks_by_pool = {}
+        resolved = {}
+
+        for task_id, (start_time, machine_id) in schedule.items():
+            machine = self.machines[machine_id]
+            if isinstance(machine, MachinePool):
+                tasks_by_pool.setdefault(machine_id, []).append((graph.get_task(task_id), start_time))
+            else:
+                resolved[task_id] = start_time, machine_id
+
+        for pool_id, scheduled_tasks in tasks_by_pool.items():
+            assignment = self.machines[pool_id].assign_machines(scheduled_tasks)
+            for task, start_time in scheduled_tasks:
+                resolved[task.id] = start_time, assignment[task.id]
+
+        return resolved
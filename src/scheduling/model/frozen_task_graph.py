@@ -0,0 +1,112 @@
+import numpy as np
+
+
+class FrozenTaskGraph:
+    """
+    Read-only, integer indexed view of a TaskGraph. The i-th task is the i-th task of graph.list_of_tasks(). Runtime and
+    power are NumPy arrays, and the dependencies are stored in CSR format: the successors of the task i are
+    successor_indices[successor_offsets[i]:successor_offsets[i+1]] (the same for predecessors).
+
+    Traversals work over whole frontiers of tasks at once instead of following Task objects one by one.
+    """
+
+    def __init__(self, graph):
+        tasks = graph.list_of_tasks()
+
+        self.task_ids = [task.id for task in tasks]
+        self.index = {task_id: i for i, task_id in enumerate(self.task_ids)}
+
+        self.runtime = np.array([task.runtime for task in tasks])
+        self.power = np.array([task.power for task in tasks])
+
+        self.successor_offsets, self.successor_indices = self._to_csr(tasks, lambda task: task.successors)
+        self.predecessor_offsets, self.predecessor_indices = self._to_csr(tasks, lambda task: task.predecessors)
+
+    def __len__(self):
+        return len(self.task_ids)
+
+    def successors(self, i):
+        return self.successor_indices[self.successor_offsets[i]:self.successor_offsets[i + 1]]
+
+    def predecessors(self, i):
+        return self.predecessor_indices[self.predecessor_offsets[i]:self.predecessor_offsets[i + 1]]
+
+    def reachable_from(self, sources):
+        """
+        :return: a boolean array in which the reachable tasks from the sources (including them) are True
+        """
+        reachable = np.zeros(len(self), dtype=bool)
+        frontier = np.unique(np.asarray(sources, dtype=np.int64))
+
+        while len(frontier) > 0:
+            reachable[frontier] = True
+            successors, _ = _gather(self.successor_offsets, self.successor_indices, frontier)
+            frontier = np.unique(successors[~reachable[successors]])
+
+        return reachable
+
+    def topological_waves(self, sources):
+        """
+        Kahn's algorithm over the tasks reachable from the sources, one wave at a time. A task is in the wave k if the
+        longest path from the sources to it has k dependencies.
+
+        :return: list of arrays of task indices
+        """
+        reachable = self.reachable_from(sources)
+        reachable_tasks = np.flatnonzero(reachable)
+
+        successors, _ = _gather(self.successor_offsets, self.successor_indices, reachable_tasks)
+        in_degree = np.bincount(successors, minlength=len(self))
+
+        waves = []
+        wave = reachable_tasks[in_degree[reachable_tasks] == 0]
+        while len(wave) > 0:
+            waves.append(wave)
+
+            successors, _ = _gather(self.successor_offsets, self.successor_indices, wave)
+            np.subtract.at(in_degree, successors, 1)
+
+            successors = np.unique(successors)
+            wave = successors[in_degree[successors] == 0]
+
+        return waves
+
+    def earliest_start_times(self, sources):
+        """
+        Earliest start time of each task reachable from the sources, considering that the sources start at 0 and
+        there are enough resources to run all tasks in parallel.
+
+        :return: array with the earliest start time of each task (0 for the tasks that are not reachable)
+        """
+        start_times = np.zeros(len(self), dtype=np.result_type(self.runtime, np.int64))
+
+        for wave in self.topological_waves(sources):
+            successors, predecessors = _gather(self.successor_offsets, self.successor_indices, wave)
+            np.maximum.at(start_times, successors, start_times[predecessors] + self.runtime[predecessors])
+
+        return start_times
+
+    def _to_csr(self, tasks, neighbours_of):
+        offsets = np.zeros(len(tasks) + 1, dtype=np.int64)
+        indices = []
+
+        for i, task in enumerate(tasks):
+            neighbours = neighbours_of(task)
+            offsets[i + 1] = offsets[i] + len(neighbours)
+            indices.extend(self.index[neighbour.id] for neighbour in neighbours)
+
+        return offsets, np.array(indices, dtype=np.int64)
+
+
+def _gather(offsets, indices, nodes):
+    """
+    :return: a tuple with the neighbours of all nodes and, for each neighbour, the node it came from
+    """
+    starts = offsets[nodes]
+    counts = offsets[nodes + 1] - starts
+
+    # Position of each neighbour in the indices array: start of its node plus its position inside the node
+    first_position = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    positions = first_position + np.arange(counts.sum())
+
+    return indices[positions], np.repeat(nodes, counts)
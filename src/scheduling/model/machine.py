@@ -1,14 +1,42 @@
+import copy
+
 from src.scheduling.model.machine_state import MachineState
+from src.scheduling.model.segment_tree_machine_state import SegmentTreeMachineState
 
 CORES_PER_TASK = 1
 
+STATE_EVENTS = 'events'
+STATE_SEGMENT_TREE = 'segment-tree'
+
+
+def _create_state(machine, state):
+    states = {
+        STATE_EVENTS: MachineState,
+        STATE_SEGMENT_TREE: SegmentTreeMachineState,
+    }
+
+    if state not in states:
+        raise Exception(f"machine state '{state}' invalid")
+
+    return states[state](machine)
+
+
 class Machine:
+    __slots__ = ('id', 'cores', 'tdp', 'state')
 
-    def __init__(self, id, cores=1, tdp=1):
+    def __init__(self, id, cores=1, tdp=1, state=STATE_EVENTS):
         self.id = id
         self.cores = cores
         self.tdp = tdp
-        self.state = MachineState(self)
+        self.state = _create_state(self, state)
+
+    def fork(self):
+        """
+        :return: a machine with the same id and a forked state. Tasks scheduled in the fork do not change this machine.
+        """
+        machine = copy.copy(self)
+        machine.state = self.state.fork()
+        return machine
 
     def schedule_task(self, task, start_time):
         # TODO Actually, each task uses just one core
@@ -23,5 +51,8 @@ class Machine:
     def search_intervals_to_schedule_task(self, task, start, end):
         return self.state.search_intervals_with_free_cores(start, end, task.runtime, CORES_PER_TASK)
 
+    def first_start_to_schedule_task(self, task, start, end=float('inf')):
+        return self.state.first_fit(start, task.runtime, CORES_PER_TASK, end)
+
     def total_usage(self):
         return self.state.total_usage()
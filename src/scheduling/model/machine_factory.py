@@ -1,13 +1,14 @@
 import math
 
+from src.scheduling.model.cluster import create_machine_pools
 from src.scheduling.model.machine import CORES_PER_TASK, Machine
 
 
-def create_machines_with_target(graph, deadline, cores_per_machine, target_utilization):
-    return create_machines_with_target_resource(graph, deadline, cores_per_machine, target_utilization)
+def create_machines_with_target(graph, deadline, cores_per_machine, target_utilization, use_pools=False):
+    return create_machines_with_target_resource(graph, deadline, cores_per_machine, target_utilization, use_pools)
 
 
-def create_machines_with_target_resource(graph, duration, cores_per_machine, target_utilization):
+def create_machines_with_target_resource(graph, duration, cores_per_machine, target_utilization, use_pools=False):
     """
     2022 | TaskFlow: An Energy- and Makespan-Aware Task Placement Policy for Workflow Scheduling through Delay Management
     https://doi.org/10.1145/3491204.3527466
@@ -18,6 +19,7 @@ def create_machines_with_target_resource(graph, duration, cores_per_machine, tar
     :param cores_per_machine:
     :param target_utilization:
     :param duration:
+    :param use_pools: if True, the machines with the same number of cores are grouped in a MachinePool
     :return:
     """
 
@@ -32,6 +34,8 @@ def create_machines_with_target_resource(graph, duration, cores_per_machine, tar
                 Machine(machine_id, cores=cores)
             )
 
+    if use_pools:
+        return create_machine_pools(machines)
     return machines
 
 
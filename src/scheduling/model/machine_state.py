@@ -1,4 +1,4 @@
-from bintrees import AVLTree
+from src.scheduling.model.sorted_map import SortedMap
 
 
 class MachineState:
@@ -6,11 +6,20 @@ class MachineState:
     def __init__(self, machine):
         self.machine = machine
 
-        self.events = AVLTree()
-        self.events.insert(0, machine.cores)
-        self.events.insert(float('inf'), machine.cores)
+        self.events = SortedMap()
+        self.events[0] = machine.cores
+        self.events[float('inf')] = machine.cores
 
 
+    def fork(self):
+        """
+        :return: a copy of the state that can be changed without changing this state. The events are shared until
+        one of them changes.
+        """
+        state = MachineState(self.machine)
+        state.events = self.events.copy()
+        return state
+
     def use_cores(self, start, duration, amount):
 
         if duration == 0:
@@ -23,8 +32,8 @@ class MachineState:
 
         last_cores_available = -1
 
-        # TreeSlice[s1:e1] -> TreeSlice object, with keys in range s1 <= key < e1
-        current_events = list(self.events[start:end].items())
+        # iter_items(s1, e1) -> items with keys in range s1 <= key < e1
+        current_events = list(self.events.iter_items(start, end))
         if len(current_events) == 0 or start not in self.events:
             previous_time = self.events.floor_key(start)
             current_available_cores = self.events[previous_time] - amount
@@ -57,9 +66,9 @@ class MachineState:
             self.events[start] = current_cores_available
             last_cores_available = cores
 
-            current_events = list(self.events[start+1:end].items())  # s1+1 <= key < e1 => s1 < key < e1
+            current_events = list(self.events.iter_items(start+1, end))  # s1+1 <= key < e1 => s1 < key < e1
         else:
-            current_events = list(self.events[start:end].items())  # s1 <= key < e1 => s1 <= key < e1
+            current_events = list(self.events.iter_items(start, end))  # s1 <= key < e1 => s1 <= key < e1
 
         # Update events
         for time, cores in current_events:
@@ -79,7 +88,7 @@ class MachineState:
             return self.events[previous_time]
 
         min_cores = float('inf')
-        for time, available_cores in self.events[previous_time:end].items():
+        for time, available_cores in self.events.iter_items(previous_time, end):
             if available_cores < min_cores:
                 min_cores = available_cores
 
@@ -128,6 +137,29 @@ class MachineState:
             if i_length >= min_duration:
                 yield i_start, end
 
+    def first_fit(self, start, min_duration, min_cores, end=float('inf')):
+        """
+        :return: the first time >= start in which min_cores are free during min_duration, finishing until end, or inf
+        """
+        if min_duration == 0:
+            return start
+
+        i_start = None
+        for e, cores in self.events.iter_items(self.events.floor_key(start), end):
+            e = max(e, start)
+
+            if i_start is not None and e - i_start >= min_duration:
+                return i_start
+
+            if cores < min_cores:
+                i_start = None
+            elif i_start is None:
+                i_start = e
+
+        if i_start is not None and end - i_start >= min_duration:
+            return i_start
+        return float('inf')
+
     def total_usage(self):
         total_usage = 0
 
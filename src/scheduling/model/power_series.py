@@ -1,4 +1,6 @@
 class PowerSeries:
+    __slots__ = ('id', 'green_power_list', 'interval_length')
+
     def __init__(self, id, green_power_list, interval_length):
         self.id = id
         self.green_power_list = green_power_list
@@ -0,0 +1,383 @@
+import math
+
+NO_CHILD = -1
+
+_NODE_LISTS = ('left', 'right', 'min', 'max', 'lazy', 'prefix', 'suffix', 'best')
+
+
+class SegmentTreeMachineState:
+    """
+    Machine state backed by a segment tree over time with lazy range-add and range min/max. It provides the same
+    interface as MachineState, but use_cores, free_cores and min_free_cores_in run in O(log T), where T is the last
+    time used, instead of iterating over every event in the interval.
+
+    The tree is sparse: nodes are created only when a range update partially covers them, and the time domain doubles
+    when a task finishes after its end. The times where cores are used or freed must be integers or inf, otherwise a
+    ValueError is raised. As in MachineState, cores used until inf stay used after the time domain (the tail), and
+    cores used from inf change nothing. The total usage only counts the cores used until a finite time.
+
+    The nodes are stored in parallel lists (left child, right child, min, max and pending lazy addition).
+
+    Each node also keeps the prefix, suffix and longest runs of times whose free cores are above the node min. A range
+    addition shifts all times of a node equally, so these runs only change when the node is pulled. They bound the
+    longest gap with enough cores inside a node and let first_fit skip busy subtrees without visiting their events.
+
+    Queries do not change the tree: the pending additions of the ancestors of a node are carried down as an offset. So
+    fork() is copy-on-write, like SortedMap.copy(): the fork shares the node lists, and they are copied, in O(nodes),
+    only when the fork or this state changes.
+    """
+
+    def __init__(self, machine):
+        self.machine = machine
+        self.size = 1
+        self.usage = 0
+        self.tail = machine.cores  # Free cores after the time domain
+
+        self.left = []
+        self.right = []
+        self.min = []
+        self.max = []
+        self.lazy = []
+        self.prefix = []
+        self.suffix = []
+        self.best = []
+
+        self.root = self._new_node(machine.cores)
+        self._owned = True  # False if the node lists may be shared with a fork
+
+    def fork(self):
+        """
+        :return: a copy of the state that can be changed without changing this state
+        """
+        state = SegmentTreeMachineState(self.machine)
+        state.size = self.size
+        state.usage = self.usage
+        state.tail = self.tail
+        state.root = self.root
+
+        for nodes in _NODE_LISTS:
+            setattr(state, nodes, getattr(self, nodes))
+
+        self._owned = False
+        state._owned = False
+        return state
+
+    def use_cores(self, start, duration, amount):
+
+        if duration == 0:
+            return
+
+        end = start + duration
+        _validate_interval(start, end)
+
+        if amount > self.min_free_cores_in(start, end):
+            raise Exception(f'There is not enough cores to use between {start} and {end}')
+
+        self._change(start, end, -amount)
+        if end != math.inf:
+            self.usage += duration * amount
+
+    def free_cores(self, start, duration, amount):
+
+        if duration == 0:
+            return
+
+        end = start + duration
+        _validate_interval(start, end)
+
+        _, max_free_cores = self._range(start, end)
+        current_cores_available = max_free_cores + amount
+        if current_cores_available > self.machine.cores:
+            raise Exception(
+                f'A machine with {self.machine.cores} cores cannot have {current_cores_available} free cores!'
+            )
+
+        self._change(start, end, amount)
+        if end != math.inf:
+            self.usage -= duration * amount
+
+    def min_free_cores_in(self, start, end):
+        if start == end:
+            end = start + 1
+
+        min_free_cores, _ = self._range(start, end)
+        return min_free_cores
+
+    def next_start(self, current_start):
+        """
+        :return: the first time after current_start in which the number of free cores changes
+        """
+        cores = self._value(current_start)
+        changes = lambda min_cores, max_cores: min_cores != cores or max_cores != cores
+        next_time = self._find_first(current_start + 1, changes)
+        return float('inf') if next_time is None else next_time
+
+    def previous_start(self, current_start):
+        """
+        :return: the last time before current_start in which the number of free cores changes
+        """
+        if current_start - 1 < 0:
+            raise KeyError(f'No time before {current_start}')
+
+        cores = self._value(current_start - 1)
+        changes = lambda min_cores, max_cores: min_cores != cores or max_cores != cores
+        previous_time = self._find_last(current_start - 1, changes)
+        return 0 if previous_time is None else previous_time + 1
+
+    def search_intervals_with_free_cores(self, start, end, min_duration, min_cores):
+        has_enough_cores = lambda min_free_cores, max_free_cores: max_free_cores >= min_cores
+        has_not_enough_cores = lambda min_free_cores, max_free_cores: min_free_cores < min_cores
+
+        i_start = self._find_first(start, has_enough_cores)
+
+        while i_start is not None and i_start < end:
+            i_end = self._find_first(i_start, has_not_enough_cores)
+            if i_end is None or i_end > end:
+                i_end = end
+
+            # Return the interval if the interval length is greater or equal to min duration
+            if i_end - i_start >= min_duration:
+                yield i_start, i_end
+
+            if i_end >= end:
+                return
+
+            i_start = self._find_first(i_end, has_enough_cores)
+
+    def first_fit(self, start, min_duration, min_cores, end=float('inf')):
+        """
+        :return: the first time >= start in which min_cores are free during min_duration, finishing until end, or inf
+        """
+        if min_duration == 0:
+            return start
+
+        fit, run_start = self._first_fit_in(self.root, 0, self.size, 0, start, min_duration, min_cores, None)
+
+        if fit is None and self.tail >= min_cores:
+            # Everything after the time domain is free
+            fit = max(start, self.size) if run_start is None else run_start
+
+        if fit is None or fit + min_duration > end:
+            return float('inf')
+        return fit
+
+    def total_usage(self):
+        return self.usage
+
+    def _change(self, start, end, amount):
+        """
+        Adds amount to the free cores in [start, end)
+        """
+        if start == math.inf:
+            return
+
+        self._own()
+        if end == math.inf:
+            self._grow(start + 1)
+            self._add(self.root, 0, self.size, start, self.size, amount)
+            self.tail += amount
+        else:
+            self._grow(end)
+            self._add(self.root, 0, self.size, start, end, amount)
+
+    def _own(self):
+        if not self._owned:
+            for nodes in _NODE_LISTS:
+                setattr(self, nodes, list(getattr(self, nodes)))
+            self._owned = True
+
+    def _new_node(self, cores):
+        self.left.append(NO_CHILD)
+        self.right.append(NO_CHILD)
+        self.min.append(cores)
+        self.max.append(cores)
+        self.lazy.append(0)
+        self.prefix.append(0)
+        self.suffix.append(0)
+        self.best.append(0)
+        return len(self.min) - 1
+
+    def _grow(self, end):
+        # The new half of the domain starts with the free cores after the domain
+        while self.size < end:
+            old_root = self.root
+            self.root = self._new_node(self.tail)
+            self.left[self.root] = old_root
+            self.right[self.root] = self._new_node(self.tail)
+            self._pull(self.root, self.size)
+            self.size *= 2
+
+    def _push(self, node):
+        if self.left[node] == NO_CHILD:
+            # A node without children has the same number of free cores along all its interval
+            self.left[node] = self._new_node(self.min[node])
+            self.right[node] = self._new_node(self.min[node])
+            self.lazy[node] = 0
+            return
+
+        if self.lazy[node] != 0:
+            for child in (self.left[node], self.right[node]):
+                self.min[child] += self.lazy[node]
+                self.max[child] += self.lazy[node]
+                self.lazy[child] += self.lazy[node]
+            self.lazy[node] = 0
+
+    def _pull(self, node, half):
+        left = self.left[node]
+        right = self.right[node]
+        self.min[node] = min(self.min[left], self.min[right])
+        self.max[node] = max(self.max[left], self.max[right])
+
+        left_prefix, left_suffix, left_best = self._runs_above_min(left, node, half)
+        right_prefix, right_suffix, right_best = self._runs_above_min(right, node, half)
+
+        self.prefix[node] = left_prefix if left_prefix < half else half + right_prefix
+        self.suffix[node] = right_suffix if right_suffix < half else half + left_suffix
+        self.best[node] = max(left_best, right_best, left_suffix + right_prefix)
+
+    def _runs_above_min(self, child, node, length):
+        """
+        :return: the prefix, suffix and longest runs of the child above the min of its parent node
+        """
+        if self.min[child] > self.min[node]:
+            return length, length, length
+        return self.prefix[child], self.suffix[child], self.best[child]
+
+    def _add(self, node, lo, hi, start, end, amount):
+        if end <= lo or hi <= start:
+            return
+
+        if start <= lo and hi <= end:
+            self.min[node] += amount
+            self.max[node] += amount
+            self.lazy[node] += amount
+            return
+
+        self._push(node)
+        mid = (lo + hi) // 2
+        self._add(self.left[node], lo, mid, start, end, amount)
+        self._add(self.right[node], mid, hi, start, end, amount)
+        self._pull(node, mid - lo)
+
+    def _range(self, start, end):
+        """
+        :return: a tuple with the min and max free cores in [start, end)
+        """
+        min_free_cores, max_free_cores = self._query(self.root, 0, self.size, 0, start, end)
+
+        if end > self.size:
+            min_free_cores = min(min_free_cores, self.tail)
+            max_free_cores = max(max_free_cores, self.tail)
+
+        return min_free_cores, max_free_cores
+
+    def _query(self, node, lo, hi, offset, start, end):
+        """
+        :param offset: sum of the pending additions of the ancestors of the node
+        """
+        if end <= lo or hi <= start:
+            return float('inf'), float('-inf')
+
+        if (start <= lo and hi <= end) or self.left[node] == NO_CHILD:
+            return self.min[node] + offset, self.max[node] + offset
+
+        offset += self.lazy[node]
+        mid = (lo + hi) // 2
+        left_min, left_max = self._query(self.left[node], lo, mid, offset, start, end)
+        right_min, right_max = self._query(self.right[node], mid, hi, offset, start, end)
+        return min(left_min, right_min), max(left_max, right_max)
+
+    def _value(self, time):
+        min_free_cores, _ = self._range(time, time + 1)
+        return min_free_cores
+
+    def _find_first(self, start, matches):
+        """
+        :param matches: a function that receives the min and max free cores of an interval and returns True if any time
+        in the interval may match
+        :return: the first time >= start that matches or None
+        """
+        time = self._find_first_in(self.root, 0, self.size, 0, start, matches)
+        if time is not None:
+            return time
+
+        after_domain = max(start, self.size)
+        if matches(self.tail, self.tail):
+            return after_domain
+        return None
+
+    def _find_first_in(self, node, lo, hi, offset, start, matches):
+        if hi <= start or not matches(self.min[node] + offset, self.max[node] + offset):
+            return None
+
+        if self.left[node] == NO_CHILD:
+            return max(lo, start)
+
+        offset += self.lazy[node]
+        mid = (lo + hi) // 2
+        time = self._find_first_in(self.left[node], lo, mid, offset, start, matches)
+        if time is None:
+            time = self._find_first_in(self.right[node], mid, hi, offset, start, matches)
+        return time
+
+    def _find_last(self, end, matches):
+        """
+        :return: the last time <= end that matches or None
+        """
+        if end >= self.size and matches(self.tail, self.tail):
+            return end
+        return self._find_last_in(self.root, 0, self.size, 0, end, matches)
+
+    def _find_last_in(self, node, lo, hi, offset, end, matches):
+        if lo > end or not matches(self.min[node] + offset, self.max[node] + offset):
+            return None
+
+        if self.left[node] == NO_CHILD:
+            return min(hi - 1, end)
+
+        offset += self.lazy[node]
+        mid = (lo + hi) // 2
+        time = self._find_last_in(self.right[node], mid, hi, offset, end, matches)
+        if time is None:
+            time = self._find_last_in(self.left[node], lo, mid, offset, end, matches)
+        return time
+
+    def _first_fit_in(self, node, lo, hi, offset, start, min_duration, min_cores, run_start):
+        """
+        Scans [lo, hi) from left to right looking for the first run of times with min_cores free that lasts
+        min_duration.
+
+        :param run_start: start of the run with enough cores that reaches lo or None
+        :return: a tuple with the first fit (or None) and the start of the run that reaches hi (or None)
+        """
+        if hi <= start:
+            return None, None
+
+        if self.min[node] + offset >= min_cores:
+            if run_start is None:
+                run_start = max(lo, start)
+            if hi - run_start >= min_duration:
+                return run_start, run_start
+            return None, run_start
+
+        if self.max[node] + offset < min_cores:
+            return None, None
+
+        # The times at the node min have not enough cores, so a fit must be inside the runs above the min. If the
+        # node ends at its min, no run crosses its end and the whole node can be skipped.
+        carried = 0 if run_start is None else lo - run_start
+        if self.suffix[node] == 0 and self.best[node] < min_duration and carried + self.prefix[node] < min_duration:
+            return None, None
+
+        offset += self.lazy[node]
+        mid = (lo + hi) // 2
+        fit, run_start = self._first_fit_in(self.left[node], lo, mid, offset, start, min_duration, min_cores, run_start)
+        if fit is not None:
+            return fit, run_start
+        return self._first_fit_in(self.right[node], mid, hi, offset, start, min_duration, min_cores, run_start)
+
+
+def _validate_interval(start, end):
+    for time in (start, end):
+        if time != math.inf and not (math.isfinite(time) and time == int(time)):
+            raise ValueError(f'Segment tree machine state times must be integers or inf, not {time}')
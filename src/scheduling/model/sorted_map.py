@@ -0,0 +1,190 @@
+from bisect import bisect_left, bisect_right
+
+LOAD = 512
+
+
+class SortedMap:
+    """
+    Map that keeps its keys sorted. It replaces the balanced trees used by MachineState and PowerEvents.
+
+    The keys are stored in a list of sorted blocks (and the values in parallel blocks), like the sorted containers
+    library. Blocks are split when they grow beyond twice the load, so an insertion shifts at most 2 * LOAD items and
+    a lookup is a bisect over the block maxes followed by a bisect inside one block. Both are done by C code in the
+    bisect module and list methods, which is much faster than walking tree nodes in Python.
+
+    copy() is copy-on-write: the copies share the blocks, and a block is copied only when one of the maps changes it.
+    """
+
+    def __init__(self, items=()):
+        self._keys = []
+        self._values = []
+        self._maxes = []
+        self._owned = []  # False if the block may be shared with a copy
+        self._len = 0
+
+        for key, value in items:
+            self[key] = value
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, key):
+        b, i = self._locate(key)
+        return b is not None
+
+    def __getitem__(self, key):
+        b, i = self._locate(key)
+        if b is None:
+            raise KeyError(key)
+        return self._values[b][i]
+
+    def __setitem__(self, key, value):
+        if not self._maxes:
+            self._keys.append([key])
+            self._values.append([value])
+            self._maxes.append(key)
+            self._owned.append(True)
+            self._len = 1
+            return
+
+        b = bisect_left(self._maxes, key)
+        if b == len(self._maxes):
+            # Greater than all keys
+            b -= 1
+            self._own(b)
+            self._keys[b].append(key)
+            self._values[b].append(value)
+            self._maxes[b] = key
+        else:
+            self._own(b)
+            keys = self._keys[b]
+            i = bisect_left(keys, key)
+            if keys[i] == key:
+                self._values[b][i] = value
+                return
+            keys.insert(i, key)
+            self._values[b].insert(i, value)
+
+        self._len += 1
+        self._split(b)
+
+    def __delitem__(self, key):
+        b, i = self._locate(key)
+        if b is None:
+            raise KeyError(key)
+
+        self._own(b)
+        keys = self._keys[b]
+        del keys[i]
+        del self._values[b][i]
+        self._len -= 1
+
+        if len(keys) == 0:
+            del self._keys[b]
+            del self._values[b]
+            del self._maxes[b]
+            del self._owned[b]
+        else:
+            self._maxes[b] = keys[-1]
+
+    def __iter__(self):
+        for keys in self._keys:
+            yield from keys
+
+    def copy(self):
+        copy = SortedMap()
+        copy._keys = list(self._keys)
+        copy._values = list(self._values)
+        copy._maxes = list(self._maxes)
+        copy._len = self._len
+
+        self._owned = [False] * len(self._keys)
+        copy._owned = [False] * len(self._keys)
+        return copy
+
+    def items(self):
+        return self.iter_items()
+
+    def iter_items(self, start=None, end=None):
+        """
+        :return: an iterator over the (key, value) pairs with start <= key < end. None means no limit.
+        """
+        if start is None:
+            b, i = 0, 0
+        else:
+            b = bisect_left(self._maxes, start)
+            if b == len(self._maxes):
+                return
+            i = bisect_left(self._keys[b], start)
+
+        while b < len(self._keys):
+            keys = self._keys[b]
+
+            if end is None or keys[-1] < end:
+                j = len(keys)
+            else:
+                j = bisect_left(keys, end)
+
+            yield from zip(keys[i:j], self._values[b][i:j])
+
+            if j < len(keys):
+                return
+
+            b += 1
+            i = 0
+
+    def floor_key(self, key):
+        """
+        :return: the greatest key less than or equal to the given key
+        """
+        b = bisect_left(self._maxes, key)
+        if b < len(self._maxes):
+            i = bisect_right(self._keys[b], key) - 1
+            if i >= 0:
+                return self._keys[b][i]
+
+        if b == 0:
+            raise KeyError(f'No key less than or equal to {key}')
+        return self._maxes[b - 1]
+
+    def ceiling_key(self, key):
+        """
+        :return: the smallest key greater than or equal to the given key
+        """
+        b = bisect_left(self._maxes, key)
+        if b == len(self._maxes):
+            raise KeyError(f'No key greater than or equal to {key}')
+
+        keys = self._keys[b]
+        return keys[bisect_left(keys, key)]
+
+    def _locate(self, key):
+        """
+        :return: a tuple with the block and the index of the key inside the block or (None, None) if it does not exist
+        """
+        b = bisect_left(self._maxes, key)
+        if b == len(self._maxes):
+            return None, None
+
+        keys = self._keys[b]
+        i = bisect_left(keys, key)
+        if keys[i] != key:
+            return None, None
+        return b, i
+
+    def _own(self, b):
+        if not self._owned[b]:
+            self._keys[b] = list(self._keys[b])
+            self._values[b] = list(self._values[b])
+            self._owned[b] = True
+
+    def _split(self, b):
+        keys = self._keys[b]
+        if len(keys) <= 2 * LOAD:
+            return
+
+        values = self._values[b]
+        self._keys[b:b + 1] = [keys[:LOAD], keys[LOAD:]]
+        self._values[b:b + 1] = [values[:LOAD], values[LOAD:]]
+        self._maxes[b:b + 1] = [keys[LOAD - 1], keys[-1]]
+        self._owned[b:b + 1] = [True, True]
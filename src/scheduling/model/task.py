@@ -1,4 +1,5 @@
 class Task:
+    __slots__ = ('id', 'runtime', 'power', 'successors', 'predecessors')
 
     def __init__(self, task_id, runtime=None, power=None):
         self.id = task_id
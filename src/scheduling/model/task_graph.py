@@ -1,5 +1,6 @@
 from src.scheduling.model.create_graph_exception import CreateGraphException
 from src.scheduling.model.task import Task
+from src.scheduling.model.task_graph_analysis import TaskGraphAnalysis
 
 
 class TaskGraph:
@@ -7,9 +8,11 @@ class TaskGraph:
     def __init__(self):
         self.start_task_id = None
         self.tasks = {}
+        self._analysis = None
 
     def set_start_task(self, task_id):
         self.start_task_id = task_id
+        self._analysis = None
 
     def add_new_task(self, task_id, runtime=None, power=None):
         return self.add_task(
@@ -21,6 +24,7 @@ class TaskGraph:
             raise Exception(f"Task ${task.id} already exists")
 
         self.tasks[task.id] = task
+        self._analysis = None
         return task
 
     def get_task(self, task_id):
@@ -37,21 +41,77 @@ class TaskGraph:
         task_a = self.tasks[task_a_id]
         task_b = self.tasks[task_b_id]
 
+        _use_lists(task_a)
+        _use_lists(task_b)
+
         task_a.successors.append(task_b)
         task_b.predecessors.append(task_a)
+        self._analysis = None
 
     def remove_task(self, task_id):
         task = self.tasks[task_id]
         for succ in task.successors:
+            _use_lists(succ)
             succ.predecessors.remove(task)
 
         for pred in task.predecessors:
+            _use_lists(pred)
             pred.successors.remove(task)
 
         del self.tasks[task_id]
-
+        self._analysis = None
+
+
+    def compact(self):
+        """
+        Stores the successors and predecessors of each task in tuples, which are smaller than lists. Call it after the
+        graph is built. If the graph changes later, the tasks involved go back to lists.
+        """
+        for task in self.tasks.values():
+            task.successors = tuple(task.successors)
+            task.predecessors = tuple(task.predecessors)
+
+    def analysis(self):
+        """
+        :return: the TaskGraphAnalysis of the graph. It is created again after the graph changes.
+        """
+        if self._analysis is None:
+            self._analysis = TaskGraphAnalysis(self)
+        return self._analysis
+
+    def freeze(self):
+        """
+        :return: the FrozenTaskGraph (integer indexed, CSR) view of the graph. It is created again after the graph changes.
+        """
+        return self.analysis().frozen_graph()
+
+    def __getstate__(self):
+        # Flat state: pickling the tasks through their successors would recurse once per dependency level
+        tasks = self.list_of_tasks()
+        return {
+            'start_task_id': self.start_task_id,
+            'tasks': [(task.id, task.runtime, task.power) for task in tasks],
+            'successors': [[succ.id for succ in task.successors] for task in tasks],
+            'predecessors': [[pred.id for pred in task.predecessors] for task in tasks],
+        }
+
+    def __setstate__(self, state):
+        self.start_task_id = state['start_task_id']
+        self.tasks = {task_id: Task(task_id, runtime, power) for task_id, runtime, power in state['tasks']}
+        self._analysis = None
+
+        for task, successors, predecessors in zip(self.tasks.values(), state['successors'], state['predecessors']):
+            task.successors = tuple(self.tasks[succ] for succ in successors)
+            task.predecessors = tuple(self.tasks[pred] for pred in predecessors)
 
     def list_of_tasks(self):
         return list(
             self.tasks.values()
         )
+
+
+def _use_lists(task):
+    if isinstance(task.successors, tuple):
+        task.successors = list(task.successors)
+    if isinstance(task.predecessors, tuple):
+        task.predecessors = list(task.predecessors)
@@ -0,0 +1,58 @@
+from src.scheduling.model.frozen_task_graph import FrozenTaskGraph
+from src.scheduling.util.calc_levels import calc_levels
+from src.scheduling.util.content_hash import hash_graph
+from src.scheduling.util.critical_path_length_calculator import calc_critical_path_length
+from src.scheduling.util.lpt_topological_sort import LtpTopologicalSort
+from src.scheduling.util.reachability import Reachability
+from src.scheduling.util.slack_time_calculator import compute_min_start_time, calculate_slack_time
+from src.scheduling.util.topological_ordering import calculate_upward_rank, sort_topologically
+
+
+class TaskGraphAnalysis:
+    """
+    Graph analytics computed once per graph and shared by all schedulers and boundary calculators that use it. Each
+    result is computed on first use. TaskGraph discards its analysis when tasks or dependencies change, so the results
+    are always up to date with the graph structure. The results are shared, so they must not be changed by callers.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self._cache = {}
+
+    def upward_rank(self):
+        return self._cached('upward_rank', lambda: calculate_upward_rank(self.graph))
+
+    def levels(self):
+        """
+        :return: a tuple with the task levels map and the max level
+        """
+        return self._cached('levels', lambda: calc_levels(self.graph))
+
+    def topological_order(self, reverse=False):
+        return self._cached(('topological_order', reverse), lambda: sort_topologically(self.graph, reverse=reverse))
+
+    def min_start_time(self):
+        return self._cached('min_start_time', lambda: compute_min_start_time(self.graph))
+
+    def slack_time(self):
+        return self._cached('slack_time', lambda: calculate_slack_time(self.graph, self.min_start_time()))
+
+    def critical_path_length(self):
+        return self._cached('critical_path_length', lambda: calc_critical_path_length(self.graph))
+
+    def lpt_topological_sort(self):
+        return self._cached('lpt_topological_sort', lambda: LtpTopologicalSort(self.graph))
+
+    def reachability(self):
+        return self._cached('reachability', lambda: Reachability(self.graph))
+
+    def content_hash(self):
+        return self._cached('content_hash', lambda: hash_graph(self.graph))
+
+    def frozen_graph(self):
+        return self._cached('frozen_graph', lambda: FrozenTaskGraph(self.graph))
+
+    def _cached(self, key, calculate):
+        if key not in self._cache:
+            self._cache[key] = calculate()
+        return self._cache[key]
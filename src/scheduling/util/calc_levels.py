@@ -1,4 +1,17 @@
+from src.scheduling.util.topological_ordering import calculate_upward_rank
+
+
 def calc_levels(graph):
+    """
+    The level of a task is its upward rank: the length of the longest path from the first task to it.
+
+    :return: a tuple with the map task id -> level and the max level
+    """
+    levels = calculate_upward_rank(graph)
+    return levels, max(levels.values())
+
+
+def calc_levels_with_recursion(graph):
     levels = {}
 
     visited_tasks = {}
@@ -0,0 +1,74 @@
+import hashlib
+
+import numpy as np
+
+
+class ContentHash:
+    """
+    SHA-256 of graphs, power series, schedulings and parameters. Unlike hash(), which is salted per process, the same
+    content gives the same hash in every process and run, so it can be stored and compared across runs.
+    """
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+
+    def add_value(self, value):
+        """
+        Adds a value built from numbers, strings, None, booleans, tuples and lists. Its repr is used, so 1 and 1.0 are
+        different values.
+        """
+        self._add_bytes(repr(value).encode())
+        return self
+
+    def add_array(self, array):
+        array = np.ascontiguousarray(array)
+        self.add_value((array.dtype.str, array.shape))
+        self._add_bytes(array.tobytes())
+        return self
+
+    def add_graph(self, graph):
+        frozen = graph.freeze()
+
+        self.add_value((frozen.task_ids, graph.start_task_id))
+        self.add_array(frozen.runtime)
+        self.add_array(frozen.power)
+        self.add_array(frozen.successor_offsets)
+        self.add_array(frozen.successor_indices)
+        return self
+
+    def add_power_series(self, green_power_list, interval_length):
+        self.add_array(np.asarray(green_power_list, dtype=np.float64))
+        self.add_value(interval_length)
+        return self
+
+    def add_cluster(self, cluster):
+        self.add_value([
+            (type(machine).__name__, machine.id, machine.cores, machine.tdp, getattr(machine, 'machine_ids', None))
+            for machine in cluster.machines_list
+        ])
+        self.add_power_series(cluster.power_series.green_power_list, cluster.power_series.interval_length)
+        return self
+
+    def add_scheduling(self, scheduling):
+        """
+        The scheduling is added in the order of the task ids, so the insertion order of the dict does not matter.
+        """
+        self.add_value(sorted((repr(task_id), start_time, machine_id)
+                              for task_id, (start_time, machine_id) in scheduling.items()))
+        return self
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+    def _add_bytes(self, data):
+        # The length prefix keeps consecutive values apart, e.g. ('ab', 'c') and ('a', 'bc')
+        self._hash.update(len(data).to_bytes(8, 'little'))
+        self._hash.update(data)
+
+
+def hash_graph(graph):
+    return ContentHash().add_graph(graph).hexdigest()
+
+
+def hash_scheduling(scheduling):
+    return ContentHash().add_scheduling(scheduling).hexdigest()
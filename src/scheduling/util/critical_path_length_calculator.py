@@ -12,16 +12,10 @@ def calc_critical_path_length(graph):
 
 
 def _earliest_start_time(tasks, graph):
-    start_times = {graph.get_first_task().id: 0}
+    frozen = graph.freeze()
+    start_times = frozen.earliest_start_times([frozen.index[graph.get_first_task().id]]).tolist()
 
-    for task_id in tasks:
-        task = graph.get_task(task_id)
-        start_time = start_times[task.id] if task.id in start_times else 0
-        finish_time = start_time + task.runtime
-        for child in task.successors:
-            if child.id not in start_times or finish_time > start_times[child.id]:
-                start_times[child.id] = finish_time
-    return start_times
+    return {task_id: start_times[frozen.index[task_id]] for task_id in tasks}
 
 
 def _slack_time(tasks, graph):
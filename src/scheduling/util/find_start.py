@@ -6,8 +6,7 @@ def find_min_start_machine(task, machines, max_predecessor_finish_time, end_limi
     min_machine = None
 
     for machine in machines:
-        interval_iterator = machine.search_intervals_to_schedule_task(task, max_predecessor_finish_time, end_limit)
-        start, end = next(interval_iterator, (inf, inf))
+        start = machine.first_start_to_schedule_task(task, max_predecessor_finish_time, end_limit)
         if start < min_start:
             min_start = start
             min_machine = machine
@@ -1,6 +1,5 @@
 from src.scheduling.model.machine import Machine
 from src.scheduling.util.makespan_calculator import calc_makespan
-from src.scheduling.util.topological_ordering import sort_topologically
 
 def estimate_min_makespan_with_enough_cores(graph):
     machines = [
@@ -12,9 +11,9 @@ def estimate_min_makespan_with_enough_cores(graph):
 
 def estimate_min_makespan(graph, machines):
     temp_schedule = {}
-    unschedule_list = []
+    machines = [machine.fork() for machine in machines]
 
-    tasks = sort_topologically(graph)
+    tasks = graph.analysis().topological_order()
 
     for task_id in tasks:
         task = graph.tasks[task_id]
@@ -24,15 +23,7 @@ def estimate_min_makespan(graph, machines):
         temp_schedule[task.id] = start, None  # Task schedule in none machine
         machine.schedule_task(task, start)
 
-        unschedule_list.append(
-            (task, start, machine)
-        )
-
-    min_makespan = calc_makespan(temp_schedule, graph)
-
-    _unschedule(unschedule_list)
-
-    return min_makespan
+    return calc_makespan(temp_schedule, graph)
 
 
 def _min_start(task, temp_schedule):
@@ -59,7 +50,3 @@ def _find_min_start(task, min_start, machines):
 
     return min_s, min_machine
 
-
-def _unschedule(unschedule_list):
-    for task, start, machine in unschedule_list:
-        machine.unschedule_task(task, start)
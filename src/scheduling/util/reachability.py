@@ -0,0 +1,69 @@
+class Reachability:
+    """
+    Transitive closure of a task graph. The descendants and the ancestors of each task are bitsets (Python ints) in
+    which the bit i is the i-th task of graph.list_of_tasks(). They are built once in O(V * E / w), where w is the word
+    size, and a reachability query is a single bit test.
+    """
+
+    def __init__(self, graph):
+        self.tasks = graph.list_of_tasks()
+        self.index = {task.id: i for i, task in enumerate(self.tasks)}
+
+        order = _topological_order(self.tasks)
+
+        self.descendants = [0] * len(self.tasks)
+        for task in reversed(order):
+            self.descendants[self.index[task.id]] = self._reachable(task.successors, self.descendants)
+
+        self.ancestors = [0] * len(self.tasks)
+        for task in order:
+            self.ancestors[self.index[task.id]] = self._reachable(task.predecessors, self.ancestors)
+
+    def is_descendant(self, task, other):
+        """
+        :return: True if there is a path from task to other
+        """
+        return (self.descendants[self.index[task.id]] >> self.index[other.id]) & 1 == 1
+
+    def is_independent(self, task, other):
+        """
+        :return: True if there is no path from task to other nor from other to task
+        """
+        return (self._related(task) >> self.index[other.id]) & 1 == 0
+
+    def independent_tasks(self, task):
+        """
+        :return: list of tasks that are independent of the given task (including itself), in the graph order
+        """
+        related = self._related(task)
+        return [t for i, t in enumerate(self.tasks) if (related >> i) & 1 == 0]
+
+    def _related(self, task):
+        i = self.index[task.id]
+        return self.descendants[i] | self.ancestors[i]
+
+    def _reachable(self, neighbours, reachable_from):
+        bits = 0
+        for neighbour in neighbours:
+            i = self.index[neighbour.id]
+            bits |= (1 << i) | reachable_from[i]
+        return bits
+
+
+def _topological_order(tasks):
+    """
+    Kahn's algorithm.
+    """
+    in_degree = {task.id: len(task.predecessors) for task in tasks}
+    order = [task for task in tasks if in_degree[task.id] == 0]
+
+    for task in order:  # order grows while it is iterated
+        for succ in task.successors:
+            in_degree[succ.id] -= 1
+            if in_degree[succ.id] == 0:
+                order.append(succ)
+
+    if len(order) != len(tasks):
+        raise Exception('The task graph has a cycle')
+
+    return order
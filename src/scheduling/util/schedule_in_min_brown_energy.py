@@ -23,22 +23,21 @@ def _schedule_in_min_brown_energy(task, machines, schedule, deadline, boundary_c
         lb = lcb + lvb
         rb = rcb + rvb
 
-    # Schedule each task when it uses less brown energy as early as possible
-    green_power_available = energy_usage_calculator.get_green_power_available()
-
     interval_available = (deadline - rb) - lb
     if interval_available < task.runtime:
         raise Exception(f'Not enough time to schedule task {task.id}! Task runtime: {task.runtime}; Interval available: {interval_available}')
 
-    for machine in machines:
-        for start, end in machine.search_intervals_to_schedule_task(task, lb, deadline - rb):
-            
-            start_time, brown_energy = find_min_brown_energy_start(task, start, end, green_power_available, max_start_mode=max_start_mode)
+    # Machines usually share free windows (e.g., identical idle machines), so each distinct window is evaluated once
+    machine_windows = _collect_free_windows(task, machines, lb, deadline - rb)
+    min_brown_energy_starts = _find_min_brown_energy_starts(task, machine_windows, energy_usage_calculator, max_start_mode)
 
-            if _is_better(brown_energy, smallest_brown_energy, start_time, selected_start_time, max_start_mode):
-                best_machine = machine
-                selected_start_time = start_time
-                smallest_brown_energy = brown_energy
+    for machine, window in machine_windows:
+        start_time, brown_energy = min_brown_energy_starts[window]
+
+        if _is_better(brown_energy, smallest_brown_energy, start_time, selected_start_time, max_start_mode):
+            best_machine = machine
+            selected_start_time = start_time
+            smallest_brown_energy = brown_energy
 
     if best_machine is None:
         raise Exception(f'No machine available to schedule task {task.id}!')
@@ -50,6 +49,33 @@ def _schedule_in_min_brown_energy(task, machines, schedule, deadline, boundary_c
     return lcb, lvb, rcb, rvb
 
 
+def _collect_free_windows(task, machines, start, end):
+    machine_windows = []
+
+    for machine in machines:
+        for window in machine.search_intervals_to_schedule_task(task, start, end):
+            machine_windows.append(
+                (machine, window)
+            )
+
+    return machine_windows
+
+
+def _find_min_brown_energy_starts(task, machine_windows, energy_usage_calculator, max_start_mode):
+    min_brown_energy_starts = {}
+
+    for _, window in machine_windows:
+        if window in min_brown_energy_starts:
+            continue
+
+        # Schedule each task when it uses less brown energy as early as possible
+        start, end = window
+        green_power_available = energy_usage_calculator.get_green_power_available_between(start, end)
+        min_brown_energy_starts[window] = find_min_brown_energy_start(task, start, end, green_power_available, max_start_mode=max_start_mode)
+
+    return min_brown_energy_starts
+
+
 def _is_better(brown_energy, smallest_brown_energy, start_time, selected_start_time, max_start_mode):
     if brown_energy < smallest_brown_energy:
         return True
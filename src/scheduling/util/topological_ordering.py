@@ -9,12 +9,59 @@ def _calculate_upward_rank_recursive(task, current_rank, ranks):
                 _calculate_upward_rank_recursive(successor, current_rank + 1, ranks)
 
 
-def calculate_upward_rank(graph):
+def calculate_upward_rank_recursive(graph):
     ranks = {}
     _calculate_upward_rank_recursive(graph.get_first_task(), 0, ranks)
     return ranks
 
 
+def calculate_upward_rank(graph):
+    """
+    The rank of a task is the length (in number of dependencies) of the longest path from the first task to it. The
+    ranks are relaxed in topological order (reverse depth-first finishing order), so each dependency is visited once:
+    O(V + E) without recursion.
+
+    The tasks are added to the map in the same order of calculate_upward_rank_recursive (depth-first discovery
+    order), so sorting by rank breaks ties in the same way.
+
+    :return: a map task id -> rank of the tasks reachable from the first task
+    """
+    discovery_order, finishing_order = _depth_first_orders(graph.get_first_task())
+    ranks = dict.fromkeys((task.id for task in discovery_order), 0)
+
+    for task in reversed(finishing_order):
+        successor_rank = ranks[task.id] + 1
+        for successor in task.successors:
+            if ranks[successor.id] < successor_rank:
+                ranks[successor.id] = successor_rank
+
+    return ranks
+
+
+def _depth_first_orders(first_task):
+    """
+    :return: a tuple with the tasks reachable from first_task in depth-first discovery and finishing orders
+    """
+    discovery_order = [first_task]
+    finishing_order = []
+    discovered = {first_task.id}
+
+    stack = [(first_task, iter(first_task.successors))]
+    while stack:
+        task, successors = stack[-1]
+        for successor in successors:
+            if successor.id not in discovered:
+                discovered.add(successor.id)
+                discovery_order.append(successor)
+                stack.append((successor, iter(successor.successors)))
+                break
+        else:
+            stack.pop()
+            finishing_order.append(task)
+
+    return discovery_order, finishing_order
+
+
 def sort_topologically(graph, reverse=False):
     ranks = calculate_upward_rank(graph)
 
@@ -25,7 +72,7 @@ def sort_topologically(graph, reverse=False):
     return tasks
 
 def sort_topologically_scheduled_tasks(graph, schedule, reverse=False):
-    ranks = calculate_upward_rank(graph)
+    ranks = graph.analysis().upward_rank()
 
     def sort_criteria(d):
         task_id, rank = d
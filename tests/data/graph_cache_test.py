@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.data.graph_cache import GraphCache
+
+
+class GraphCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.cache = GraphCache(os.path.join(self.path, 'cache'))
+        self.parsed_files = []
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def _parse(self, task_file):
+        self.parsed_files.append(task_file)
+        with open(task_file) as f:
+            return {'values': np.array([int(value) for value in f.read().split()])}
+
+    def _write(self, name, text):
+        task_file = os.path.join(self.path, name)
+        os.makedirs(os.path.dirname(task_file), exist_ok=True)
+        with open(task_file, 'w') as f:
+            f.write(text)
+        return task_file
+
+    def test_file_is_parsed_once(self):
+        task_file = self._write('w.json', '1 2 3')
+
+        self.assertEqual([1, 2, 3], list(self.cache.load(task_file, self._parse)['values']))
+        self.assertEqual([1, 2, 3], list(self.cache.load(task_file, self._parse)['values']))
+        self.assertEqual([task_file], self.parsed_files)
+
+    def test_file_with_same_modification_time_and_size_is_not_hashed(self):
+        task_file = self._write('w.json', '1 2 3')
+        self.cache.load(task_file, self._parse)
+        stat = os.stat(task_file)
+
+        self._write('w.json', '4 5 6')
+        os.utime(task_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertEqual([1, 2, 3], list(self.cache.load(task_file, self._parse)['values']))
+        self.assertEqual(1, len(self.parsed_files))
+
+    def test_touched_file_with_same_content_is_not_parsed_again(self):
+        task_file = self._write('w.json', '1 2 3')
+        self.cache.load(task_file, self._parse)
+
+        stat = os.stat(task_file)
+        os.utime(task_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        self.assertEqual([1, 2, 3], list(self.cache.load(task_file, self._parse)['values']))
+        self.assertEqual([1, 2, 3], list(self.cache.load(task_file, self._parse)['values']))
+        self.assertEqual(1, len(self.parsed_files))
+
+    def test_changed_file_is_parsed_again(self):
+        task_file = self._write('w.json', '1 2 3')
+        self.cache.load(task_file, self._parse)
+
+        self._write('w.json', '4 5 6 7')
+
+        self.assertEqual([4, 5, 6, 7], list(self.cache.load(task_file, self._parse)['values']))
+        self.assertEqual(2, len(self.parsed_files))
+
+    def test_files_with_the_same_name_have_different_entries(self):
+        task_file_1 = self._write(os.path.join('a', 'w.json'), '1 2 3')
+        task_file_2 = self._write(os.path.join('b', 'w.json'), '4 5 6')
+
+        self.assertEqual([1, 2, 3], list(self.cache.load(task_file_1, self._parse)['values']))
+        self.assertEqual([4, 5, 6], list(self.cache.load(task_file_2, self._parse)['values']))
+        self.assertEqual([1, 2, 3], list(self.cache.load(task_file_1, self._parse)['values']))
+        self.assertEqual([4, 5, 6], list(self.cache.load(task_file_2, self._parse)['values']))
+        self.assertEqual(2, len(self.parsed_files))
@@ -0,0 +1,61 @@
+import io
+import json
+import random
+import unittest
+
+from src.data.json_stream import JsonStream
+
+
+def _random_value(rand, depth=0):
+    choice = rand.random()
+    if depth > 3 or choice < 0.3:
+        return rand.choice([1, -2.5e3, 123456789, 0.125, 'a"b\\é', '', True, False, None])
+    if choice < 0.65:
+        return [_random_value(rand, depth + 1) for _ in range(rand.randint(0, 4))]
+    return {f'key{i}': _random_value(rand, depth + 1) for i in range(rand.randint(0, 4))}
+
+
+def _read(stream):
+    """
+    Reads a value through iter_object and iter_array, instead of decoding it at once
+    """
+    char = stream._peek()
+    if char == '{':
+        return {key: _read(stream) for key in stream.iter_object()}
+    if char == '[':
+        return [_read(stream) for _ in stream.iter_array()]
+    return stream.read_value()
+
+
+class JsonStreamTest(unittest.TestCase):
+
+    def test_same_as_json_load(self):
+        rand = random.Random(0)
+        for _ in range(300):
+            document = _random_value(rand)
+            text = json.dumps(document, indent=rand.choice([None, 2]))
+
+            # Small chunks, so values are split between chunks
+            stream = JsonStream(io.StringIO(text), chunk_size=rand.randint(1, 5))
+            self.assertEqual(document, _read(stream))
+
+    def test_iter_items(self):
+        document = {
+            'name': 'workflow',
+            'workflow': {
+                'specification': {'tasks': [{'name': 'a'}, {'name': 'b'}], 'files': [{'id': 'f'}]},
+                'execution': {'makespan': 12.5, 'tasks': [{'id': 'a'}]},
+            },
+        }
+        paths = [('workflow', 'execution', 'tasks'), ('workflow', 'specification', 'tasks')]
+
+        items = list(JsonStream(io.StringIO(json.dumps(document)), chunk_size=3).iter_items(paths))
+        self.assertEqual([
+            (paths[1], {'name': 'a'}),
+            (paths[1], {'name': 'b'}),
+            (paths[0], {'id': 'a'}),
+        ], items)
+
+    def test_invalid_document(self):
+        stream = JsonStream(io.StringIO('{"tasks": [1, 2'))
+        self.assertRaises(Exception, lambda: list(stream.iter_items([('tasks',)])))
@@ -0,0 +1,57 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.data.photovolta import PhotovoltaReader, CACHE_DIRECTORY, TRACE_FILES
+
+PHOTOVOLTA_PATH = Path(__file__).parents[2] / 'resources' / 'photovolta'
+
+
+class PhotovoltaReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.path, 'photovolta'))
+        shutil.copy(PHOTOVOLTA_PATH / TRACE_FILES[1], os.path.join(self.path, 'photovolta'))
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_cached_trace_is_the_same_trace(self):
+        expected = PhotovoltaReader(self.path, use_cache=False).get_trace_1(size=30)
+
+        self.assertEqual(expected, PhotovoltaReader(self.path).get_trace_1(size=30))
+        self.assertTrue(os.listdir(os.path.join(self.path, 'photovolta', CACHE_DIRECTORY)))
+        self.assertEqual(expected, PhotovoltaReader(self.path).get_trace_1(size=30))
+
+    def test_scale_without_reading_again(self):
+        expected = PhotovoltaReader(self.path, use_cache=False).get_trace_1(size=10)
+
+        reader = PhotovoltaReader(self.path)
+        reader.get_trace_1(size=1)
+
+        os.remove(os.path.join(self.path, 'photovolta', TRACE_FILES[1]))
+        self.assertEqual(expected, reader.get_trace_1(size=10))
+
+    def test_power_series(self):
+        reader = PhotovoltaReader(self.path)
+        trace = reader.get_trace_1(size=2)
+
+        power_series = reader.get_power_series(1, size=2)
+        self.assertEqual(300, power_series.interval_length)
+        self.assertEqual(trace, power_series.green_power_list)
+
+        # Intervals of 600 seconds: mean of two samples
+        power_series = reader.get_power_series(1, size=2, interval_length=600)
+        self.assertEqual(len(trace) // 2, len(power_series.green_power_list))
+        self.assertAlmostEqual((trace[10] + trace[11]) / 2, power_series.green_power_list[5], delta=1)
+
+        # Intervals of 100 seconds: each sample three times
+        power_series = reader.get_power_series(1, size=2, interval_length=100)
+        self.assertEqual(3 * len(trace), len(power_series.green_power_list))
+        self.assertEqual([trace[7]] * 3, power_series.green_power_list[21:24])
+
+    def test_invalid_trace(self):
+        self.assertRaises(Exception, lambda: PhotovoltaReader(self.path).get_power_series(6))
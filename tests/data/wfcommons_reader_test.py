@@ -0,0 +1,103 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.data.graph_cache import CACHE_DIRECTORY
+from src.data.wfcommons_reader import WfCommonsWorkflowReader, WfCommonsRealWorkflowReader
+
+SANITY_TEST_WORKFLOWS = Path(__file__).parent / '..' / 'resources' / 'sanity_test_workflows'
+REAL_TRACES = Path(__file__).parents[2] / 'resources' / 'wfcommons' / 'real_traces'
+NUM_TASKS = 110
+RUNTIME_FACTOR = 1
+
+
+def _structure(graph):
+    return [
+        (task.id, task.runtime, task.power, [t.id for t in task.successors], [t.id for t in task.predecessors])
+        for task in graph.list_of_tasks()
+    ]
+
+
+class WfCommonsWorkflowReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        for workflow_file in SANITY_TEST_WORKFLOWS.glob('*.json'):
+            shutil.copy(workflow_file, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def _read_montage(self, reader, seed):
+        rand = random.Random(seed)
+        return reader.read_montage_workflow(NUM_TASKS, RUNTIME_FACTOR, lambda: rand.uniform(1, 5))
+
+    def test_cached_graph_is_the_same_graph(self):
+        expected = self._read_montage(WfCommonsWorkflowReader(self.path, use_cache=False), seed=1)
+
+        reader = WfCommonsWorkflowReader(self.path)
+        self.assertEqual(_structure(expected), _structure(self._read_montage(reader, seed=1)))
+        self.assertTrue(os.listdir(os.path.join(self.path, CACHE_DIRECTORY)))
+        self.assertEqual(_structure(expected), _structure(self._read_montage(reader, seed=1)))
+
+    def test_cache_path(self):
+        cache_path = os.path.join(self.path, 'cache')
+        expected = self._read_montage(WfCommonsWorkflowReader(self.path, use_cache=False), seed=1)
+
+        reader = WfCommonsWorkflowReader(self.path, cache_path=cache_path)
+        self.assertEqual(_structure(expected), _structure(self._read_montage(reader, seed=1)))
+        self.assertTrue(os.listdir(cache_path))
+        self.assertFalse(os.path.exists(os.path.join(self.path, CACHE_DIRECTORY)))
+
+    def test_powers_are_drawn_on_each_read(self):
+        reader = WfCommonsWorkflowReader(self.path)
+
+        graph_1 = self._read_montage(reader, seed=1)
+        graph_2 = self._read_montage(reader, seed=2)
+        self.assertNotEqual([t.power for t in graph_1.list_of_tasks()], [t.power for t in graph_2.list_of_tasks()])
+
+    def test_changed_file_is_parsed_again(self):
+        reader = WfCommonsWorkflowReader(self.path)
+        self._read_montage(reader, seed=1)
+
+        montage_file = os.path.join(self.path, 'montage-workflow-t110-r10.json')
+        shutil.copy(os.path.join(self.path, 'blast-workflow-t110-r10.json'), montage_file)
+
+        expected = self._read_montage(WfCommonsWorkflowReader(self.path, use_cache=False), seed=1)
+        self.assertEqual(_structure(expected), _structure(self._read_montage(reader, seed=1)))
+
+    def test_cache_entry_is_removed_when_index_changes(self):
+        shutil.copy(os.path.join(self.path, 'montage-workflow-t110-r10.json'),
+                    os.path.join(self.path, 'montage-workflow-t110-r10_i0.json'))
+        cache_path = os.path.join(self.path, CACHE_DIRECTORY)
+        reader = WfCommonsWorkflowReader(self.path)
+
+        rand = random.Random(1)
+        expected = reader.read_montage_workflow(NUM_TASKS, RUNTIME_FACTOR, lambda: rand.uniform(1, 5), 0)
+        self.assertEqual(1, len(os.listdir(cache_path)))
+
+        reader.change_index_montage_workflow(NUM_TASKS, RUNTIME_FACTOR, 0, 1)
+        self.assertEqual([], os.listdir(cache_path))
+
+        rand = random.Random(1)
+        graph = reader.read_montage_workflow(NUM_TASKS, RUNTIME_FACTOR, lambda: rand.uniform(1, 5), 1)
+        self.assertEqual(_structure(expected), _structure(graph))
+        self.assertEqual(1, len(os.listdir(cache_path)))
+
+
+class WfCommonsRealWorkflowReaderTest(unittest.TestCase):
+
+    def test_streaming_builds_the_same_graph(self):
+        reader = WfCommonsRealWorkflowReader(REAL_TRACES, use_cache=False)
+        streaming_reader = WfCommonsRealWorkflowReader(REAL_TRACES, use_cache=False, streaming=True)
+
+        for read in ('get_blast', 'get_srasearch'):
+            rand = random.Random(1)
+            expected = getattr(reader, read)(lambda: rand.uniform(1, 5))
+            rand = random.Random(1)
+            graph = getattr(streaming_reader, read)(lambda: rand.uniform(1, 5))
+
+            self.assertEqual(_structure(expected), _structure(graph))
@@ -0,0 +1,96 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.data import wfcommons_reader
+from src.data.workflow_parquet_reader import WorkflowTraceArchiveReader, _create_graph
+
+TRACE = 'small_workflow_parquet'
+MIN_POWER = 1
+MAX_POWER = 5
+
+# (id, runtime in seconds, parents, children). Every task has its own category in the JSON file, because the JSON reader
+# draws one power per category and the parquet reader draws one per task.
+TASKS = [
+    (1, 10, [], [2, 3]),
+    (2, 20, [1], [4]),
+    (3, 30, [1], [4]),
+    (4, 40, [2, 3, 5], []),
+    (5, 50, [], [4]),
+]
+
+
+def _write_json(path):
+    tasks = [
+        {
+            'name': str(task_id),
+            'runtimeInSeconds': runtime,
+            'category': f'category_{task_id}',
+            'parents': [str(parent) for parent in parents],
+            'children': [str(child) for child in children],
+        }
+        for task_id, runtime, parents, children in TASKS
+    ]
+    with open(path, 'w') as f:
+        json.dump({'workflow': {'tasks': tasks}}, f)
+
+
+def _write_parquet(path):
+    os.makedirs(os.path.dirname(path))
+    table = pa.table({
+        'id': pa.array([task_id for task_id, _, _, _ in TASKS], type=pa.int64()),
+        'runtime': pa.array([runtime * 1000 for _, runtime, _, _ in TASKS], type=pa.int64()),  # milliseconds
+        'parents': pa.array([parents for _, _, parents, _ in TASKS], type=pa.list_(pa.int64())),
+        'children': pa.array([children for _, _, _, children in TASKS], type=pa.list_(pa.int64())),
+    })
+    pq.write_table(table, path)
+
+
+def _structure(graph):
+    # The ids are compared as strings, since the JSON reader uses the task names and the parquet reader the task ids.
+    # The dummy start task is left out, as each reader gives it a different runtime.
+    return [
+        (str(task.id), task.runtime, task.power, sorted(str(t.id) for t in task.successors),
+         sorted(str(t.id) for t in task.predecessors))
+        for task in graph.list_of_tasks() if task.id != graph.start_task_id
+    ]
+
+
+class WorkflowTraceArchiveReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.reader = WorkflowTraceArchiveReader(self.path, MIN_POWER, MAX_POWER)
+        self.json_file = os.path.join(self.path, 'small-workflow.json')
+        _write_json(self.json_file)
+        _write_parquet(self.reader.get_path(TRACE))
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def _read_json(self, seed):
+        rng = np.random.default_rng(seed)
+        return wfcommons_reader._create_graph(self.json_file, lambda: rng.uniform(MIN_POWER, MAX_POWER))
+
+    def _read_parquet(self, seed):
+        self.reader.set_seed(seed)
+        return _create_graph(self.reader.get_path(TRACE), MIN_POWER, MAX_POWER, self.reader.rng)
+
+    def test_json_and_parquet_readers_create_the_same_graph(self):
+        for seed in (1, 2):
+            with self.subTest(seed=seed):
+                json_graph = self._read_json(seed)
+                parquet_graph = self._read_parquet(seed)
+
+                self.assertEqual(len(TASKS), len(_structure(parquet_graph)))
+                self.assertEqual(_structure(json_graph), _structure(parquet_graph))
+                self.assertEqual(
+                    sorted(str(t.id) for t in json_graph.get_first_task().successors),
+                    sorted(str(t.id) for t in parquet_graph.get_first_task().successors)
+                )
@@ -0,0 +1,122 @@
+import functools
+import os
+import signal
+import tempfile
+import threading
+import time
+import unittest
+from multiprocessing import shared_memory
+
+from src.experiments.main.run_experiments import schedule_and_report, experiment_key, create_cluster, limit_reports, \
+    run_sweep
+from src.experiments.shared.ParallelExperimentExecutor import ParallelExperimentExecutor
+from src.experiments.shared.result_cache import ResultCache
+from src.experiments.shared.shared_memory_data import SharedList
+from tests.scheduling.graph_utils import get_stencil_graph
+
+
+def _sum_after(seconds, shared_list):
+    time.sleep(seconds)
+    return [{'value': sum(shared_list.get())}]
+
+
+class RunExperimentsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.result_cache = ResultCache(self.directory.name)
+
+        self.graph = get_stencil_graph()
+        self.green_power = [0, 10, 20, 30, 20, 10, 0] * 10
+        self.cluster_factory = functools.partial(create_cluster, 1, 4, self.green_power, 5)
+
+    def tearDown(self):
+        self.result_cache.close()
+        self.directory.cleanup()
+
+    def _schedule_and_report(self, shift_mode='right-left', result_cache=None):
+        return schedule_and_report(self.graph, self.green_power, 5, 40, 2, 'energy', 'single', self.cluster_factory,
+                                   shift_mode=shift_mode, c=0.5, result_cache=result_cache)
+
+    def test_report_is_saved_in_cache(self):
+        report = self._schedule_and_report(result_cache=self.result_cache)
+
+        self.assertEqual(report, self._schedule_and_report())
+        self.assertEqual(1, len(self.result_cache))
+        self._schedule_and_report(shift_mode='left', result_cache=self.result_cache)
+        self.assertEqual(2, len(self.result_cache))
+
+    def test_cached_report_is_used(self):
+        key = experiment_key(self.graph, self.cluster_factory(), self.green_power, 5, 40, 2, 'energy', 'single',
+                             'right-left', 0.5)
+        self.result_cache.put(key, {'makespan': -1})
+
+        self.assertEqual({'makespan': -1}, self._schedule_and_report(result_cache=self.result_cache))
+        self.assertNotEqual({'makespan': -1}, self._schedule_and_report(shift_mode='left',
+                                                                        result_cache=self.result_cache))
+
+    def test_pooled_cluster_gives_same_report(self):
+        pooled_cluster_factory = functools.partial(create_cluster, 1, 4, self.green_power, 5, use_pools=True)
+        report = schedule_and_report(self.graph, self.green_power, 5, 40, 2, 'energy', 'single',
+                                     pooled_cluster_factory, c=0.5)
+
+        # The schedule is resolved to the machines of the pool, so it has the same hash
+        self.assertEqual(self._schedule_and_report(), report)
+
+    def test_scheduling_hash_is_deterministic(self):
+        self.assertEqual(self._schedule_and_report()['scheduling_hash'],
+                         self._schedule_and_report()['scheduling_hash'])
+        self.assertEqual(64, len(self._schedule_and_report()['scheduling_hash']))
+
+    def test_limit_reports(self):
+        headers = ['job_number', 'experiment', 'shift_mode', 'deadline_factor', 'deadline', 'min_makespan', 'makespan',
+                   'status']
+        experiment_parameters = {
+            'min_makespan': 40, 'shift_modes': ['left', 'right-left'], 'deadline_factors': [2, 4], 'c_values': [0.5],
+            'task_ordering_criterias': ['energy'], 'iteration': 0, 'power_distribution': 'uniform',
+            'boundary_strategy': 'single',
+        }
+        metadata = {'prefix': 'stencil', 'job_number': 3}
+
+        reports = limit_reports(headers, experiment_parameters, metadata, {'workflow': 'stencil'}, 'timeout')
+
+        self.assertEqual(['J3_E1', 'J3_E2', 'J3_E3', 'J3_E4'], [report['experiment'] for report in reports])
+        self.assertEqual([80, 160, 80, 160], [report['deadline'] for report in reports])
+        self.assertTrue(all(report['status'] == 'timeout' and report['makespan'] is None for report in reports))
+        self.assertTrue(all(set(headers) <= set(report) for report in reports))
+
+    def test_interrupted_sweep_cancels_pending_jobs(self):
+        reports = []
+        executor = ParallelExperimentExecutor(reports.extend, max_workers=2, max_pending=10)
+        shared_list = SharedList([1, 2, 3])
+
+        def submit_jobs():
+            for _ in range(6):
+                executor.run_experiment_async(_sum_after, 60, shared_list)
+            # Ctrl-C while the sweep waits for its jobs
+            threading.Timer(0.5, os.kill, (os.getpid(), signal.SIGINT)).start()
+
+        start_time = time.monotonic()
+        with self.assertRaises(KeyboardInterrupt):
+            run_sweep(executor, submit_jobs, lambda: [shared_list])
+
+        self.assertLess(time.monotonic() - start_time, 30)
+        self.assertEqual([], reports)
+        self.assertEqual([], executor.workers)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=shared_list.name)
+
+    def test_sweep_waits_for_all_jobs(self):
+        reports = []
+        executor = ParallelExperimentExecutor(reports.extend, max_workers=2)
+        shared_list = SharedList([1, 2, 3])
+
+        def submit_jobs():
+            for _ in range(4):
+                executor.run_experiment_async(_sum_after, 0, shared_list)
+
+        run_sweep(executor, submit_jobs, lambda: [shared_list])
+
+        self.assertEqual([6] * 4, [report['value'] for report in reports])
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=shared_list.name)
@@ -0,0 +1,74 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from src.experiments.shared.experiment_checkpoint import ExperimentCheckpoint, FINISHED_JOBS_FILE
+
+HEADERS = ['job_number', 'experiment', 'makespan']
+JOBS = {1: {'workflow': 'blast'}, 2: {'workflow': 'bwa'}, 3: {'workflow': 'cycles'}}
+
+
+def _reports(job_number):
+    return [{'job_number': job_number, 'experiment': f'J{job_number}_E{i}', 'makespan': 10 * i} for i in range(1, 3)]
+
+
+class ExperimentCheckpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.report_file = os.path.join(self.directory.name, 'report.csv')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _start(self, jobs=None):
+        checkpoint = ExperimentCheckpoint(self.directory.name, self.report_file, HEADERS)
+        checkpoint.start(jobs if jobs is not None else JOBS)
+        return checkpoint
+
+    def _read_rows(self):
+        with open(self.report_file, newline='') as f:
+            return list(csv.reader(f))
+
+    def test_new_sweep(self):
+        checkpoint = self._start()
+        checkpoint.save_job_reports(2, _reports(2))
+
+        self.assertTrue(checkpoint.is_finished(2))
+        self.assertFalse(checkpoint.is_finished(1))
+        self.assertEqual([HEADERS, ['2', 'J2_E1', '10'], ['2', 'J2_E2', '20']], self._read_rows())
+
+    def test_resume(self):
+        checkpoint = self._start()
+        checkpoint.save_job_reports(2, _reports(2))
+        checkpoint.save_job_reports(1, _reports(1))
+
+        checkpoint = self._start()
+        self.assertEqual({1, 2}, checkpoint.finished_jobs)
+
+        checkpoint.save_job_reports(3, _reports(3))
+        self.assertEqual([HEADERS] + [[str(r[h]) for h in HEADERS] for j in [2, 1, 3] for r in _reports(j)],
+                         self._read_rows())
+
+    def test_reports_of_unfinished_job_are_removed(self):
+        checkpoint = self._start()
+        checkpoint.save_job_reports(1, _reports(1))
+
+        # Stopped while the reports of the job 2 and its marker were written
+        with open(self.report_file, 'a') as f:
+            f.write('2,J2_E1,10\r\n2,J2_')
+        with open(os.path.join(self.directory.name, FINISHED_JOBS_FILE), 'a') as f:
+            f.write('{"job": 2, "rep')
+
+        checkpoint = self._start()
+        self.assertEqual({1}, checkpoint.finished_jobs)
+        self.assertEqual(3, len(self._read_rows()))
+
+        checkpoint.save_job_reports(2, _reports(2))
+        self.assertEqual({1, 2}, self._start().finished_jobs)
+        self.assertEqual(5, len(self._read_rows()))
+
+    def test_different_jobs_cannot_be_resumed(self):
+        self._start()
+        self.assertRaises(Exception, lambda: self._start({1: {'workflow': 'blast'}}))
@@ -0,0 +1,221 @@
+import os
+import tempfile
+import time
+import unittest
+
+from src.experiments.shared.ParallelExperimentExecutor import ParallelExperimentExecutor, TIME_LIMIT, MEMORY_LIMIT, \
+    _rss, _Worker
+
+
+def _square(x):
+    return [{'value': x * x, 'pid': os.getpid()}]
+
+
+def _fail(x):
+    raise Exception(f'experiment {x} failed')
+
+
+def _sleep(x):
+    time.sleep(x)
+    return [{'value': x}]
+
+
+def _sleep_first_time(path):
+    if not os.path.exists(path):
+        open(path, 'w').close()
+        time.sleep(60)
+    return [{'value': path}]
+
+
+def _allocate(megabytes):
+    memory = b'x' * (megabytes * 1024 ** 2)
+    time.sleep(60)
+    return [{'value': len(memory)}]
+
+
+def _exit(x):
+    os._exit(1)
+
+
+def _unpicklable_report(x):
+    return [{'value': lambda: x}]
+
+
+class ParallelExperimentExecutorTest(unittest.TestCase):
+
+    def _run(self, experiments, **kwargs):
+        reports = []
+        executor = ParallelExperimentExecutor(reports.extend, **kwargs)
+        executor.start()
+        for experiment, x in experiments:
+            executor.run_experiment_async(experiment, x)
+        self.failed_experiments = executor.stop()
+        return reports
+
+    def test_all_reports_are_saved(self):
+        reports = self._run([(_square, x) for x in range(50)], max_workers=4, max_pending=2)
+
+        self.assertEqual(sorted(x * x for x in range(50)), sorted(report['value'] for report in reports))
+        self.assertTrue(len({report['pid'] for report in reports}) <= 4)
+        self.assertNotIn(os.getpid(), {report['pid'] for report in reports})
+
+    def test_chunks(self):
+        reports = self._run([(_square, x) for x in range(11)], max_workers=2, chunk_size=4)
+        self.assertEqual(sorted(x * x for x in range(11)), sorted(report['value'] for report in reports))
+
+    def test_failed_experiment_does_not_block(self):
+        reports = self._run([(_square, 1), (_fail, 2), (_square, 3)], max_workers=2)
+        self.assertEqual([1, 9], sorted(report['value'] for report in reports))
+        self.assertEqual(1, self.failed_experiments)
+
+    def test_dead_worker_is_replaced(self):
+        reports = self._run([(_square, 1), (_exit, 2), (_square, 3), (_exit, 4), (_square, 5)], max_workers=2)
+
+        self.assertEqual([1, 9, 25], sorted(report['value'] for report in reports))
+        self.assertEqual(2, self.failed_experiments)
+
+    def test_experiments_of_dead_worker_chunk_fail(self):
+        reports = self._run([(_exit, 1), (_square, 2), (_square, 3), (_square, 4)], max_workers=1, chunk_size=2)
+
+        self.assertEqual([9, 16], sorted(report['value'] for report in reports))
+        self.assertEqual(2, self.failed_experiments)
+
+    def test_report_that_cannot_be_pickled_fails(self):
+        reports = self._run([(_unpicklable_report, 1), (_square, 2)], max_workers=2)
+
+        self.assertEqual([4], [report['value'] for report in reports])
+        self.assertEqual(1, self.failed_experiments)
+
+    def test_wait_all(self):
+        reports = []
+        executor = ParallelExperimentExecutor(reports.extend, max_workers=2)
+        executor.start()
+
+        for x in range(5):
+            executor.run_experiment_async(_square, x)
+        executor.wait_all()
+        self.assertEqual(5, len(reports))
+
+        executor.run_experiment_async(_square, 5)
+        executor.stop()
+        self.assertEqual(6, len(reports))
+
+    def test_higher_priority_first(self):
+        reports = []
+        executor = ParallelExperimentExecutor(reports.extend, max_workers=1, max_pending=10)
+        executor.start()
+
+        # The first one keeps the worker busy while the others are submitted
+        executor.run_experiment_async(_sleep, 0.5)
+        for x, priority in [(1, 1), (2, 3), (3, 2), (4, 3)]:
+            executor.run_experiment_async(_square, x, priority=priority)
+        executor.stop()
+
+        self.assertEqual([0.5, 4, 16, 9, 1], [report['value'] for report in reports])
+
+    def test_on_finished(self):
+        reports = []
+        finished = []
+        executor = ParallelExperimentExecutor(reports.extend, max_workers=2)
+        executor.start()
+
+        executor.run_experiment_async(_square, 2, on_finished=finished.append)
+        executor.run_experiment_async(_fail, 3, on_finished=finished.append)
+        executor.run_experiment_async(_square, 4)
+        self.assertEqual(1, executor.stop())
+
+        self.assertEqual([16], [report['value'] for report in reports])
+        values = [[report['value'] for report in result] if result is not None else None for result in finished]
+        self.assertCountEqual([[4], None], values)
+
+    def test_experiments_submitted_by_callbacks(self):
+        reports = []
+        executor = ParallelExperimentExecutor(reports.extend, max_workers=2, max_pending=1)
+
+        def submit_next(report):
+            reports.extend(report)
+            if report[0]['value'] < 10 ** 8:
+                executor.run_experiment_async(_square, report[0]['value'], on_finished=submit_next)
+
+        executor.start()
+        for x in [2, 3]:
+            executor.run_experiment_async(_square, x, on_finished=submit_next)
+        executor.stop()
+
+        self.assertEqual([4, 9, 16, 81, 256, 6561, 65536, 43046721, 4294967296, 1853020188851841],
+                         sorted(report['value'] for report in reports))
+
+    def test_terminate_cancels_pending_experiments(self):
+        reports = []
+        executor = ParallelExperimentExecutor(reports.extend, max_workers=2, max_pending=10)
+        executor.start()
+
+        start_time = time.monotonic()
+        for _ in range(6):
+            executor.run_experiment_async(_sleep, 60)
+        self.assertEqual(6, executor.terminate())
+
+        self.assertEqual([], reports)
+        self.assertEqual([], executor.workers)
+        self.assertLess(time.monotonic() - start_time, 30)
+        executor.wait_all()
+        with self.assertRaises(Exception):
+            executor.run_experiment_async(_square, 2)
+
+    def _run_with_limits(self, experiments, **kwargs):
+        reports = []
+        executor = ParallelExperimentExecutor(reports.extend, **kwargs)
+        executor.start()
+        for experiment, x in experiments:
+            executor.run_experiment_async(experiment, x, limit_report=lambda limit: [{'value': limit}])
+        self.failed_experiments = executor.stop()
+        return reports
+
+    def test_time_limit(self):
+        start_time = time.monotonic()
+        reports = self._run_with_limits([(_sleep, 60), (_square, 2)], max_workers=1, chunk_size=2, time_limit=0.5)
+
+        self.assertEqual([TIME_LIMIT, 4], [report['value'] for report in reports])
+        self.assertEqual(0, self.failed_experiments)
+        self.assertLess(time.monotonic() - start_time, 30)
+
+    def test_memory_limit(self):
+        # The workers are forked, so they start with the memory of this process
+        memory_limit = _rss(os.getpid()) + 100 * 1024 ** 2
+        reports = self._run_with_limits([(_allocate, 200), (_square, 2)], max_workers=2, memory_limit=memory_limit)
+
+        self.assertCountEqual([MEMORY_LIMIT, 4], [report['value'] for report in reports])
+        self.assertEqual(0, self.failed_experiments)
+
+    def test_experiment_finished_before_limit_is_enforced_is_not_exceeded(self):
+        reports = []
+        executor = ParallelExperimentExecutor(reports.extend, max_workers=1, time_limit=0.5)
+        # Without start(), so the reports are only read by this test
+        executor.workers = [_Worker()]
+        worker = executor.workers[0]
+
+        executor.run_experiment_async(_sleep, 1)
+        executor._handle_result(*worker.reports_connection.recv())
+        # The experiment exceeds the limit, but its report is waiting in the pipe when the limit is enforced
+        time.sleep(2)
+
+        self.assertEqual([], executor._enforce_limits())
+        self.assertEqual([1], [report['value'] for report in reports])
+        self.assertIs(worker, executor.workers[0])
+        self.assertTrue(worker.process.is_alive())
+        executor.terminate()
+
+    def test_experiment_exceeding_limit_without_limit_report_fails(self):
+        reports = self._run([(_sleep, 60), (_square, 2)], max_workers=1, time_limit=0.5)
+
+        self.assertEqual([4], [report['value'] for report in reports])
+        self.assertEqual(1, self.failed_experiments)
+
+    def test_experiment_exceeding_limit_is_retried_last(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'started')
+            reports = self._run_with_limits([(_sleep_first_time, path), (_square, 2), (_square, 3)], max_workers=1,
+                                            max_pending=10, time_limit=0.5, max_retries=1)
+
+        self.assertEqual([4, 9, path], [report['value'] for report in reports])
+        self.assertEqual(0, self.failed_experiments)
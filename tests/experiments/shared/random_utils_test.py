@@ -0,0 +1,27 @@
+import pickle
+import random
+import unittest
+
+from src.experiments.shared.random_utils import RandomProvider
+
+
+class RandomProviderTest(unittest.TestCase):
+
+    def test_derived_values_do_not_depend_on_previous_values(self):
+        random_provider = RandomProvider(42, 1, 5)
+        expected = random_provider.derive('blast_0').random_uniform()
+
+        random_provider = RandomProvider(42, 1, 5)
+        random_provider.random_uniform()
+        random.random()
+        derived = random_provider.derive('blast_0')
+
+        self.assertEqual(expected, derived.random_uniform())
+        self.assertNotEqual(expected, random_provider.derive('blast_1').random_uniform())
+
+    def test_derived_provider_can_be_pickled(self):
+        derived = RandomProvider(42, 1, 5).derive('bwa_3')
+        copy = pickle.loads(pickle.dumps(derived))
+
+        self.assertEqual([derived.random_gauss() for _ in range(5)], [copy.random_gauss() for _ in range(5)])
+        self.assertTrue(all(1 <= copy.random_uniform() <= 5 for _ in range(100)))
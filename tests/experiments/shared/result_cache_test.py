@@ -0,0 +1,55 @@
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.experiments.shared.ParallelExperimentExecutor import ParallelExperimentExecutor
+from src.experiments.shared.result_cache import ResultCache
+
+
+def _put(result_cache, key):
+    result_cache.put(key, {'key': key})
+    return [result_cache.get(key)]
+
+
+class ResultCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.result_cache = ResultCache(self.directory.name)
+
+    def tearDown(self):
+        self.result_cache.close()
+        self.directory.cleanup()
+
+    def test_get_and_put(self):
+        self.assertIsNone(self.result_cache.get('a'))
+
+        self.result_cache.put('a', {'makespan': 10, 'total_energy': 2.5, 'max_active_tasks': np.int64(3)})
+        self.assertEqual({'makespan': 10, 'total_energy': 2.5, 'max_active_tasks': 3}, self.result_cache.get('a'))
+
+        self.result_cache.put('a', {'makespan': 11})
+        self.assertEqual({'makespan': 11}, self.result_cache.get('a'))
+        self.assertEqual(1, len(self.result_cache))
+
+    def test_reports_are_kept_after_closing(self):
+        self.result_cache.put('a', {'makespan': 10})
+        self.result_cache.close()
+
+        self.assertEqual({'makespan': 10}, ResultCache(self.directory.name).get('a'))
+
+    def test_shared_by_workers(self):
+        self.result_cache.put('before', {'key': 'before'})
+        self.assertLess(len(pickle.dumps(self.result_cache)), 500)
+
+        reports = []
+        executor = ParallelExperimentExecutor(reports.extend, max_workers=3)
+        executor.start()
+        for i in range(12):
+            executor.run_experiment_async(_put, self.result_cache, f'k{i}')
+        executor.stop()
+
+        self.assertEqual(sorted(f'k{i}' for i in range(12)), sorted(report['key'] for report in reports))
+        self.assertEqual(13, len(self.result_cache))
+        self.assertEqual({'key': 'k5'}, self.result_cache.get('k5'))
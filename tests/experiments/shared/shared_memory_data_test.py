@@ -0,0 +1,101 @@
+import pickle
+import subprocess
+import sys
+import unittest
+
+from src.experiments.shared.ParallelExperimentExecutor import ParallelExperimentExecutor
+from src.experiments.shared.shared_memory_data import SharedTaskGraph, SharedList
+from src.scheduling.model.task_graph import TaskGraph
+from tests.scheduling.graph_utils import get_stencil_graph
+
+# Fresh interpreter in which the workers are started before the shared memory is created
+_SHARED_AFTER_WORKERS = '''
+from src.experiments.shared.ParallelExperimentExecutor import ParallelExperimentExecutor
+from src.experiments.shared.shared_memory_data import SharedList
+from tests.experiments.shared.shared_memory_data_test import _read_list
+
+reports = []
+executor = ParallelExperimentExecutor(reports.extend, max_workers=2)
+executor.start()
+shared_list = SharedList([1, 2, 3])
+for _ in range(4):
+    executor.run_experiment_async(_read_list, shared_list)
+executor.stop()
+shared_list.close()
+print(reports)
+'''
+
+
+def _read_list(shared_list):
+    return [shared_list.get()]
+
+
+def _structure(graph):
+    return graph.start_task_id, [
+        (task.id, task.runtime, task.power, [t.id for t in task.successors], [t.id for t in task.predecessors])
+        for task in graph.list_of_tasks()
+    ]
+
+
+def _read_shared(shared_graph, shared_list):
+    return [(_structure(shared_graph.get()), shared_list.get())]
+
+
+class SharedMemoryDataTest(unittest.TestCase):
+
+    def test_graph(self):
+        graph = get_stencil_graph()
+        shared_graph = SharedTaskGraph(graph)
+        try:
+            copy = pickle.loads(pickle.dumps(shared_graph))
+            self.assertEqual(_structure(graph), _structure(copy.get()))
+            self.assertIs(copy.get(), copy.get())
+        finally:
+            shared_graph.close()
+
+    def test_graph_with_string_ids(self):
+        graph = TaskGraph()
+        graph.add_new_task('0', 1, 0)
+        graph.add_new_task('task_1', 10, 2.5)
+        graph.create_dependency('0', 'task_1')
+        graph.set_start_task('0')
+
+        shared_graph = SharedTaskGraph(graph)
+        try:
+            self.assertEqual(_structure(graph), _structure(pickle.loads(pickle.dumps(shared_graph)).get()))
+        finally:
+            shared_graph.close()
+
+    def test_workers_read_shared_memory(self):
+        graph = get_stencil_graph()
+        green_power = [0, 10, 25, 40, 25, 10, 0] * 1000
+
+        shared_graph = SharedTaskGraph(graph)
+        shared_list = SharedList(green_power)
+        self.assertLess(len(pickle.dumps(shared_list)), 1000)
+
+        reports = []
+        executor = ParallelExperimentExecutor(reports.extend, max_workers=2)
+        executor.start()
+        for _ in range(4):
+            executor.run_experiment_async(_read_shared, shared_graph, shared_list)
+        executor.stop()
+
+        shared_graph.close()
+        shared_list.close()
+
+        self.assertEqual([(_structure(graph), green_power)] * 4, reports)
+
+    def test_workers_do_not_unlink_shared_memory(self):
+        result = subprocess.run([sys.executable, '-c', _SHARED_AFTER_WORKERS], capture_output=True, text=True)
+
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertEqual('[[1, 2, 3], [1, 2, 3], [1, 2, 3], [1, 2, 3]]', result.stdout.strip())
+        self.assertEqual('', result.stderr)
+
+    def test_closed_value_cannot_be_read(self):
+        shared_list = SharedList([1, 2, 3])
+        copy = pickle.loads(pickle.dumps(shared_list))
+        shared_list.close()
+
+        self.assertRaises(FileNotFoundError, copy.get)
@@ -3,7 +3,7 @@ import math
 import random
 import unittest
 
-from src.scheduling.algorithms.bounded_boundary_search.bounded_boundary_search import bbs
+from src.scheduling.algorithms.bounded_boundary_search.bounded_boundary_search import bbs, bbs_placement, bbs_shift
 from src.scheduling.model.cluster import Cluster
 from src.scheduling.model.machine_factory import create_machines_with_target
 from src.scheduling.model.power_series import PowerSeries
@@ -54,6 +54,29 @@ class HighestPowerFirstSanityTest(unittest.TestCase):
                 violations = check(schedule, graph)
                 self.assertEqual(0, len(violations))
 
+    def test_placement_shared_across_shift_modes(self):
+        random.seed(15735667867885)
+        uniform = lambda: random.uniform(MIN_POWER, MAX_POWER)
+        workflow_providers = filter(lambda w: w[0] in ['soykb', 'seismology'], load_workflows())
+
+        for (name, workflow_provider), boundary_strategy, ordering in itertools.product(
+                workflow_providers, ['single', 'default', 'lpt'], ['energy', 'runtime']):
+            graph = workflow_provider(uniform)
+
+            random_state = random.getstate()
+            clusters, deadline = self._create_clusters(graph, 2)
+            placement = bbs_placement(graph, deadline, 0.5, clusters, task_sort=ordering, boundary_strategy=boundary_strategy)
+
+            # The right-left shift is repeated to check that the placement is restored after the other modes
+            for shift in ['right-left', 'none', 'left', 'right-left']:
+                with self.subTest(msg=f'{name}_{boundary_strategy}_{ordering}_{shift}'):
+                    random.setstate(random_state)
+                    clusters, deadline = self._create_clusters(graph, 2)
+                    expected = bbs(graph, deadline, 0.5, clusters, task_sort=ordering, shift_mode=shift,
+                                   boundary_strategy=boundary_strategy)
+
+                    self.assertEqual(expected, bbs_shift(placement, shift))
+
     def _create_clusters(self, graph, deadline_factor):
         critical_path_length = calc_critical_path_length(graph)
         machines = create_machines_with_target(graph, critical_path_length * deadline_factor, [124], 0.40)
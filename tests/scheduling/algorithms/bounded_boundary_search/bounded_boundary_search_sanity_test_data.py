@@ -26,7 +26,7 @@ def load_workflows():
     if not _are_workflows_generated():
         raise Exception('You first need to generate workflows for sanity test!')
 
-    wfcommons_reader = WfCommonsWorkflowReader(PATH)
+    wfcommons_reader = WfCommonsWorkflowReader(PATH, use_cache=False)
 
     workflow_providers = [
         ('blast', lambda random_power: wfcommons_reader.read_blast_workflow(NUM_TASKS, RUNTIME_FACTOR, random_power)),
@@ -1,6 +1,7 @@
 import unittest
 
 from src.scheduling.energy.energy_usage_calculator import EnergyUsageCalculator
+from src.scheduling.energy.find_min_brown_energy import _slice_green_power_available_list
 from src.scheduling.model.task import Task
 from src.scheduling.model.task_graph import TaskGraph
 
@@ -158,3 +159,38 @@ class EnergyUsageCalculatorTest(unittest.TestCase):
         self.assertEqual(100, brown_energy_used)
         self.assertEqual(950, green_energy_not_used)
         self.assertEqual(150, total_energy)
+
+    def test_remove_task_restores_green_power_available(self):
+        green_energy = [0, 10, 20, 10, 0, 20, 40]
+        interval_size = 10
+
+        calculator = EnergyUsageCalculator(green_energy, interval_size)
+        expected_green_power_available = calculator.get_green_power_available()
+
+        task_1 = Task(1, runtime=13, power=7)
+        task_2 = Task(2, runtime=25, power=4)
+        calculator.add_scheduled_task(task_1, 5)
+        calculator.add_scheduled_task(task_2, 12)
+        calculator.remove_scheduled_task(task_1)
+        calculator.remove_scheduled_task(task_2)
+
+        self.assertEqual(expected_green_power_available, calculator.get_green_power_available())
+
+    def test_green_power_available_between(self):
+        green_energy = [0, 10, 20, 10, 0, 20, 40]
+        interval_size = 10
+
+        calculator = EnergyUsageCalculator(green_energy, interval_size)
+        calculator.add_scheduled_task(Task(1, runtime=10, power=10), 10)
+        calculator.add_scheduled_task(Task(2, runtime=7, power=10), 20)
+        calculator.add_scheduled_task(Task(3, runtime=4, power=5), 27)
+        calculator.add_scheduled_task(Task(4, runtime=1, power=10), 50)
+
+        green_power_available = calculator.get_green_power_available()
+
+        for start, end in [(0, 0), (0, 70), (0, 100), (5, 15), (10, 20), (22, 31), (27, 50), (51, 52), (69, 71), (80, 90)]:
+            with self.subTest(msg=f'[{start}, {end}]'):
+                self.assertEqual(
+                    _slice_green_power_available_list(green_power_available, start, end),
+                    _slice_green_power_available_list(calculator.get_green_power_available_between(start, end), start, end)
+                )
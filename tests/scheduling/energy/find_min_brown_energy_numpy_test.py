@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from src.scheduling.energy.energy_usage_calculator import EnergyUsageCalculator
+from src.scheduling.energy.find_min_brown_energy import find_min_brown_energy_start, BACKEND_PYTHON, BACKEND_NUMPY
+from src.scheduling.model.task import Task
+
+
+def _create_green_power_available(green_power, interval_size, scheduled_tasks):
+    calculator = EnergyUsageCalculator(green_power, interval_size)
+    for start_time, task in scheduled_tasks:
+        calculator.add_scheduled_task(task, start_time)
+    return calculator.get_green_power_available()
+
+
+def _assert_same_result(task, start, end, green_power_available, max_start_mode):
+    expected = find_min_brown_energy_start(task, start, end, green_power_available, max_start_mode=max_start_mode, backend=BACKEND_PYTHON)
+    result = find_min_brown_energy_start(task, start, end, green_power_available, max_start_mode=max_start_mode, backend=BACKEND_NUMPY)
+    assert result == expected
+
+
+@pytest.mark.parametrize('max_start_mode', [False, True])
+@pytest.mark.parametrize(
+    'start, end, green_power, green_interval_size, task, scheduled_tasks',
+    [
+        (0, 50, [0, 0, 0, 0, 0, 0], 10, Task(1, 17, 100), []),
+        (0, 100, [1, 4, 5, 0, 10, 0], 5, Task(1, 12, 9), []),
+        (0, 100, [5, 2, 5, 2], 10, Task(1, 10, 5), []),
+        (0, 100, [2, 0, 1, 2, 0], 10, Task(1, 1, 3), []),
+        (0, 100, [2, 0, 4, 5], 10, Task(1, 1, 5), []),
+        (0, 100, [1, 2, 3, 2, 1, 2, 3, 2], 2, Task(1, 5, 5), []),
+        (0, 100, [0, 0, 0, 0, 1, 0, 0], 2, Task(1, 3, 100), []),
+        (0, 100, [10, 15, 20, 30], 10, Task(1, 3, 31), [(0, Task(2, 40, 100))]),
+        (0, 100, [20, 10, 5, 5], 10, Task(1, 15, 10), [(0, Task(2, 10, 15))]),
+        (7, 33, [20, 10, 5, 5], 10, Task(1, 15, 10), [(0, Task(2, 10, 16))]),
+        (13, 28, [3, 8, 1, 9, 4], 10, Task(1, 15, 6), []),
+        (25, 25, [3, 8, 1, 9, 4], 10, Task(1, 0, 6), []),
+    ]
+)
+def test_same_result_as_python_backend(start, end, green_power, green_interval_size, task, scheduled_tasks, max_start_mode):
+    green_power_available = _create_green_power_available(green_power, green_interval_size, scheduled_tasks)
+    _assert_same_result(task, start, end, green_power_available, max_start_mode)
+
+
+@pytest.mark.parametrize('max_start_mode', [False, True])
+@pytest.mark.parametrize('seed', range(25))
+def test_same_result_as_python_backend_random(seed, max_start_mode):
+    rand = random.Random(seed)
+
+    interval_size = rand.randint(1, 20)
+    green_power = [rand.randint(0, 30) for _ in range(rand.randint(1, 40))]
+    scheduled_tasks = [
+        (rand.randint(0, 500), Task(i, rand.randint(1, 100), rand.randint(1, 10))) for i in range(rand.randint(0, 10))
+    ]
+    green_power_available = _create_green_power_available(green_power, interval_size, scheduled_tasks)
+
+    task = Task('t', rand.randint(1, 100), rand.randint(1, 30))
+    start = rand.randint(0, 400)
+    end = start + task.runtime + rand.randint(0, 400)
+
+    _assert_same_result(task, start, end, green_power_available, max_start_mode)
+
+
+@pytest.mark.parametrize('seed', range(25))
+def test_same_start_as_python_backend_with_float_powers(seed):
+    rand = random.Random(seed)
+
+    green_power = [rand.uniform(0, 30) for _ in range(rand.randint(1, 40))]
+    scheduled_tasks = [
+        (rand.randint(0, 500), Task(i, rand.randint(1, 100), rand.uniform(1, 10))) for i in range(rand.randint(0, 10))
+    ]
+    green_power_available = _create_green_power_available(green_power, 10, scheduled_tasks)
+
+    task = Task('t', rand.randint(1, 100), rand.uniform(1, 30))
+    start = rand.randint(0, 400)
+    end = start + task.runtime + rand.randint(0, 400)
+
+    expected_start, expected_brown_energy = find_min_brown_energy_start(task, start, end, green_power_available, backend=BACKEND_PYTHON)
+    start_min, brown_energy = find_min_brown_energy_start(task, start, end, green_power_available, backend=BACKEND_NUMPY)
+
+    # The python backend rounds each partial energy, so only the start time is expected to be exactly the same
+    assert start_min == expected_start
+    assert brown_energy == pytest.approx(expected_brown_energy, rel=1e-3)
+
+
+def test_invalid_backend():
+    with pytest.raises(Exception):
+        find_min_brown_energy_start(Task(1, 1, 1), 0, 10, [(0, 5)], backend='invalid')
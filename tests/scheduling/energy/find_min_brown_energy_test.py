@@ -102,6 +102,9 @@ def test_calculate_brown_energy_of_task(task_runtime, task_power, task_start, cu
         (0, 20, [(0, 100), (10, 200), (15, 0), (20, 130)], [(0, 100), (10, 200), (15, 0), (20, 130)]),
         (0, 17, [(0, 100), (10, 200), (15, 0), (20, 130)], [(0, 100), (10, 200), (15, 0), (17, 0)]),
         (17, 20, [(0, 100), (10, 200), (15, 0), (20, 130)], [(0, 0), (3, 130)]),
+        (10, 15, [(0, 100), (10, 200), (15, 0), (20, 130)], [(0, 200), (5, 0)]),
+        (25, 30, [(0, 100), (10, 200), (15, 0), (20, 130)], [(0, 130), (5, 130)]),
+        (5, 12, [], []),
     ]
 )
 def test_slice_green_power_available_list(start, end, green_power_available, expected):
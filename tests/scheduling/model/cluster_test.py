@@ -0,0 +1,123 @@
+import unittest
+
+from src.scheduling.algorithms.bounded_boundary_search.bounded_boundary_search import bbs, BOUNDARY_SINGLE, \
+    BOUNDARY_DEFAULT, BOUNDARY_LPT_PATH, BOUNDARY_LPT
+from src.scheduling.algorithms.lpt.longest_processing_time_first import lpt
+from src.scheduling.model.cluster import Cluster, MachinePool, create_machine_pools
+from src.scheduling.model.machine import Machine
+from src.scheduling.model.power_series import PowerSeries
+from src.scheduling.model.task import Task
+from src.scheduling.util.makespan_calculator import calc_makespan
+from src.scheduling.util.scheduling_check import check
+from tests.scheduling.graph_utils import get_stencil_graph, get_parallel_graph, get_multidependency_graph
+
+
+class MachinePoolTest(unittest.TestCase):
+
+    def test_pool_has_cores_of_all_machines(self):
+        pool = MachinePool('p1', 3, cores=4)
+
+        self.assertEqual(12, pool.cores)
+        self.assertEqual(['p1_m0', 'p1_m1', 'p1_m2'], pool.machine_ids)
+
+        for i in range(12):
+            pool.schedule_task(Task(i, 10, 1), 0)
+        self.assertFalse(pool.can_schedule_task_in(Task(12, 10, 1), 0, 10))
+
+    def test_assign_machines_by_start_time(self):
+        pool = MachinePool('p1', 2, cores=1)
+        tasks = [
+            (Task(1, 10, 1), 0),
+            (Task(2, 5, 1), 2),
+            (Task(3, 5, 1), 7),
+            (Task(4, 5, 1), 10),
+        ]
+
+        assignment = pool.assign_machines(tasks)
+
+        self.assertEqual({1: 'p1_m0', 2: 'p1_m1', 3: 'p1_m1', 4: 'p1_m0'}, assignment)
+
+    def test_assign_machines_without_free_cores(self):
+        pool = MachinePool('p1', 2, cores=1)
+        tasks = [(Task(i, 10, 1), i) for i in range(3)]
+
+        self.assertRaises(Exception, lambda: pool.assign_machines(tasks))
+
+    def test_create_machine_pools_by_machine_type(self):
+        machines = [Machine('a', 2), Machine('b', 4), Machine('c', 2), Machine('d', 2, tdp=5)]
+
+        pools = create_machine_pools(machines)
+
+        self.assertEqual(3, len(pools))
+        self.assertEqual((['a', 'c'], 4), (pools[0].machine_ids, pools[0].cores))
+        self.assertEqual((['b'], 4), (pools[1].machine_ids, pools[1].cores))
+        self.assertEqual((['d'], 2, 5), (pools[2].machine_ids, pools[2].cores, pools[2].tdp))
+
+    def test_resolved_schedule_fits_in_machines(self):
+        graph = get_stencil_graph()
+        machines = [Machine(f'm{i}', cores=2) for i in range(3)]
+        cluster = Cluster('c1', PowerSeries('g1', [10, 20], 10), create_machine_pools(machines))
+
+        schedule = lpt(graph, [cluster])
+        resolved = cluster.resolve_schedule(schedule, graph)
+
+        self.assertEqual(schedule.keys(), resolved.keys())
+
+        # Scheduling the tasks in the original machines fails if any machine has not enough cores
+        machines_map = {machine.id: machine for machine in machines}
+        for task_id, (start_time, machine_id) in resolved.items():
+            self.assertEqual(schedule[task_id][0], start_time)
+            machines_map[machine_id].schedule_task(graph.get_task(task_id), start_time)
+
+
+class MachinePoolSchedulingTest(unittest.TestCase):
+    """
+    Schedules in a cluster of pooled machines, resolved to the machines, are compared with the schedules in the same
+    cluster without pools.
+    """
+
+    graph_providers = [get_stencil_graph, get_parallel_graph, get_multidependency_graph]
+
+    def _create_cluster(self, use_pools):
+        machines = [Machine(f'm{i}', cores=1) for i in range(3)]
+        if use_pools:
+            machines = create_machine_pools(machines)
+        return Cluster('c1', PowerSeries('g1', [0, 10, 20, 30, 20, 10, 0] * 10, 5), machines)
+
+    def _assert_resolved_schedule(self, schedule, pooled_schedule, cluster, graph):
+        resolved = cluster.resolve_schedule(pooled_schedule, graph)
+
+        self.assertEqual([], check(resolved, graph))
+        self.assertEqual({task_id: start_time for task_id, (start_time, _) in schedule.items()},
+                         {task_id: start_time for task_id, (start_time, _) in resolved.items()})
+
+        # Scheduling the tasks in the original machines fails if any machine has not enough cores
+        machines = {machine.id: machine for machine in self._create_cluster(use_pools=False).machines_list}
+        for task_id, (start_time, machine_id) in resolved.items():
+            machines[machine_id].schedule_task(graph.get_task(task_id), start_time)
+
+    def test_lpt(self):
+        for graph_provider in self.graph_providers:
+            with self.subTest(graph=graph_provider.__name__):
+                schedule = lpt(graph_provider(), [self._create_cluster(use_pools=False)])
+
+                cluster = self._create_cluster(use_pools=True)
+                pooled_schedule = lpt(graph_provider(), [cluster])
+
+                self._assert_resolved_schedule(schedule, pooled_schedule, cluster, graph_provider())
+
+    def test_bbs(self):
+        for graph_provider in self.graph_providers:
+            for boundary_strategy in [BOUNDARY_SINGLE, BOUNDARY_DEFAULT, BOUNDARY_LPT_PATH, BOUNDARY_LPT]:
+                with self.subTest(graph=graph_provider.__name__, boundary_strategy=boundary_strategy):
+                    graph = graph_provider()
+                    deadline = 2 * calc_makespan(lpt(graph, [self._create_cluster(use_pools=False)]), graph)
+
+                    schedule = bbs(graph_provider(), deadline, 0.5, [self._create_cluster(use_pools=False)],
+                                   boundary_strategy=boundary_strategy)
+
+                    cluster = self._create_cluster(use_pools=True)
+                    pooled_schedule = bbs(graph_provider(), deadline, 0.5, [cluster],
+                                          boundary_strategy=boundary_strategy)
+
+                    self._assert_resolved_schedule(schedule, pooled_schedule, cluster, graph_provider())
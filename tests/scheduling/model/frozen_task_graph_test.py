@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from src.scheduling.model.task_graph import TaskGraph
+from src.scheduling.util.slack_time_calculator import compute_min_start_time
+from tests.scheduling.graph_utils import get_stencil_graph, get_multidependency_graph
+
+
+def _get_random_graph(seed, num_tasks=80):
+    rand = random.Random(seed)
+    graph = TaskGraph()
+    for i in range(num_tasks):
+        graph.add_new_task(i, rand.randint(1, 20), rand.randint(1, 5))
+        for j in rand.sample(range(i), min(i, rand.randint(1, 3))):
+            graph.create_dependency(j, i)
+    graph.set_start_task(0)
+    return graph
+
+
+class FrozenTaskGraphTest(unittest.TestCase):
+
+    def test_csr_adjacency(self):
+        graph = get_stencil_graph()
+        frozen = graph.freeze()
+
+        self.assertEqual(len(graph.tasks), len(frozen))
+        for task in graph.list_of_tasks():
+            i = frozen.index[task.id]
+            self.assertEqual(task.id, frozen.task_ids[i])
+            self.assertEqual(task.runtime, frozen.runtime[i])
+            self.assertEqual(task.power, frozen.power[i])
+            self.assertEqual([t.id for t in task.successors], [frozen.task_ids[j] for j in frozen.successors(i)])
+            self.assertEqual([t.id for t in task.predecessors], [frozen.task_ids[j] for j in frozen.predecessors(i)])
+
+    def test_topological_waves(self):
+        graph = get_multidependency_graph()
+        frozen = graph.freeze()
+
+        waves = frozen.topological_waves([frozen.index[1]])
+        self.assertEqual([[1], [2, 3], [4], [5], [6, 7], [8, 9], [10]],
+                         [[frozen.task_ids[i] for i in wave] for wave in waves])
+
+    def test_reachable_from(self):
+        graph = get_stencil_graph()
+        frozen = graph.freeze()
+
+        reachable = frozen.reachable_from([frozen.index[5]])
+        self.assertEqual([5, 8, 9, 10, 11], [frozen.task_ids[i] for i in reachable.nonzero()[0]])
+
+    def test_same_earliest_start_times_as_min_start_time(self):
+        for seed in range(5):
+            graph = _get_random_graph(seed)
+            frozen = graph.freeze()
+
+            start_times = frozen.earliest_start_times([frozen.index[0]])
+            for task_id, start_time in compute_min_start_time(graph).items():
+                self.assertEqual(start_time, start_times[frozen.index[task_id]])
+
+    def test_frozen_graph_is_discarded_when_graph_changes(self):
+        graph = get_stencil_graph()
+        frozen = graph.freeze()
+        self.assertIs(frozen, graph.freeze())
+
+        graph.add_new_task(12, 1, 1)
+        self.assertIsNot(frozen, graph.freeze())
+        self.assertEqual(len(frozen) + 1, len(graph.freeze()))
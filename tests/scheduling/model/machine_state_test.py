@@ -1,15 +1,17 @@
+import random
 import unittest
 
 from src.scheduling.model.machine import Machine
 from src.scheduling.model.machine_state import MachineState
+from src.scheduling.model.segment_tree_machine_state import SegmentTreeMachineState
 
 
-def create_state(cores):
+def create_state(cores, state_class=MachineState):
     machine = Machine('id', cores=cores)
-    return MachineState(machine)
+    return state_class(machine)
 
 
-def _get_state_1():
+def _get_state_1(create_state=create_state):
     '''
         |   time      |  cpus used  | cpus free |
         | [  0s,  5s]  |       5     |    15     |
@@ -28,7 +30,7 @@ def _get_state_1():
     return state
 
 
-def _get_state_increase():
+def _get_state_increase(create_state=create_state):
     state = create_state(10)
 
     state.use_cores(0, 1, 1)
@@ -41,7 +43,7 @@ def _get_state_increase():
     return state
 
 
-def _get_state_decrease():
+def _get_state_decrease(create_state=create_state):
     state = create_state(10)
 
     state.use_cores(0, 6, 6)
@@ -56,12 +58,17 @@ def _get_state_decrease():
 
 class MachineStateTest(unittest.TestCase):
 
+    state_class = MachineState
+
+    def create_state(self, cores):
+        return create_state(cores, state_class=self.state_class)
+
     def test_min_free_cores_no_usage(self):
-        state = create_state(10)
+        state = self.create_state(10)
         self.assertEqual(10, state.min_free_cores_in(0, 20))
 
     def test_core_usages_at_same_time(self):
-        state = create_state(10)
+        state = self.create_state(10)
         state.use_cores(2, 3, 6)
         state.use_cores(2, 3, 1)
         self.assert_min_cores_in(state, 10, 0, 2)
@@ -69,12 +76,12 @@ class MachineStateTest(unittest.TestCase):
         self.assert_min_cores_in(state, 10, 5, 20)
 
     def test_if_no_cores_available_throw_exception(self):
-        state = create_state(10)
+        state = self.create_state(10)
         with self.assertRaises(Exception):
             state.use_cores(1, 2, 11)
 
     def test_min_free_cores_single_usage(self):
-        state = create_state(10)
+        state = self.create_state(10)
         state.use_cores(5, 10, 6)
         self.assert_min_cores_in(state, 4, 0, 20)
         self.assert_min_cores_in(state, 10, 0, 5)
@@ -82,7 +89,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_min_cores_in(state, 10, 15, 20)
 
     def test_min_free_cores_usage_all_interval_not_overlapping(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
 
         self.assert_min_cores_in(state, 15, 0, 5)
         self.assert_min_cores_in(state, 13, 5, 9)
@@ -91,7 +98,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_min_cores_in(state, 1, 16, 20)
 
     def test_min_free_cores_overlap_first_interval(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
 
         state.use_cores(1, 2, 15)
 
@@ -105,7 +112,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_min_cores_in(state, 1, 16, 20)
 
     def test_min_free_cores_overlap_first_start(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
 
         state.use_cores(0, 2, 14)
 
@@ -118,7 +125,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_min_cores_in(state, 1, 16, 20)
 
     def test_min_free_cores_overlap_last_interval(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
 
         state.use_cores(17, 2, 1)
 
@@ -132,7 +139,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_min_cores_in(state, 1, 19, 20)
 
     def test_min_free_cores_overlap_end(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
 
         state.use_cores(19, 1, 1)
 
@@ -144,24 +151,24 @@ class MachineStateTest(unittest.TestCase):
         self.assert_min_cores_in(state, 0, 19, 20)
 
     def test_free_cores_more_than_available(self):
-        state = create_state(10)
+        state = self.create_state(10)
         with self.assertRaises(Exception):
             state.free_cores(0, 1, 11)
 
     def test_min_cores_of_single_time_unit(self):
-        state = create_state(10)
+        state = self.create_state(10)
         self.assert_min_cores_in(state, 10, 0, 0)
         self.assert_min_cores_in(state, 10, 1, 1)
         self.assert_min_cores_in(state, 10, 20, 20)
 
     def test_free_all_cores(self):
-        state = create_state(10)
+        state = self.create_state(10)
         state.use_cores(0, 20, 10)
         state.free_cores(0, 20, 10)
         self.assert_min_cores_in(state, 10, 0, 20)
 
     def test_free_cores_in_middle_of_interval(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
         state.free_cores(11, 2, 1)
 
         self.assert_min_cores_in(state, 15, 0, 5)
@@ -175,7 +182,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_min_cores_in(state, 1, 16, 20)
 
     def test_free_cores_splitting_an_interval(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
         state.free_cores(4, 3, 4)
 
         self.assert_min_cores_in(state, 15, 0, 4)
@@ -188,7 +195,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_min_cores_in(state, 1, 16, 20)
 
     def test_free_cores_n_intervals(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
         state.free_cores(0, 14, 1)
 
         self.assert_min_cores_in(state, 16, 0, 5)
@@ -198,7 +205,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_min_cores_in(state, 1, 16, 20)
 
     def test_free_cores_usage_start(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
         state.free_cores(0, 7, 2)
 
         self.assert_min_cores_in(state, 17, 0, 5)
@@ -210,7 +217,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_min_cores_in(state, 1, 16, 20)
 
     def test_free_cores_usage_end(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
         state.free_cores(7, 7, 1)
 
         self.assert_min_cores_in(state, 15, 0, 5)
@@ -223,7 +230,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_min_cores_in(state, 1, 16, 20)
 
     def test_next_key(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
 
         self.assertEqual(5, state.next_start(0))
         self.assertEqual(5, state.next_start(1))
@@ -232,7 +239,7 @@ class MachineStateTest(unittest.TestCase):
         self.assertEqual(9, state.next_start(5))
 
     def test_previous_key(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
 
         self.assertEqual(0, state.previous_start(1))
         self.assertEqual(0, state.previous_start(5))
@@ -243,7 +250,7 @@ class MachineStateTest(unittest.TestCase):
         self.assertEqual(16, state.previous_start(20))
 
     def test_bug_start_not_added(self):
-        state = create_state(3)
+        state = self.create_state(3)
 
         state.use_cores(173, 13, 1)
         state.use_cores(171, 2, 1)
@@ -258,7 +265,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_min_cores_in(state, 3, 0, 186)
 
     def test_search_full_interval_available(self):
-        state = create_state(3)
+        state = self.create_state(3)
 
         intervals = list(
             state.search_intervals_with_free_cores(0, 20, 10, 1)
@@ -269,7 +276,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_interval(intervals[0], 0, 20)
 
     def test_search_full_interval_available_cores_exactly(self):
-        state = create_state(3)
+        state = self.create_state(3)
 
         intervals = list(
             state.search_intervals_with_free_cores(0, 20, 10, 3)
@@ -280,7 +287,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_interval(intervals[0], 0, 20)
 
     def test_search_full_interval_not_available(self):
-        state = create_state(3)
+        state = self.create_state(3)
 
         intervals = list(
             state.search_intervals_with_free_cores(0, 20, 10, 4)
@@ -289,7 +296,7 @@ class MachineStateTest(unittest.TestCase):
         self.assertEqual(0, len(intervals))
 
     def test_search_full_interval_not_available_due_usage(self):
-        state = create_state(3)
+        state = self.create_state(3)
 
         state.use_cores(0, 20, 3)
 
@@ -300,7 +307,7 @@ class MachineStateTest(unittest.TestCase):
         self.assertEqual(0, len(intervals))
 
     def test_search_full_interval_not_available_due_two_usages(self):
-        state = create_state(3)
+        state = self.create_state(3)
 
         state.use_cores(7, 13, 1)
         state.use_cores(0, 7, 1)
@@ -315,7 +322,7 @@ class MachineStateTest(unittest.TestCase):
         self.assertEqual(0, len(intervals))
 
     def test_search_no_interval_available(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
 
         intervals = list(
             state.search_intervals_with_free_cores(0, 20, 1, 21)
@@ -324,7 +331,7 @@ class MachineStateTest(unittest.TestCase):
         self.assertEqual(0, len(intervals))
 
     def test_search_interval_by_end_of_other(self):
-        state = create_state(10)
+        state = self.create_state(10)
 
         state.use_cores(0, 5, 10)
         state.use_cores(10, 5, 10)
@@ -341,7 +348,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_interval(intervals[2], 25, 30)
 
     def test_search_interval_that_spans_over_events(self):
-        state = _get_state_1()
+        state = _get_state_1(self.create_state)
 
         intervals = list(
             state.search_intervals_with_free_cores(0, 20, 1, 14)
@@ -353,7 +360,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_interval(intervals[1], 9, 16)
 
     def test_search_interval_with_last_interval_with_not_enough_cores(self):
-        state = create_state(10)
+        state = self.create_state(10)
 
         state.use_cores(0, 5, 9)
         state.use_cores(5, 5, 8)
@@ -373,7 +380,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_interval(intervals[0], 5, 15)
 
     def test_search_interval_increase(self):
-        state = _get_state_increase()
+        state = _get_state_increase(self.create_state)
 
         intervals = list(
             state.search_intervals_with_free_cores(0, 21, 1, 1)
@@ -384,7 +391,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_interval(intervals[0], 0, 21)
 
     def test_search_interval_decrease(self):
-        state = _get_state_decrease()
+        state = _get_state_decrease(self.create_state)
 
         intervals = list(
             state.search_intervals_with_free_cores(0, 21, 1, 1)
@@ -395,7 +402,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_interval(intervals[0], 0, 21)
 
     def test_bug_if_first_key_is_lesser_than_start_then_reset_to_start(self):
-        state = create_state(10)
+        state = self.create_state(10)
 
         state.use_cores(10, 10, 1)
 
@@ -406,7 +413,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_interval(intervals[0], 41, 57)
 
     def test_if_last_key_is_greater_than_end_then_return_end(self):
-        state = create_state(10)
+        state = self.create_state(10)
 
         state.use_cores(40, 10, 1)
 
@@ -417,7 +424,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_interval(intervals[0], 5, 51)
 
     def test_if_last_key_is_greater_than_end_then_return_end_no_cores(self):
-        state = create_state(10)
+        state = self.create_state(10)
 
         state.use_cores(40, 10, 10)
 
@@ -428,7 +435,7 @@ class MachineStateTest(unittest.TestCase):
         self.assert_interval(intervals[0], 5, 40)
 
     def test_if_last_key_is_lesser_than_end_then_return_end(self):
-        state = create_state(10)
+        state = self.create_state(10)
 
         state.use_cores(40, 10, 1)
 
@@ -438,15 +445,89 @@ class MachineStateTest(unittest.TestCase):
 
         self.assert_interval(intervals[0], 5, 47)
 
+    def test_first_fit_at_start(self):
+        state = self.create_state(10)
+        state.use_cores(40, 10, 1)
+
+        self.assertEqual(5, state.first_fit(5, 10, 1))
+
+    def test_first_fit_skips_short_gaps(self):
+        state = self.create_state(2)
+        state.use_cores(0, 10, 2)
+        state.use_cores(12, 5, 2)
+        state.use_cores(20, 5, 2)
+
+        self.assertEqual(10, state.first_fit(0, 2, 1))
+        self.assertEqual(17, state.first_fit(0, 3, 1))
+        self.assertEqual(25, state.first_fit(0, 4, 1))
+
+    def test_first_fit_spans_over_events(self):
+        state = _get_state_1(self.create_state)
+
+        self.assertEqual(0, state.first_fit(0, 16, 13))
+        self.assertEqual(9, state.first_fit(0, 7, 14))
+        self.assertEqual(20, state.first_fit(0, 8, 14))
+        self.assertEqual(14, state.first_fit(0, 2, 19))
+
+    def test_first_fit_until_end(self):
+        state = self.create_state(1)
+        state.use_cores(10, 10, 1)
+
+        self.assertEqual(0, state.first_fit(0, 10, 1, 10))
+        self.assertEqual(float('inf'), state.first_fit(5, 10, 1, 29))
+        self.assertEqual(20, state.first_fit(5, 10, 1, 30))
+
+    def test_first_fit_not_enough_cores(self):
+        state = self.create_state(2)
+
+        self.assertEqual(float('inf'), state.first_fit(0, 10, 3))
+
+    def test_fork_does_not_change_state(self):
+        state = _get_state_1(self.create_state)
+        fork = state.fork()
+
+        fork.use_cores(0, 20, 1)
+        fork.free_cores(16, 4, 19)
+
+        self.assert_min_cores_in(state, 1, 0, 20)
+        self.assert_min_cores_in(fork, 12, 0, 20)
+        self.assertEqual(5 * 5 + 4 * 7 + 5 * 2 + 4 * 19, state.total_usage())
+
+        state.use_cores(14, 2, 20)
+        self.assert_min_cores_in(state, 0, 14, 16)
+        self.assert_min_cores_in(fork, 19, 14, 16)
+
+    def test_use_cores_until_infinity(self):
+        state = self.create_state(2)
+        state.use_cores(10, float('inf'), 1)
+
+        self.assert_min_cores_in(state, 2, 0, 10)
+        self.assert_min_cores_in(state, 1, 10, 10 ** 9)
+        self.assertEqual(10, state.next_start(0))
+        self.assertEqual(float('inf'), state.first_fit(0, 20, 2))
+        self.assertEqual(12, state.first_fit(12, 20, 1))
+
+        state.free_cores(10, float('inf'), 1)
+        self.assert_min_cores_in(state, 2, 0, 10 ** 9)
+
+    def test_use_cores_at_infinity(self):
+        # A task without successors scheduled by a right boundary with an infinite deadline
+        state = self.create_state(2)
+        state.use_cores(5, 10, 1)
+        state.use_cores(float('inf'), 10, 1)
+
+        self.assert_min_cores_in(state, 1, 0, 10 ** 9)
+        self.assertEqual([(0, float('inf'))], list(state.search_intervals_with_free_cores(0, float('inf'), 10, 1)))
+
     def test_cores_usage_single_usage(self):
-        state = create_state(10)
+        state = self.create_state(10)
         state.use_cores(5, 10, 1)
         #state.use_cores(3, 5, 1)
 
         self.assertEqual(10, state.total_usage())
 
     def test_cores_usage_sequential(self):
-        state = create_state(10)
+        state = self.create_state(10)
         state.use_cores(5, 10, 1)
         state.use_cores(15, 5, 1)
 
@@ -454,7 +535,7 @@ class MachineStateTest(unittest.TestCase):
         self.assertEqual(15, t)
 
     def test_cores_usage_overlap(self):
-        state = create_state(10)
+        state = self.create_state(10)
         state.use_cores(5, 10, 1)
         state.use_cores(13, 5, 1)
 
@@ -468,3 +549,110 @@ class MachineStateTest(unittest.TestCase):
     def assert_interval(self, interval, expected_start, expected_end):
         self.assertEqual(interval[0], expected_start)
         self.assertEqual(interval[1], expected_end)
+
+
+class SegmentTreeMachineStateTest(MachineStateTest):
+
+    state_class = SegmentTreeMachineState
+
+    def test_cores_usage_after_free(self):
+        state = self.create_state(10)
+        state.use_cores(5, 10, 2)
+        state.use_cores(100, 7, 1)
+        state.free_cores(5, 10, 1)
+
+        self.assertEqual(17, state.total_usage())
+
+    def test_times_must_be_integers(self):
+        state = _get_state_1(self.create_state)
+
+        self.assertRaises(ValueError, lambda: state.use_cores(0.5, 2, 1))
+        self.assertRaises(ValueError, lambda: state.use_cores(0, 2.5, 1))
+        self.assertRaises(ValueError, lambda: state.free_cores(5, float('nan'), 1))
+        self.assertRaises(ValueError, lambda: state.use_cores(float('-inf'), float('inf'), 1))
+
+        state.use_cores(0.0, 2.0, 1)
+        self.assert_min_cores_in(state, 14, 0, 2)
+
+    def test_queries_do_not_change_tree(self):
+        state = _get_state_1(self.create_state)
+        nodes = [list(state.left), list(state.min), list(state.lazy)]
+
+        state.min_free_cores_in(3, 17)
+        state.next_start(4)
+        state.previous_start(12)
+        state.first_fit(0, 4, 12)
+        list(state.search_intervals_with_free_cores(0, 30, 2, 10))
+
+        self.assertEqual(nodes, [state.left, state.min, state.lazy])
+
+    def test_fork_shares_nodes_until_changed(self):
+        state = _get_state_1(self.create_state)
+        fork = state.fork()
+
+        self.assertIs(state.min, fork.min)
+        self.assert_min_cores_in(fork, 1, 0, 20)
+
+        fork.use_cores(0, 20, 1)
+        self.assertIsNot(state.min, fork.min)
+        self.assert_min_cores_in(state, 1, 0, 20)
+        self.assert_min_cores_in(fork, 0, 0, 20)
+
+        second_fork = state.fork()
+        state.free_cores(0, 5, 5)
+        self.assert_min_cores_in(state, 20, 0, 5)
+        self.assert_min_cores_in(second_fork, 15, 0, 5)
+        self.assert_min_cores_in(fork, 14, 0, 5)
+
+    def test_next_start_after_last_event(self):
+        state = self.create_state(10)
+        state.use_cores(5, 10, 2)
+
+        self.assertEqual(15, state.next_start(5))
+        self.assertEqual(float('inf'), state.next_start(15))
+
+    def test_search_until_infinity(self):
+        state = self.create_state(2)
+        state.use_cores(0, 10, 2)
+        state.use_cores(12, 1000, 1)
+
+        intervals = list(
+            state.search_intervals_with_free_cores(0, float('inf'), 2, 2)
+        )
+
+        self.assertEqual([(10, 12), (1012, float('inf'))], intervals)
+
+    def test_same_state_as_events_state(self):
+        rand = random.Random(123)
+        events_state = create_state(4, state_class=MachineState)
+        state = self.create_state(4)
+        used = []
+
+        for _ in range(200):
+            if used and rand.random() < 0.3:
+                start, duration, amount = used.pop(rand.randrange(len(used)))
+                events_state.free_cores(start, duration, amount)
+                state.free_cores(start, duration, amount)
+            else:
+                start, duration, amount = rand.randint(0, 200), rand.randint(1, 50), rand.randint(1, 4)
+                if events_state.min_free_cores_in(start, start + duration) >= amount:
+                    events_state.use_cores(start, duration, amount)
+                    state.use_cores(start, duration, amount)
+                    used.append((start, duration, amount))
+
+            start = rand.randint(0, 260)
+            end = start + rand.randint(0, 100)
+            min_duration, min_cores = rand.randint(1, 30), rand.randint(1, 4)
+
+            self.assertEqual(events_state.min_free_cores_in(start, end), state.min_free_cores_in(start, end))
+            self.assertEqual(
+                list(events_state.search_intervals_with_free_cores(start, end, min_duration, min_cores)),
+                list(state.search_intervals_with_free_cores(start, end, min_duration, min_cores))
+            )
+            self.assertEqual(events_state.total_usage(), state.total_usage())
+
+            expected_start, _ = next(
+                events_state.search_intervals_with_free_cores(start, end, min_duration, min_cores), (float('inf'), None)
+            )
+            self.assertEqual(expected_start, events_state.first_fit(start, min_duration, min_cores, end))
+            self.assertEqual(expected_start, state.first_fit(start, min_duration, min_cores, end))
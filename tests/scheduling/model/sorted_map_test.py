@@ -0,0 +1,109 @@
+import random
+import unittest
+from bisect import bisect_left, bisect_right
+
+from src.scheduling.model import sorted_map
+from src.scheduling.model.sorted_map import SortedMap
+
+
+class SortedMapTest(unittest.TestCase):
+
+    def test_set_and_get(self):
+        events = SortedMap()
+        events[10] = 'b'
+        events[0] = 'a'
+        events[float('inf')] = 'c'
+        events[10] = 'd'
+
+        self.assertEqual(3, len(events))
+        self.assertEqual('a', events[0])
+        self.assertEqual('d', events[10])
+        self.assertIn(float('inf'), events)
+        self.assertNotIn(5, events)
+        self.assertRaises(KeyError, lambda: events[5])
+
+    def test_items_are_sorted(self):
+        events = SortedMap([(5, 'b'), (1, 'a'), (9, 'c')])
+
+        self.assertEqual([1, 5, 9], list(events))
+        self.assertEqual([(1, 'a'), (5, 'b'), (9, 'c')], list(events.items()))
+
+    def test_delete(self):
+        events = SortedMap([(5, 'b'), (1, 'a'), (9, 'c')])
+        del events[5]
+
+        self.assertEqual([(1, 'a'), (9, 'c')], list(events.items()))
+        with self.assertRaises(KeyError):
+            del events[5]
+
+    def test_iter_items_between(self):
+        events = SortedMap([(0, 'a'), (10, 'b'), (20, 'c'), (float('inf'), 'd')])
+
+        self.assertEqual([(10, 'b')], list(events.iter_items(5, 20)))
+        self.assertEqual([(10, 'b'), (20, 'c')], list(events.iter_items(10, float('inf'))))
+        self.assertEqual([(20, 'c'), (float('inf'), 'd')], list(events.iter_items(11)))
+        self.assertEqual([], list(events.iter_items(21, float('inf'))))
+
+    def test_floor_and_ceiling_key(self):
+        events = SortedMap([(0, 'a'), (10, 'b'), (20, 'c')])
+
+        self.assertEqual(10, events.floor_key(10))
+        self.assertEqual(10, events.floor_key(19))
+        self.assertEqual(20, events.floor_key(100))
+        self.assertRaises(KeyError, lambda: events.floor_key(-1))
+
+        self.assertEqual(10, events.ceiling_key(10))
+        self.assertEqual(20, events.ceiling_key(11))
+        self.assertRaises(KeyError, lambda: events.ceiling_key(21))
+
+    def test_copy_on_write(self):
+        events = SortedMap((i, i) for i in range(5 * sorted_map.LOAD))
+        copy = events.copy()
+
+        copy[10] = -1
+        del copy[20]
+        events[30] = -1
+        copy[5 * sorted_map.LOAD] = 0
+
+        self.assertEqual(10, events[10])
+        self.assertIn(20, events)
+        self.assertEqual(-1, events[30])
+        self.assertEqual(5 * sorted_map.LOAD, len(events))
+
+        self.assertEqual(-1, copy[10])
+        self.assertNotIn(20, copy)
+        self.assertEqual(30, copy[30])
+        self.assertEqual(5 * sorted_map.LOAD, len(copy))
+
+    def test_same_as_sorted_list_with_many_blocks(self):
+        rand = random.Random(7)
+        events = SortedMap()
+        expected = {}
+
+        for _ in range(20 * sorted_map.LOAD):
+            key = rand.randint(0, 5 * sorted_map.LOAD)
+            if key in expected and rand.random() < 0.4:
+                del events[key]
+                del expected[key]
+            else:
+                events[key] = -key
+                expected[key] = -key
+
+        keys = sorted(expected)
+        self.assertEqual(len(keys), len(events))
+        self.assertEqual([(key, expected[key]) for key in keys], list(events.items()))
+
+        for _ in range(500):
+            start = rand.randint(-10, 5 * sorted_map.LOAD + 10)
+            end = start + rand.randint(0, 3 * sorted_map.LOAD)
+
+            expected_items = [(key, expected[key]) for key in keys[bisect_left(keys, start):bisect_left(keys, end)]]
+            self.assertEqual(expected_items, list(events.iter_items(start, end)))
+
+            i = bisect_right(keys, start) - 1
+            if i >= 0:
+                self.assertEqual(keys[i], events.floor_key(start))
+
+            i = bisect_left(keys, start)
+            if i < len(keys):
+                self.assertEqual(keys[i], events.ceiling_key(start))
@@ -0,0 +1,42 @@
+import unittest
+
+from src.scheduling.util.calc_levels import calc_levels
+from src.scheduling.util.critical_path_length_calculator import calc_critical_path_length
+from src.scheduling.util.slack_time_calculator import compute_min_start_time, calculate_slack_time
+from src.scheduling.util.topological_ordering import calculate_upward_rank, sort_topologically
+from tests.scheduling.graph_utils import get_stencil_graph, get_pipeline_graph
+
+
+class TaskGraphAnalysisTest(unittest.TestCase):
+
+    def test_same_results_as_util_functions(self):
+        graph = get_stencil_graph()
+        analysis = graph.analysis()
+
+        self.assertEqual(calculate_upward_rank(graph), analysis.upward_rank())
+        self.assertEqual(calc_levels(graph), analysis.levels())
+        self.assertEqual(sort_topologically(graph), analysis.topological_order())
+        self.assertEqual(sort_topologically(graph, reverse=True), analysis.topological_order(reverse=True))
+        self.assertEqual(compute_min_start_time(graph), analysis.min_start_time())
+        self.assertEqual(calculate_slack_time(graph, compute_min_start_time(graph)), analysis.slack_time())
+        self.assertEqual(calc_critical_path_length(graph), analysis.critical_path_length())
+
+    def test_results_are_cached(self):
+        graph = get_stencil_graph()
+
+        self.assertIs(graph.analysis(), graph.analysis())
+        self.assertIs(graph.analysis().upward_rank(), graph.analysis().upward_rank())
+        self.assertIs(graph.analysis().lpt_topological_sort(), graph.analysis().lpt_topological_sort())
+
+    def test_analysis_is_discarded_when_graph_changes(self):
+        graph = get_pipeline_graph()
+        self.assertEqual(3, graph.analysis().levels()[1])
+
+        graph.add_new_task(5, 2, 1)
+        graph.create_dependency(4, 5)
+        self.assertEqual(4, graph.analysis().levels()[1])
+        self.assertEqual(32, graph.analysis().critical_path_length())
+
+        graph.remove_task(5)
+        self.assertEqual(3, graph.analysis().levels()[1])
+        self.assertEqual(30, graph.analysis().critical_path_length())
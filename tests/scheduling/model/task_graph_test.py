@@ -0,0 +1,57 @@
+import pickle
+import unittest
+
+from src.scheduling.model.task_graph import TaskGraph
+from src.scheduling.util.topological_ordering import calculate_upward_rank
+from tests.scheduling.graph_utils import get_stencil_graph
+
+
+class TaskGraphTest(unittest.TestCase):
+
+    def test_compact(self):
+        graph = get_stencil_graph()
+        upward_rank = calculate_upward_rank(graph)
+
+        graph.compact()
+
+        task = graph.get_task(5)
+        self.assertEqual((2, 3, 4), tuple(t.id for t in task.predecessors))
+        self.assertEqual((8, 9, 10), tuple(t.id for t in task.successors))
+        self.assertIsInstance(task.successors, tuple)
+        self.assertEqual(upward_rank, calculate_upward_rank(graph))
+
+    def test_change_compact_graph(self):
+        graph = get_stencil_graph()
+        graph.compact()
+
+        graph.add_new_task(12, 1, 1)
+        graph.create_dependency(11, 12)
+        self.assertEqual([12], [t.id for t in graph.get_task(11).successors])
+        self.assertEqual([11], [t.id for t in graph.get_task(12).predecessors])
+
+        graph.remove_task(5)
+        self.assertEqual([6, 7], [t.id for t in graph.get_task(2).successors])
+        self.assertEqual([6, 7], [t.id for t in graph.get_task(10).predecessors])
+
+    def test_tasks_have_no_attribute_dict(self):
+        task = get_stencil_graph().get_task(1)
+
+        self.assertFalse(hasattr(task, '__dict__'))
+        self.assertRaises(AttributeError, lambda: setattr(task, 'name', 'task 1'))
+
+    def test_pickle(self):
+        graph = TaskGraph()
+        for i in range(5000):
+            graph.add_new_task(i, i % 7 + 1, 2)
+            if i > 0:
+                graph.create_dependency(i - 1, i)
+        graph.set_start_task(0)
+
+        copy = pickle.loads(pickle.dumps(graph))
+
+        self.assertEqual(0, copy.get_first_task().id)
+        for task in graph.list_of_tasks():
+            other = copy.get_task(task.id)
+            self.assertEqual((task.runtime, task.power), (other.runtime, other.power))
+            self.assertEqual([t.id for t in task.successors], [t.id for t in other.successors])
+            self.assertEqual([t.id for t in task.predecessors], [t.id for t in other.predecessors])
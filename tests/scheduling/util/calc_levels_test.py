@@ -1,7 +1,7 @@
 import unittest
 
 from src.scheduling.model.task_graph import TaskGraph
-from src.scheduling.util.calc_levels import calc_levels
+from src.scheduling.util.calc_levels import calc_levels, calc_levels_with_recursion
 
 '''
     1
@@ -171,4 +171,25 @@ class CalcLevelsTest(unittest.TestCase):
         self.assertEqual(2, levels[4])
         self.assertEqual(3, levels[5])
         self.assertEqual(3, levels[6])
-        self.assertEqual(4, levels[7])
\ No newline at end of file
+        self.assertEqual(4, levels[7])
+
+    def test_deep_pipeline(self):
+        graph = TaskGraph()
+        graph.add_new_task(0, runtime=1, power=10)
+        graph.set_start_task(0)
+        for i in range(1, 5000):
+            graph.add_new_task(i, runtime=1, power=10)
+            graph.create_dependency(i - 1, i)
+
+        levels, max_level = calc_levels(graph)
+
+        self.assertEqual(4999, max_level)
+        self.assertEqual(2500, levels[2500])
+
+    def test_same_levels_and_order_as_recursion(self):
+        for graph, _ in (_get_graph_1(), _get_graph_2(), _get_graph_3(), _get_graph_4()):
+            levels, max_level = calc_levels(graph)
+            expected_levels, expected_max_level = calc_levels_with_recursion(graph)
+
+            self.assertEqual(expected_max_level, max_level)
+            self.assertEqual(list(expected_levels.items()), list(levels.items()))
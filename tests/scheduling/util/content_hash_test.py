@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from src.scheduling.model.cluster import create_single_machine_cluster
+from src.scheduling.util.content_hash import ContentHash, hash_graph, hash_scheduling
+from tests.scheduling.graph_utils import get_stencil_graph
+
+_HASH_IN_OTHER_PROCESS = '''
+from src.scheduling.util.content_hash import hash_graph, hash_scheduling
+from tests.scheduling.graph_utils import get_stencil_graph
+print(hash_graph(get_stencil_graph()), hash_scheduling({'a': (0, 'm1'), 'b': (10, 'm2')}))
+'''
+
+
+class ContentHashTest(unittest.TestCase):
+
+    def test_same_hash_in_other_processes(self):
+        expected = f"{hash_graph(get_stencil_graph())} {hash_scheduling({'a': (0, 'm1'), 'b': (10, 'm2')})}"
+
+        for hash_seed in ['1', '2']:
+            result = subprocess.run([sys.executable, '-c', _HASH_IN_OTHER_PROCESS], capture_output=True, text=True,
+                                    check=True, env=os.environ | {'PYTHONHASHSEED': hash_seed})
+            self.assertEqual(expected, result.stdout.strip())
+
+    def test_graph(self):
+        graph = get_stencil_graph()
+        self.assertEqual(hash_graph(graph), hash_graph(get_stencil_graph()))
+        self.assertEqual(hash_graph(graph), graph.analysis().content_hash())
+
+        graph = get_stencil_graph()
+        graph.get_task(5).runtime += 1
+        self.assertNotEqual(hash_graph(get_stencil_graph()), hash_graph(graph))
+
+        graph = get_stencil_graph()
+        graph.create_dependency(2, 11)
+        self.assertNotEqual(hash_graph(get_stencil_graph()), hash_graph(graph))
+
+    def test_scheduling_order_does_not_matter(self):
+        self.assertEqual(hash_scheduling({1: (0, 'm1'), 2: (5, 'm1')}), hash_scheduling({2: (5, 'm1'), 1: (0, 'm1')}))
+        self.assertNotEqual(hash_scheduling({1: (0, 'm1'), 2: (5, 'm1')}), hash_scheduling({1: (0, 'm1'), 2: (5, 'm2')}))
+
+    def test_cluster(self):
+        def cluster_hash(green_power, interval_length, cores):
+            cluster = create_single_machine_cluster(green_power, interval_length, cores=cores)
+            return ContentHash().add_cluster(cluster).hexdigest()
+
+        self.assertEqual(cluster_hash([0, 10, 20], 300, 100), cluster_hash([0, 10, 20], 300, 100))
+        self.assertNotEqual(cluster_hash([0, 10, 20], 300, 100), cluster_hash([0, 10, 21], 300, 100))
+        self.assertNotEqual(cluster_hash([0, 10, 20], 300, 100), cluster_hash([0, 10, 20], 60, 100))
+        self.assertNotEqual(cluster_hash([0, 10, 20], 300, 100), cluster_hash([0, 10, 20], 300, 50))
+
+    def test_values_are_kept_apart(self):
+        self.assertNotEqual(ContentHash().add_value('ab').add_value('c').hexdigest(),
+                            ContentHash().add_value('a').add_value('bc').hexdigest())
@@ -0,0 +1,61 @@
+import random
+import unittest
+
+from src.scheduling.model.task_graph import TaskGraph
+from src.scheduling.util.reachability import Reachability
+from tests.scheduling.graph_utils import get_multidependency_graph, get_stencil_graph
+
+
+def _get_all_successors(task):
+    successors = set()
+    for succ in task.successors:
+        successors.add(succ.id)
+        successors.update(_get_all_successors(succ))
+    return successors
+
+
+class ReachabilityTest(unittest.TestCase):
+
+    def test_stencil_graph(self):
+        graph = get_stencil_graph()
+        reachability = Reachability(graph)
+
+        self.assertTrue(reachability.is_descendant(graph.get_task(1), graph.get_task(11)))
+        self.assertTrue(reachability.is_descendant(graph.get_task(2), graph.get_task(9)))
+        self.assertFalse(reachability.is_descendant(graph.get_task(9), graph.get_task(2)))
+        self.assertFalse(reachability.is_independent(graph.get_task(9), graph.get_task(2)))
+
+        self.assertTrue(reachability.is_independent(graph.get_task(2), graph.get_task(3)))
+        self.assertEqual([5, 6, 7], [t.id for t in reachability.independent_tasks(graph.get_task(6))])
+
+    def test_multidependency_graph(self):
+        graph = get_multidependency_graph()
+        reachability = Reachability(graph)
+
+        self.assertEqual([6, 7, 8], [t.id for t in reachability.independent_tasks(graph.get_task(7))])
+        self.assertEqual([2, 3], [t.id for t in reachability.independent_tasks(graph.get_task(2))])
+        self.assertEqual([1], [t.id for t in reachability.independent_tasks(graph.get_task(1))])
+
+    def test_same_as_recursive_successors(self):
+        rand = random.Random(3)
+        graph = TaskGraph()
+        for i in range(60):
+            graph.add_new_task(i, 1, 1)
+            for j in rand.sample(range(i), min(i, 3)):
+                graph.create_dependency(j, i)
+
+        reachability = Reachability(graph)
+
+        for task in graph.list_of_tasks():
+            successors = _get_all_successors(task)
+            for other in graph.list_of_tasks():
+                self.assertEqual(other.id in successors, reachability.is_descendant(task, other))
+
+    def test_cycle(self):
+        graph = TaskGraph()
+        graph.add_new_task(1, 1, 1)
+        graph.add_new_task(2, 1, 1)
+        graph.create_dependency(1, 2)
+        graph.create_dependency(2, 1)
+
+        self.assertRaises(Exception, lambda: Reachability(graph))
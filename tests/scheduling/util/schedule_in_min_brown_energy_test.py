@@ -0,0 +1,54 @@
+import unittest
+
+from src.scheduling.algorithms.bounded_boundary_search.boundaries.single_machine.boundary import BoundaryCalculator
+from src.scheduling.energy.energy_usage_calculator import EnergyUsageCalculator
+from src.scheduling.model.machine import Machine
+from src.scheduling.model.task import Task
+from src.scheduling.model.task_graph import TaskGraph
+from src.scheduling.util.schedule_in_min_brown_energy import schedule_min_brown_energy_min_start, \
+    schedule_min_brown_energy_max_start, _collect_free_windows, _find_min_brown_energy_starts
+
+
+def _get_graph():
+    graph = TaskGraph()
+    task = graph.add_new_task(1, runtime=10, power=10)
+    graph.set_start_task(task.id)
+    return graph
+
+
+class ScheduleInMinBrownEnergyTest(unittest.TestCase):
+
+    def test_identical_windows_are_evaluated_once(self):
+        task = Task(1, runtime=10, power=10)
+        machines = [Machine(f'm{i}', cores=1) for i in range(5)]
+        machines[4].schedule_task(Task(2, runtime=5, power=1), 0)
+
+        machine_windows = _collect_free_windows(task, machines, 0, 40)
+        calculator = EnergyUsageCalculator([0, 5, 10, 0], 10)
+        min_brown_energy_starts = _find_min_brown_energy_starts(task, machine_windows, calculator, False)
+
+        self.assertEqual(5, len(machine_windows))
+        self.assertEqual({(0, 40): (20, 0), (5, 40): (20, 0)}, min_brown_energy_starts)
+
+    def test_first_machine_is_selected_on_tie(self):
+        graph = _get_graph()
+        task = graph.get_task(1)
+        machines = [Machine(f'm{i}', cores=1) for i in range(3)]
+
+        schedule = {}
+        calculator = EnergyUsageCalculator([0, 5, 10, 0], 10)
+        schedule_min_brown_energy_min_start(task, machines, schedule, 40, BoundaryCalculator(graph, 40, 0), calculator)
+
+        self.assertEqual((20, 'm0'), schedule[task.id])
+
+    def test_busy_machine_is_skipped(self):
+        graph = _get_graph()
+        task = graph.get_task(1)
+        machines = [Machine(f'm{i}', cores=1) for i in range(3)]
+        machines[0].schedule_task(Task(2, runtime=10, power=1), 20)
+
+        schedule = {}
+        calculator = EnergyUsageCalculator([0, 5, 10, 0], 10)
+        schedule_min_brown_energy_max_start(task, machines, schedule, 40, BoundaryCalculator(graph, 40, 0), calculator)
+
+        self.assertEqual((20, 'm1'), schedule[task.id])